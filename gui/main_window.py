@@ -12,7 +12,7 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 from PyQt6.QtGui import QIcon, QCloseEvent
 
-from gui.styles import DARK_THEME
+from gui.styles import apply_theme
 from gui.tabs.tab_general import TabGeneral
 from gui.tabs.tab_bands import TabBands
 from gui.tabs.tab_brightness import TabBrightness
@@ -23,7 +23,7 @@ from gui.tabs.tab_standby import TabStandby
 from gui.tabs.tab_spotify import TabSpotify
 from gui.tabs.tab_advanced import TabAdvanced
 from gui.tabs.tab_monitor import TabMonitor
-from config_manager import ConfigManager
+from config_manager import get_config_manager
 
 
 class MainWindow(QMainWindow):
@@ -31,16 +31,30 @@ class MainWindow(QMainWindow):
 
     closing = pyqtSignal()  # Emite quando a janela fecha (pra esconder, não sair)
 
+    # Abas na ordem de exibição: (atributo, título, classe, recebe app_ref)
+    _TAB_SPECS = (
+        ("tab_monitor", "📊 Monitor", TabMonitor, True),
+        ("tab_general", "⚙️ Geral", TabGeneral, False),
+        ("tab_bands", "🎵 Bandas", TabBands, False),
+        ("tab_brightness", "💡 Brilho", TabBrightness, False),
+        ("tab_colors", "🎨 Cores", TabColors, False),
+        ("tab_detection", "🥁 Detecção", TabDetection, False),
+        ("tab_effects", "✨ Efeitos", TabEffects, False),
+        ("tab_standby", "😴 Standby", TabStandby, False),
+        ("tab_spotify", "🎧 Spotify", TabSpotify, True),
+        ("tab_advanced", "🔧 Avançado", TabAdvanced, False),
+    )
+
     def __init__(self, app_ref=None, parent=None):
         super().__init__(parent)
         self.app_ref = app_ref
-        self.cfg = ConfigManager()
+        self.cfg = get_config_manager()
         self._close_to_tray = True
 
         self.setWindowTitle("Spotify RGB Sync - Configurações")
         self.setMinimumSize(700, 600)
         self.resize(850, 700)
-        self.setStyleSheet(DARK_THEME)
+        apply_theme()  # no QApplication, uma vez por processo
 
         # Try to set icon
         try:
@@ -58,28 +72,16 @@ class MainWindow(QMainWindow):
         self.tabs = QTabWidget()
         self.tabs.setTabPosition(QTabWidget.TabPosition.North)
 
-        # Create tabs
-        self.tab_general = TabGeneral()
-        self.tab_bands = TabBands()
-        self.tab_brightness = TabBrightness()
-        self.tab_colors = TabColors()
-        self.tab_detection = TabDetection()
-        self.tab_effects = TabEffects()
-        self.tab_standby = TabStandby()
-        self.tab_spotify = TabSpotify(app_ref=app_ref)
-        self.tab_advanced = TabAdvanced()
-        self.tab_monitor = TabMonitor(app_ref=app_ref)
-
-        self.tabs.addTab(self.tab_monitor, "📊 Monitor")
-        self.tabs.addTab(self.tab_general, "⚙️ Geral")
-        self.tabs.addTab(self.tab_bands, "🎵 Bandas")
-        self.tabs.addTab(self.tab_brightness, "💡 Brilho")
-        self.tabs.addTab(self.tab_colors, "🎨 Cores")
-        self.tabs.addTab(self.tab_detection, "🥁 Detecção")
-        self.tabs.addTab(self.tab_effects, "✨ Efeitos")
-        self.tabs.addTab(self.tab_standby, "😴 Standby")
-        self.tabs.addTab(self.tab_spotify, "🎧 Spotify")
-        self.tabs.addTab(self.tab_advanced, "🔧 Avançado")
+        # Abas criadas sob demanda: placeholder vazio até a 1ª vez que aparecem
+        self._tab_factories = {}
+        self._reloadable = []  # abas já criadas que têm reload_values
+        for idx, spec in enumerate(self._TAB_SPECS):
+            attr, title = spec[0], spec[1]
+            setattr(self, attr, None)
+            self.tabs.addTab(QWidget(), title)
+            self._tab_factories[idx] = spec
+        self.tabs.currentChanged.connect(self._materialize_tab)
+        self._materialize_tab(self.tabs.currentIndex())
 
         main_layout.addWidget(self.tabs)
 
@@ -118,10 +120,41 @@ class MainWindow(QMainWindow):
         self._status_label = QLabel("Pronto")
         self.status_bar.addPermanentWidget(self._status_label)
 
-        # Status update timer
-        self._status_timer = QTimer()
-        self._status_timer.timeout.connect(self._update_status_bar)
-        self._status_timer.start(1000)
+        # Mensagem temporária na tela: o status do app não sobrescreve
+        self._status_locked = False
+
+        # Um timer só pra apagar mensagens: a mais recente cancela a anterior
+        self._status_reset = QTimer(self)
+        self._status_reset.setSingleShot(True)
+        self._status_reset.timeout.connect(self._restore_status)
+
+        # Status vem por sinal do app_ref (só em mudanças), sem polling
+        self._last_status = None
+        status_changed = getattr(app_ref, 'statusChanged', None)
+        if status_changed is not None:
+            status_changed.connect(self._on_status)
+            if hasattr(app_ref, 'get_status'):
+                self._on_status(app_ref.get_status())
+
+    def _materialize_tab(self, idx: int):
+        """Troca o placeholder da aba idx pela aba real, se ainda não foi criada."""
+        spec = self._tab_factories.pop(idx, None)
+        if spec is None:
+            return
+        attr, title, tab_cls, wants_app_ref = spec
+        tab = tab_cls(app_ref=self.app_ref) if wants_app_ref else tab_cls()
+        setattr(self, attr, tab)
+        if hasattr(tab, 'reload_values'):
+            self._reloadable.append(tab)
+
+        # removeTab/insertTab mexem no índice atual: sem sinais até terminar
+        placeholder = self.tabs.widget(idx)
+        self.tabs.blockSignals(True)
+        self.tabs.removeTab(idx)
+        self.tabs.insertTab(idx, tab, title)
+        self.tabs.setCurrentIndex(idx)
+        self.tabs.blockSignals(False)
+        placeholder.deleteLater()
 
     def _save_config(self):
         try:
@@ -133,15 +166,9 @@ class MainWindow(QMainWindow):
 
     def _reload_all(self):
         """Recarrega todos os valores das abas a partir do ConfigManager."""
-        all_tabs = [
-            self.tab_general, self.tab_bands, self.tab_brightness,
-            self.tab_colors, self.tab_detection, self.tab_effects,
-            self.tab_standby, self.tab_spotify, self.tab_advanced,
-            self.tab_monitor,
-        ]
-        for tab in all_tabs:
-            if hasattr(tab, 'reload_values'):
-                tab.reload_values()
+        # Abas ainda não criadas leem o config atual quando forem abertas
+        for tab in self._reloadable:
+            tab.reload_values()
         self._show_status("🔄 Configurações recarregadas")
 
     def _reset_defaults(self):
@@ -159,15 +186,13 @@ class MainWindow(QMainWindow):
             self._show_status("↩️ Configurações restauradas para o padrão")
 
     def _export_preset(self):
-        from PyQt6.QtWidgets import QInputDialog
-
-        name, ok = QInputDialog.getText(
-            self, "Exportar Preset", "Nome do preset:"
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Exportar Preset", "preset.json", "JSON Files (*.json)"
         )
-        if ok and name:
+        if path:
             try:
-                path = self.cfg.export_preset(name)
-                self._show_status(f"📤 Preset '{name}' exportado para {path}")
+                path = self.cfg.export_preset_to_path(path)
+                self._show_status(f"📤 Preset exportado para {path}")
             except Exception as e:
                 QMessageBox.critical(self, "Erro", str(e))
 
@@ -184,33 +209,40 @@ class MainWindow(QMainWindow):
                 QMessageBox.critical(self, "Erro", str(e))
 
     def _show_status(self, msg: str, timeout: int = 5000):
+        self._status_locked = True
         self._status_label.setText(msg)
         if timeout:
-            QTimer.singleShot(timeout, lambda: self._status_label.setText("Pronto"))
+            self._status_reset.start(timeout)
+        else:
+            self._status_reset.stop()
 
-    def _update_status_bar(self):
-        if self.app_ref and hasattr(self.app_ref, 'get_status'):
-            try:
-                status = self.app_ref.get_status()
-                parts = []
-                if status.get('spotify_connected'):
-                    parts.append("🟢 Spotify")
-                else:
-                    parts.append("🔴 Spotify")
-                if status.get('openrgb_connected'):
-                    parts.append(f"🟢 OpenRGB ({status.get('led_count', 0)} LEDs)")
-                else:
-                    parts.append("🔴 OpenRGB")
-                if status.get('is_playing'):
-                    parts.append("▶")
-                else:
-                    parts.append("⏸")
-
-                current = self._status_label.text()
-                if not current.startswith(("✅", "🔄", "↩️", "📤", "📥")):
-                    self._status_label.setText("  |  ".join(parts))
-            except Exception:
-                pass
+    def _restore_status(self):
+        """Volta pro último status do app (ou "Pronto") depois de uma mensagem."""
+        self._status_locked = False
+        self._status_label.setText(self._last_status or "Pronto")
+
+    def _on_status(self, status: dict):
+        parts = []
+        if status.get('spotify_connected'):
+            parts.append("🟢 Spotify")
+        else:
+            parts.append("🔴 Spotify")
+        if status.get('openrgb_connected'):
+            parts.append(f"🟢 OpenRGB ({status.get('led_count', 0)} LEDs)")
+        else:
+            parts.append("🔴 OpenRGB")
+        if status.get('is_playing'):
+            parts.append("▶")
+        else:
+            parts.append("⏸")
+
+        text = "  |  ".join(parts)
+        if text == self._last_status:
+            return  # setText igual só invalidaria o layout
+        self._last_status = text
+
+        if not self._status_locked:
+            self._status_label.setText(text)
 
     def set_close_to_tray(self, enabled: bool):
         self._close_to_tray = enabled
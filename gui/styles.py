@@ -4,7 +4,9 @@ Tema escuro para a GUI do Spotify RGB Sync.
 Inspirado no visual do Spotify (escuro com verde).
 """
 
-DARK_THEME = """
+import re
+
+_DARK_THEME_SRC = """
 QMainWindow {
     background-color: #121212;
 }
@@ -292,4 +294,39 @@ QToolTip {
     padding: 6px;
     font-size: 12px;
 }
-"""
\ No newline at end of file
+"""
+
+
+def _minify(qss: str) -> str:
+    """
+    Tira comentários, quebras e espaços em volta de { } ; , — menos texto
+    pro parser de QSS. Espaço entre seletores (descendente) e dentro de
+    strings tipo 'Segoe UI' fica.
+    """
+    qss = re.sub(r'/\*.*?\*/', '', qss, flags=re.S)
+    qss = re.sub(r'\s+', ' ', qss)
+    return re.sub(r'\s*([{};,])\s*', r'\1', qss).strip()
+
+
+DARK_THEME = _minify(_DARK_THEME_SRC)
+
+_theme_applied = False
+
+
+def apply_theme(app=None):
+    """
+    Aplica DARK_THEME uma vez no QApplication: o QSS é parseado uma única
+    vez e todas as janelas herdam. Chamadas seguintes não fazem nada.
+    """
+    global _theme_applied
+    if _theme_applied:
+        return
+    if app is None:
+        from PyQt6.QtWidgets import QApplication
+        app = QApplication.instance()
+        if app is None:
+            return
+    # Re-setar o mesmo QSS reparsearia e repolira tudo à toa
+    if app.styleSheet() != DARK_THEME:
+        app.setStyleSheet(DARK_THEME)
+    _theme_applied = True
@@ -7,18 +7,36 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt
 
-from gui.widgets import LabeledIntSlider, LabeledSlider, Separator
-from config_manager import ConfigManager
+from gui.widgets import LabeledIntSlider, LabeledSlider, Separator, reload_widgets, make_apply_timer
+from config_manager import get_config_manager
 
 
 class TabAdvanced(QScrollArea):
+    # reload_values: (widget, key, setter)
+    _RELOAD = (
+        ("w_host", "OPENRGB_HOST", "setText"),
+        ("w_port", "OPENRGB_PORT", "setValue"),
+        ("w_name", "OPENRGB_NAME", "setText"),
+        ("w_skip_start", "LED_SKIP_START", "setValue"),
+        ("w_skip_end", "LED_SKIP_END", "setValue"),
+        ("w_quant_interval", "QUANTIZED_UPDATE_INTERVAL", "setValue"),
+        ("w_quant_levels", "QUANTIZED_LEVELS", "setValue"),
+    )
+    _RELOAD_KEYS = tuple(key for _, key, _ in _RELOAD)
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.cfg = ConfigManager()
+        self.cfg = get_config_manager()
+        # Todas as keys da aba numa leitura só (as mesmas do reload)
+        get = dict(zip(self._RELOAD_KEYS, self.cfg.get_many(self._RELOAD_KEYS))).get
+
+        self._apply_timer = make_apply_timer(self, self.cfg.apply_to_config_module)
+
         self.setWidgetResizable(True)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
 
         container = QWidget()
+        container.setUpdatesEnabled(False)  # um layout só, no fim da montagem
         layout = QVBoxLayout(container)
         layout.setSpacing(12)
 
@@ -28,7 +46,7 @@ class TabAdvanced(QScrollArea):
 
         row_host = QHBoxLayout()
         row_host.addWidget(QLabel("Host:"))
-        self.w_host = QLineEdit(self.cfg.get("OPENRGB_HOST"))
+        self.w_host = QLineEdit(get("OPENRGB_HOST"))
         self.w_host.setFixedWidth(200)
         self.w_host.editingFinished.connect(
             lambda: self._set("OPENRGB_HOST", self.w_host.text())
@@ -38,16 +56,16 @@ class TabAdvanced(QScrollArea):
         rl.addLayout(row_host)
 
         self.w_port = LabeledIntSlider(
-            "Porta", 1024, 65535, self.cfg.get("OPENRGB_PORT"),
+            "Porta", 1024, 65535, get("OPENRGB_PORT"),
         )
-        self.w_port.valueChanged.connect(
+        self.w_port.committed.connect(
             lambda v: self._set("OPENRGB_PORT", v)
         )
         rl.addWidget(self.w_port)
 
         row_name = QHBoxLayout()
         row_name.addWidget(QLabel("Nome:"))
-        self.w_name = QLineEdit(self.cfg.get("OPENRGB_NAME"))
+        self.w_name = QLineEdit(get("OPENRGB_NAME"))
         self.w_name.setFixedWidth(200)
         self.w_name.editingFinished.connect(
             lambda: self._set("OPENRGB_NAME", self.w_name.text())
@@ -63,18 +81,18 @@ class TabAdvanced(QScrollArea):
         ll = QVBoxLayout(grp_led)
 
         self.w_skip_start = LabeledIntSlider(
-            "Pular no Início", 0, 30, self.cfg.get("LED_SKIP_START"), " LEDs",
+            "Pular no Início", 0, 30, get("LED_SKIP_START"), " LEDs",
             "LEDs invisíveis no começo da fita (ex: backplate)",
         )
-        self.w_skip_start.valueChanged.connect(
+        self.w_skip_start.committed.connect(
             lambda v: self._set("LED_SKIP_START", v)
         )
         ll.addWidget(self.w_skip_start)
 
         self.w_skip_end = LabeledIntSlider(
-            "Pular no Final", 0, 30, self.cfg.get("LED_SKIP_END"), " LEDs",
+            "Pular no Final", 0, 30, get("LED_SKIP_END"), " LEDs",
         )
-        self.w_skip_end.valueChanged.connect(
+        self.w_skip_end.committed.connect(
             lambda v: self._set("LED_SKIP_END", v)
         )
         ll.addWidget(self.w_skip_end)
@@ -93,19 +111,19 @@ class TabAdvanced(QScrollArea):
         ql = QVBoxLayout(grp_quant)
 
         self.w_quant_interval = LabeledSlider(
-            "Update Interval", 0.05, 1.0, 0.05, self.cfg.get("QUANTIZED_UPDATE_INTERVAL"), "s",
+            "Update Interval", 0.05, 1.0, 0.05, get("QUANTIZED_UPDATE_INTERVAL"), "s",
             "Intervalo entre updates dos LEDs (menor = mais fluido, mais CPU)",
         )
-        self.w_quant_interval.valueChanged.connect(
+        self.w_quant_interval.committed.connect(
             lambda v: self._set("QUANTIZED_UPDATE_INTERVAL", v)
         )
         ql.addWidget(self.w_quant_interval)
 
         self.w_quant_levels = LabeledIntSlider(
-            "Níveis", 2, 20, self.cfg.get("QUANTIZED_LEVELS"),
+            "Níveis", 2, 20, get("QUANTIZED_LEVELS"),
             description="Número de níveis de quantização",
         )
-        self.w_quant_levels.valueChanged.connect(
+        self.w_quant_levels.committed.connect(
             lambda v: self._set("QUANTIZED_LEVELS", v)
         )
         ql.addWidget(self.w_quant_levels)
@@ -113,17 +131,12 @@ class TabAdvanced(QScrollArea):
         layout.addWidget(grp_quant)
 
         layout.addStretch()
+        container.setUpdatesEnabled(True)
         self.setWidget(container)
 
     def _set(self, key, val):
         self.cfg.set(key, val)
-        self.cfg.apply_to_config_module()
+        self._apply_timer.start()
 
     def reload_values(self):
-        self.w_host.setText(self.cfg.get("OPENRGB_HOST"))
-        self.w_port.setValue(self.cfg.get("OPENRGB_PORT"))
-        self.w_name.setText(self.cfg.get("OPENRGB_NAME"))
-        self.w_skip_start.setValue(self.cfg.get("LED_SKIP_START"))
-        self.w_skip_end.setValue(self.cfg.get("LED_SKIP_END"))
-        self.w_quant_interval.setValue(self.cfg.get("QUANTIZED_UPDATE_INTERVAL"))
-        self.w_quant_levels.setValue(self.cfg.get("QUANTIZED_LEVELS"))
\ No newline at end of file
+        reload_widgets(self, self._RELOAD, self.cfg.get_many(self._RELOAD_KEYS))
\ No newline at end of file
@@ -6,11 +6,12 @@ from PyQt6.QtWidgets import (
     QScrollArea, QPushButton, QFrame,
 )
 from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QPainter, QBrush, QColor, QPen, QFont, QStaticText
 
 from gui.widgets import (
-    LabeledSlider, LabeledCombo, LabeledCheck, Separator,
+    LabeledSlider, LabeledCombo, LabeledCheck, Separator, reload_widgets, make_apply_timer,
 )
-from config_manager import ConfigManager
+from config_manager import get_config_manager
 
 
 class ZonePreview(QWidget):
@@ -20,54 +21,107 @@ class ZonePreview(QWidget):
         super().__init__(parent)
         self.setFixedHeight(50)
         self._zones = (0.36, 0.32, 0.32)
+        self._total = sum(self._zones)
         self._colors = [(255, 100, 100), (100, 100, 255), (100, 255, 100)]
         self._labels = ["Perc", "Baixo", "Melodia"]
 
+        # Pincéis/canetas/fonte fixos: o paint não aloca nada
+        self._brushes = [QBrush(QColor(r, g, b, 180)) for r, g, b in self._colors]
+        self._pens = [QPen(QColor(r, g, b), 1) for r, g, b in self._colors]
+        self._text_pen = QPen(QColor(255, 255, 255), 1)
+        self._font = QFont(self.font())
+        self._font.setPointSize(9)
+        self._font.setBold(True)
+
+        # Textos já diagramados, por string ("Perc 36%"): 3 labels x 1% de passo
+        self._text_cache = {}
+
     def set_zones(self, perc, bass, melody):
-        self._zones = (perc, bass, melody)
+        zones = (perc, bass, melody)
+        if zones == self._zones:
+            return
+        self._zones = zones
+        self._total = sum(zones) or 1.0
         self.update()
 
     def paintEvent(self, event):
-        from PyQt6.QtGui import QPainter, QBrush, QColor, QPen
-
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setFont(self._font)
 
         w = self.width() - 4
         h = self.height() - 4
         x = 2
 
-        total = sum(self._zones)
-        for i, (zone_pct, color, label) in enumerate(
-            zip(self._zones, self._colors, self._labels)
+        total = self._total
+        for zone_pct, brush, pen, label in zip(
+            self._zones, self._brushes, self._pens, self._labels
         ):
             zone_w = int(w * zone_pct / total)
-            r, g, b = color
-            painter.setBrush(QBrush(QColor(r, g, b, 180)))
-            painter.setPen(QPen(QColor(r, g, b), 1))
+            painter.setBrush(brush)
+            painter.setPen(pen)
             painter.drawRoundedRect(x, 2, zone_w, h, 4, 4)
 
-            painter.setPen(QPen(QColor(255, 255, 255), 1))
-            font = painter.font()
-            font.setPointSize(9)
-            font.setBold(True)
-            painter.setFont(font)
-            pct_text = f"{label} {zone_pct * 100:.0f}%"
-            painter.drawText(x, 2, zone_w, h, Qt.AlignmentFlag.AlignCenter, pct_text)
+            painter.setPen(self._text_pen)
+            text = self._static_text(f"{label} {zone_pct * 100:.0f}%", painter)
+            size = text.size()
+            painter.drawStaticText(
+                x + int(zone_w - size.width()) // 2,
+                2 + int(h - size.height()) // 2,
+                text,
+            )
 
             x += zone_w + 2
 
         painter.end()
 
+    def _static_text(self, key: str, painter) -> QStaticText:
+        text = self._text_cache.get(key)
+        if text is None:
+            if len(self._text_cache) >= 64:
+                self._text_cache.clear()
+            text = QStaticText(key)
+            text.prepare(painter.transform(), self._font)
+            self._text_cache[key] = text
+        return text
+
 
 class TabBands(QScrollArea):
+    # reload_values: (widget, key, setter)
+    _RELOAD = (
+        ("w_zone_perc", "BAND_ZONE_PERCUSSION", "setValue"),
+        ("w_zone_bass", "BAND_ZONE_BASS", "setValue"),
+        ("w_zone_melody", "BAND_ZONE_MELODY", "setValue"),
+        ("w_color_scheme", "BAND_COLOR_SCHEME", "setCurrentValue"),
+        ("w_boost_perc", "BAND_BOOST_PERCUSSION", "setValue"),
+        ("w_boost_bass", "BAND_BOOST_BASS", "setValue"),
+        ("w_boost_melody", "BAND_BOOST_MELODY", "setValue"),
+        ("w_exp_perc", "BAND_EXPANSION_PERCUSSION", "setValue"),
+        ("w_exp_bass", "BAND_EXPANSION_BASS", "setValue"),
+        ("w_exp_melody", "BAND_EXPANSION_MELODY", "setValue"),
+        ("w_attack", "BAND_ATTACK", "setValue"),
+        ("w_decay", "BAND_DECAY", "setValue"),
+        ("w_beat_flash", "BAND_BEAT_FLASH", "setValue"),
+        ("w_bg_brightness", "BAND_BG_BRIGHTNESS", "setValue"),
+        ("w_comp_enabled", "BAND_COMPRESSION_ENABLED", "setChecked"),
+        ("w_comp_threshold", "BAND_COMPRESSION_THRESHOLD", "setValue"),
+        ("w_comp_ratio", "BAND_COMPRESSION_RATIO", "setValue"),
+    )
+    _RELOAD_KEYS = tuple(key for _, key, _ in _RELOAD)
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.cfg = ConfigManager()
+        self.cfg = get_config_manager()
+        # Todas as keys da aba numa leitura só (as mesmas do reload)
+        get = dict(zip(self._RELOAD_KEYS, self.cfg.get_many(self._RELOAD_KEYS))).get
+
+        self._apply_timer = make_apply_timer(self, self.cfg.apply_to_config_module)
+
         self.setWidgetResizable(True)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
 
         container = QWidget()
+        container.setUpdatesEnabled(False)  # um layout só, no fim da montagem
         layout = QVBoxLayout(container)
         layout.setSpacing(12)
 
@@ -80,26 +134,29 @@ class TabBands(QScrollArea):
 
         self.w_zone_perc = LabeledSlider(
             "🥁 Percussão", 0.1, 0.6, 0.01,
-            self.cfg.get("BAND_ZONE_PERCUSSION"), suffix="%",
+            get("BAND_ZONE_PERCUSSION"), suffix="%",
             description="Porcentagem dos LEDs para percussão",
         )
-        self.w_zone_perc.valueChanged.connect(self._on_zone_change)
+        self.w_zone_perc.valueChanged.connect(self._update_zone_preview)
+        self.w_zone_perc.committed.connect(self._on_zone_change)
         zl.addWidget(self.w_zone_perc)
 
         self.w_zone_bass = LabeledSlider(
             "🎸 Baixo", 0.1, 0.6, 0.01,
-            self.cfg.get("BAND_ZONE_BASS"), suffix="%",
+            get("BAND_ZONE_BASS"), suffix="%",
             description="Porcentagem dos LEDs para baixo",
         )
-        self.w_zone_bass.valueChanged.connect(self._on_zone_change)
+        self.w_zone_bass.valueChanged.connect(self._update_zone_preview)
+        self.w_zone_bass.committed.connect(self._on_zone_change)
         zl.addWidget(self.w_zone_bass)
 
         self.w_zone_melody = LabeledSlider(
             "🎹 Melodia", 0.1, 0.6, 0.01,
-            self.cfg.get("BAND_ZONE_MELODY"), suffix="%",
+            get("BAND_ZONE_MELODY"), suffix="%",
             description="Porcentagem dos LEDs para melodia",
         )
-        self.w_zone_melody.valueChanged.connect(self._on_zone_change)
+        self.w_zone_melody.valueChanged.connect(self._update_zone_preview)
+        self.w_zone_melody.committed.connect(self._on_zone_change)
         zl.addWidget(self.w_zone_melody)
 
         layout.addWidget(grp_zones)
@@ -111,7 +168,7 @@ class TabBands(QScrollArea):
         self.w_color_scheme = LabeledCombo(
             "Esquema",
             ["album_colors", "fixed_hue", "complementary", "analogous"],
-            self.cfg.get("BAND_COLOR_SCHEME"),
+            get("BAND_COLOR_SCHEME"),
             "album_colors = extrai 3 cores do álbum",
         )
         self.w_color_scheme.currentTextChanged.connect(
@@ -128,18 +185,18 @@ class TabBands(QScrollArea):
         # Percussion
         bl.addWidget(QLabel("🥁 Percussão"))
         self.w_boost_perc = LabeledSlider(
-            "Boost", 0.5, 4.0, 0.1, self.cfg.get("BAND_BOOST_PERCUSSION"), "x"
+            "Boost", 0.5, 4.0, 0.1, get("BAND_BOOST_PERCUSSION"), "x"
         )
-        self.w_boost_perc.valueChanged.connect(
+        self.w_boost_perc.committed.connect(
             lambda v: self._set("BAND_BOOST_PERCUSSION", v)
         )
         bl.addWidget(self.w_boost_perc)
 
         self.w_exp_perc = LabeledSlider(
-            "Expansão", 1.0, 4.0, 0.1, self.cfg.get("BAND_EXPANSION_PERCUSSION"), "x",
+            "Expansão", 1.0, 4.0, 0.1, get("BAND_EXPANSION_PERCUSSION"), "x",
             "Aumenta contraste entre volumes baixos e altos",
         )
-        self.w_exp_perc.valueChanged.connect(
+        self.w_exp_perc.committed.connect(
             lambda v: self._set("BAND_EXPANSION_PERCUSSION", v)
         )
         bl.addWidget(self.w_exp_perc)
@@ -149,17 +206,17 @@ class TabBands(QScrollArea):
         # Bass
         bl.addWidget(QLabel("🎸 Baixo"))
         self.w_boost_bass = LabeledSlider(
-            "Boost", 0.5, 4.0, 0.1, self.cfg.get("BAND_BOOST_BASS"), "x"
+            "Boost", 0.5, 4.0, 0.1, get("BAND_BOOST_BASS"), "x"
         )
-        self.w_boost_bass.valueChanged.connect(
+        self.w_boost_bass.committed.connect(
             lambda v: self._set("BAND_BOOST_BASS", v)
         )
         bl.addWidget(self.w_boost_bass)
 
         self.w_exp_bass = LabeledSlider(
-            "Expansão", 1.0, 4.0, 0.1, self.cfg.get("BAND_EXPANSION_BASS"), "x"
+            "Expansão", 1.0, 4.0, 0.1, get("BAND_EXPANSION_BASS"), "x"
         )
-        self.w_exp_bass.valueChanged.connect(
+        self.w_exp_bass.committed.connect(
             lambda v: self._set("BAND_EXPANSION_BASS", v)
         )
         bl.addWidget(self.w_exp_bass)
@@ -169,17 +226,17 @@ class TabBands(QScrollArea):
         # Melody
         bl.addWidget(QLabel("🎹 Melodia"))
         self.w_boost_melody = LabeledSlider(
-            "Boost", 0.5, 4.0, 0.1, self.cfg.get("BAND_BOOST_MELODY"), "x"
+            "Boost", 0.5, 4.0, 0.1, get("BAND_BOOST_MELODY"), "x"
         )
-        self.w_boost_melody.valueChanged.connect(
+        self.w_boost_melody.committed.connect(
             lambda v: self._set("BAND_BOOST_MELODY", v)
         )
         bl.addWidget(self.w_boost_melody)
 
         self.w_exp_melody = LabeledSlider(
-            "Expansão", 1.0, 4.0, 0.1, self.cfg.get("BAND_EXPANSION_MELODY"), "x"
+            "Expansão", 1.0, 4.0, 0.1, get("BAND_EXPANSION_MELODY"), "x"
         )
-        self.w_exp_melody.valueChanged.connect(
+        self.w_exp_melody.committed.connect(
             lambda v: self._set("BAND_EXPANSION_MELODY", v)
         )
         bl.addWidget(self.w_exp_melody)
@@ -191,19 +248,19 @@ class TabBands(QScrollArea):
         sl = QVBoxLayout(grp_smooth)
 
         self.w_attack = LabeledSlider(
-            "Attack", 0.05, 1.0, 0.01, self.cfg.get("BAND_ATTACK"),
+            "Attack", 0.05, 1.0, 0.01, get("BAND_ATTACK"),
             description="Velocidade de subida (maior = mais rápido)",
         )
-        self.w_attack.valueChanged.connect(
+        self.w_attack.committed.connect(
             lambda v: self._set("BAND_ATTACK", v)
         )
         sl.addWidget(self.w_attack)
 
         self.w_decay = LabeledSlider(
-            "Decay", 0.01, 0.5, 0.01, self.cfg.get("BAND_DECAY"),
+            "Decay", 0.01, 0.5, 0.01, get("BAND_DECAY"),
             description="Velocidade de descida (menor = mais lento)",
         )
-        self.w_decay.valueChanged.connect(
+        self.w_decay.committed.connect(
             lambda v: self._set("BAND_DECAY", v)
         )
         sl.addWidget(self.w_decay)
@@ -211,19 +268,19 @@ class TabBands(QScrollArea):
         sl.addWidget(Separator())
 
         self.w_beat_flash = LabeledSlider(
-            "Beat Flash", 0.0, 1.0, 0.05, self.cfg.get("BAND_BEAT_FLASH"),
+            "Beat Flash", 0.0, 1.0, 0.05, get("BAND_BEAT_FLASH"),
             description="Intensidade do flash no beat",
         )
-        self.w_beat_flash.valueChanged.connect(
+        self.w_beat_flash.committed.connect(
             lambda v: self._set("BAND_BEAT_FLASH", v)
         )
         sl.addWidget(self.w_beat_flash)
 
         self.w_bg_brightness = LabeledSlider(
-            "Brilho de Fundo", 0.0, 0.2, 0.005, self.cfg.get("BAND_BG_BRIGHTNESS"),
+            "Brilho de Fundo", 0.0, 0.2, 0.005, get("BAND_BG_BRIGHTNESS"),
             description="Brilho mínimo quando a banda está silenciosa",
         )
-        self.w_bg_brightness.valueChanged.connect(
+        self.w_bg_brightness.committed.connect(
             lambda v: self._set("BAND_BG_BRIGHTNESS", v)
         )
         sl.addWidget(self.w_bg_brightness)
@@ -236,7 +293,7 @@ class TabBands(QScrollArea):
 
         self.w_comp_enabled = LabeledCheck(
             "Compressão Ativa",
-            self.cfg.get("BAND_COMPRESSION_ENABLED"),
+            get("BAND_COMPRESSION_ENABLED"),
             "Limita volumes muito altos pra manter contraste",
         )
         self.w_comp_enabled.toggled.connect(
@@ -245,19 +302,19 @@ class TabBands(QScrollArea):
         cpl.addWidget(self.w_comp_enabled)
 
         self.w_comp_threshold = LabeledSlider(
-            "Threshold", 0.3, 1.0, 0.05, self.cfg.get("BAND_COMPRESSION_THRESHOLD"),
+            "Threshold", 0.3, 1.0, 0.05, get("BAND_COMPRESSION_THRESHOLD"),
             description="Acima desse nível, começa a comprimir",
         )
-        self.w_comp_threshold.valueChanged.connect(
+        self.w_comp_threshold.committed.connect(
             lambda v: self._set("BAND_COMPRESSION_THRESHOLD", v)
         )
         cpl.addWidget(self.w_comp_threshold)
 
         self.w_comp_ratio = LabeledSlider(
-            "Ratio", 1.0, 10.0, 0.5, self.cfg.get("BAND_COMPRESSION_RATIO"), ":1",
+            "Ratio", 1.0, 10.0, 0.5, get("BAND_COMPRESSION_RATIO"), ":1",
             description="Taxa de compressão (maior = mais comprimido)",
         )
-        self.w_comp_ratio.valueChanged.connect(
+        self.w_comp_ratio.committed.connect(
             lambda v: self._set("BAND_COMPRESSION_RATIO", v)
         )
         cpl.addWidget(self.w_comp_ratio)
@@ -265,17 +322,22 @@ class TabBands(QScrollArea):
         layout.addWidget(grp_comp)
 
         layout.addStretch()
+        container.setUpdatesEnabled(True)
         self.setWidget(container)
 
         self._update_zone_preview()
 
     def _on_zone_change(self, _=None):
-        self._set("BAND_ZONE_PERCUSSION", self.w_zone_perc.value())
-        self._set("BAND_ZONE_BASS", self.w_zone_bass.value())
-        self._set("BAND_ZONE_MELODY", self.w_zone_melody.value())
+        # As três zonas numa escrita só (uma notificação, um apply)
+        self.cfg.set_many({
+            "BAND_ZONE_PERCUSSION": self.w_zone_perc.value(),
+            "BAND_ZONE_BASS": self.w_zone_bass.value(),
+            "BAND_ZONE_MELODY": self.w_zone_melody.value(),
+        })
+        self._apply_timer.start()
         self._update_zone_preview()
 
-    def _update_zone_preview(self):
+    def _update_zone_preview(self, _=None):
         self.zone_preview.set_zones(
             self.w_zone_perc.value(),
             self.w_zone_bass.value(),
@@ -284,24 +346,8 @@ class TabBands(QScrollArea):
 
     def _set(self, key, val):
         self.cfg.set(key, val)
-        self.cfg.apply_to_config_module()
+        self._apply_timer.start()
 
     def reload_values(self):
-        self.w_zone_perc.setValue(self.cfg.get("BAND_ZONE_PERCUSSION"))
-        self.w_zone_bass.setValue(self.cfg.get("BAND_ZONE_BASS"))
-        self.w_zone_melody.setValue(self.cfg.get("BAND_ZONE_MELODY"))
-        self.w_color_scheme.setCurrentText(self.cfg.get("BAND_COLOR_SCHEME"))
-        self.w_boost_perc.setValue(self.cfg.get("BAND_BOOST_PERCUSSION"))
-        self.w_boost_bass.setValue(self.cfg.get("BAND_BOOST_BASS"))
-        self.w_boost_melody.setValue(self.cfg.get("BAND_BOOST_MELODY"))
-        self.w_exp_perc.setValue(self.cfg.get("BAND_EXPANSION_PERCUSSION"))
-        self.w_exp_bass.setValue(self.cfg.get("BAND_EXPANSION_BASS"))
-        self.w_exp_melody.setValue(self.cfg.get("BAND_EXPANSION_MELODY"))
-        self.w_attack.setValue(self.cfg.get("BAND_ATTACK"))
-        self.w_decay.setValue(self.cfg.get("BAND_DECAY"))
-        self.w_beat_flash.setValue(self.cfg.get("BAND_BEAT_FLASH"))
-        self.w_bg_brightness.setValue(self.cfg.get("BAND_BG_BRIGHTNESS"))
-        self.w_comp_enabled.setChecked(self.cfg.get("BAND_COMPRESSION_ENABLED"))
-        self.w_comp_threshold.setValue(self.cfg.get("BAND_COMPRESSION_THRESHOLD"))
-        self.w_comp_ratio.setValue(self.cfg.get("BAND_COMPRESSION_RATIO"))
+        reload_widgets(self, self._RELOAD, self.cfg.get_many(self._RELOAD_KEYS))
         self._update_zone_preview()
\ No newline at end of file
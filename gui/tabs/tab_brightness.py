@@ -1,23 +1,71 @@
 # gui/tabs/tab_brightness.py
 """Aba de configuração de brilho e mapeamento."""
 
+from functools import partial
+
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QGroupBox, QScrollArea,
 )
 from PyQt6.QtCore import Qt
 
-from gui.widgets import LabeledSlider, BrightnessMapEditor, Separator
-from config_manager import ConfigManager
+from gui.widgets import BrightnessMapEditor, add_sliders, reload_widgets, make_apply_timer
+from config_manager import get_config_manager
 
 
 class TabBrightness(QScrollArea):
+    # reload_values: (widget, key, setter)
+    _RELOAD = (
+        ("w_brightness_map", "BRIGHTNESS_MAP", "set_map"),
+        ("w_floor", "BRIGHTNESS_FLOOR", "setValue"),
+        ("w_base", "BRIGHTNESS_BASE", "setValue"),
+        ("w_kick", "BRIGHTNESS_KICK", "setValue"),
+        ("w_snare", "BRIGHTNESS_SNARE", "setValue"),
+        ("w_peak", "BRIGHTNESS_PEAK", "setValue"),
+        ("w_shift_kick", "COLOR_SHIFT_KICK", "setValue"),
+        ("w_shift_snare", "COLOR_SHIFT_SNARE", "setValue"),
+        ("w_shift_peak", "COLOR_SHIFT_PEAK", "setValue"),
+    )
+    _RELOAD_KEYS = tuple(key for _, key, _ in _RELOAD)
+
+    # add_sliders: (attr, key, label, min, max, step, suffix, description)
+    _LEVEL_SLIDERS = (
+        ("w_floor", "BRIGHTNESS_FLOOR", "Floor (Mínimo)", 0.0, 0.3, 0.01, "",
+         "Brilho mínimo absoluto (nunca abaixo disso)"),
+        ("w_base", "BRIGHTNESS_BASE", "Base (Normal)", 0.1, 1.0, 0.05, "",
+         "Brilho padrão durante a música"),
+        None,
+        ("w_kick", "BRIGHTNESS_KICK", "Kick", 0.3, 1.0, 0.05, "",
+         "Brilho no hit de kick/bumbo"),
+        ("w_snare", "BRIGHTNESS_SNARE", "Snare", 0.3, 1.0, 0.05, "",
+         "Brilho no hit de snare/caixa"),
+        ("w_peak", "BRIGHTNESS_PEAK", "Peak", 0.3, 1.0, 0.05, "",
+         "Brilho em picos de energia"),
+    )
+    _SHIFT_SLIDERS = (
+        ("w_shift_kick", "COLOR_SHIFT_KICK", "Shift no Kick", 0.0, 0.5, 0.01, "",
+         "Quanto a cor muda no kick"),
+        ("w_shift_snare", "COLOR_SHIFT_SNARE", "Shift no Snare", 0.0, 0.5, 0.01, "", ""),
+        ("w_shift_peak", "COLOR_SHIFT_PEAK", "Shift no Peak", 0.0, 0.5, 0.01, "", ""),
+    )
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.cfg = ConfigManager()
+        self.cfg = get_config_manager()
+        # Todas as keys da aba numa leitura só (as mesmas do reload)
+        get = dict(zip(self._RELOAD_KEYS, self.cfg.get_many(self._RELOAD_KEYS))).get
+
+        self._apply_timer = make_apply_timer(self, self.cfg.apply_to_config_module)
+
         self.setWidgetResizable(True)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        # O container cobre o viewport todo: nada pra pintar por baixo, e
+        # resize só repinta a faixa nova
+        viewport = self.viewport()
+        viewport.setAutoFillBackground(False)
+        viewport.setAttribute(Qt.WidgetAttribute.WA_StaticContents, True)
 
         container = QWidget()
+        container.setUpdatesEnabled(False)  # um layout só, no fim da montagem
         layout = QVBoxLayout(container)
         layout.setSpacing(12)
 
@@ -26,10 +74,10 @@ class TabBrightness(QScrollArea):
         ml = QVBoxLayout(grp_map)
 
         self.w_brightness_map = BrightnessMapEditor(
-            self.cfg.get("BRIGHTNESS_MAP")
+            get("BRIGHTNESS_MAP")
         )
-        self.w_brightness_map.mapChanged.connect(
-            lambda m: self._set("BRIGHTNESS_MAP", m)
+        self.w_brightness_map.committed.connect(
+            partial(self._set, "BRIGHTNESS_MAP"), Qt.ConnectionType.DirectConnection
         )
         ml.addWidget(self.w_brightness_map)
 
@@ -37,102 +85,21 @@ class TabBrightness(QScrollArea):
 
         # ── Brightness Levels ──
         grp_levels = QGroupBox("Níveis de Brilho por Evento")
-        ll = QVBoxLayout(grp_levels)
-
-        self.w_floor = LabeledSlider(
-            "Floor (Mínimo)", 0.0, 0.3, 0.01, self.cfg.get("BRIGHTNESS_FLOOR"),
-            description="Brilho mínimo absoluto (nunca abaixo disso)",
-        )
-        self.w_floor.valueChanged.connect(
-            lambda v: self._set("BRIGHTNESS_FLOOR", v)
-        )
-        ll.addWidget(self.w_floor)
-
-        self.w_base = LabeledSlider(
-            "Base (Normal)", 0.1, 1.0, 0.05, self.cfg.get("BRIGHTNESS_BASE"),
-            description="Brilho padrão durante a música",
-        )
-        self.w_base.valueChanged.connect(
-            lambda v: self._set("BRIGHTNESS_BASE", v)
-        )
-        ll.addWidget(self.w_base)
-
-        ll.addWidget(Separator())
-
-        self.w_kick = LabeledSlider(
-            "Kick", 0.3, 1.0, 0.05, self.cfg.get("BRIGHTNESS_KICK"),
-            description="Brilho no hit de kick/bumbo",
-        )
-        self.w_kick.valueChanged.connect(
-            lambda v: self._set("BRIGHTNESS_KICK", v)
-        )
-        ll.addWidget(self.w_kick)
-
-        self.w_snare = LabeledSlider(
-            "Snare", 0.3, 1.0, 0.05, self.cfg.get("BRIGHTNESS_SNARE"),
-            description="Brilho no hit de snare/caixa",
-        )
-        self.w_snare.valueChanged.connect(
-            lambda v: self._set("BRIGHTNESS_SNARE", v)
-        )
-        ll.addWidget(self.w_snare)
-
-        self.w_peak = LabeledSlider(
-            "Peak", 0.3, 1.0, 0.05, self.cfg.get("BRIGHTNESS_PEAK"),
-            description="Brilho em picos de energia",
-        )
-        self.w_peak.valueChanged.connect(
-            lambda v: self._set("BRIGHTNESS_PEAK", v)
-        )
-        ll.addWidget(self.w_peak)
-
+        add_sliders(self, QVBoxLayout(grp_levels), self._LEVEL_SLIDERS, get, self._set)
         layout.addWidget(grp_levels)
 
         # ── Color Shift on Events ──
         grp_shift = QGroupBox("Color Shift em Eventos")
-        sl = QVBoxLayout(grp_shift)
-
-        self.w_shift_kick = LabeledSlider(
-            "Shift no Kick", 0.0, 0.5, 0.01, self.cfg.get("COLOR_SHIFT_KICK"),
-            description="Quanto a cor muda no kick",
-        )
-        self.w_shift_kick.valueChanged.connect(
-            lambda v: self._set("COLOR_SHIFT_KICK", v)
-        )
-        sl.addWidget(self.w_shift_kick)
-
-        self.w_shift_snare = LabeledSlider(
-            "Shift no Snare", 0.0, 0.5, 0.01, self.cfg.get("COLOR_SHIFT_SNARE"),
-        )
-        self.w_shift_snare.valueChanged.connect(
-            lambda v: self._set("COLOR_SHIFT_SNARE", v)
-        )
-        sl.addWidget(self.w_shift_snare)
-
-        self.w_shift_peak = LabeledSlider(
-            "Shift no Peak", 0.0, 0.5, 0.01, self.cfg.get("COLOR_SHIFT_PEAK"),
-        )
-        self.w_shift_peak.valueChanged.connect(
-            lambda v: self._set("COLOR_SHIFT_PEAK", v)
-        )
-        sl.addWidget(self.w_shift_peak)
-
+        add_sliders(self, QVBoxLayout(grp_shift), self._SHIFT_SLIDERS, get, self._set)
         layout.addWidget(grp_shift)
 
         layout.addStretch()
+        container.setUpdatesEnabled(True)
         self.setWidget(container)
 
     def _set(self, key, val):
-        self.cfg.set(key, val)
-        self.cfg.apply_to_config_module()
+        if self.cfg.set(key, val):  # valor igual: nada a aplicar
+            self._apply_timer.start()
 
     def reload_values(self):
-        self.w_brightness_map.set_map(self.cfg.get("BRIGHTNESS_MAP"))
-        self.w_floor.setValue(self.cfg.get("BRIGHTNESS_FLOOR"))
-        self.w_base.setValue(self.cfg.get("BRIGHTNESS_BASE"))
-        self.w_kick.setValue(self.cfg.get("BRIGHTNESS_KICK"))
-        self.w_snare.setValue(self.cfg.get("BRIGHTNESS_SNARE"))
-        self.w_peak.setValue(self.cfg.get("BRIGHTNESS_PEAK"))
-        self.w_shift_kick.setValue(self.cfg.get("COLOR_SHIFT_KICK"))
-        self.w_shift_snare.setValue(self.cfg.get("COLOR_SHIFT_SNARE"))
-        self.w_shift_peak.setValue(self.cfg.get("COLOR_SHIFT_PEAK"))
\ No newline at end of file
+        reload_widgets(self, self._RELOAD, self.cfg.get_many(self._RELOAD_KEYS))
@@ -1,23 +1,125 @@
 # gui/tabs/tab_colors.py
 """Aba de configuração de cores (estratégia, atribuição, hue shifts, saturação)."""
 
+from functools import partial
+
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QGroupBox, QScrollArea, QLabel,
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QThreadPool
+
+from gui.widgets import add_sliders, add_combos, reload_widgets, make_apply_timer
+from config_manager import get_config_manager
+
+# Resolvido uma vez: sem color_module (requests/PIL ausentes) não há cache
+try:
+    from color_module import clear_cache as _clear_cache
+except Exception:
+    _clear_cache = None
 
-from gui.widgets import LabeledSlider, LabeledCombo, Separator
-from config_manager import ConfigManager
+
+def _apply_config(cfg, clear_colors):
+    """Roda numa thread do pool: só config e cache, nenhum widget."""
+    cfg.apply_to_config_module()
+    if clear_colors and _clear_cache is not None:
+        _clear_cache()
 
 
 class TabColors(QScrollArea):
+    # reload_values: (widget, key, setter)
+    _RELOAD = (
+        ("w_selection_strategy", "COLOR_SELECTION_STRATEGY", "setCurrentValue"),
+        ("w_assignment_mode", "COLOR_ASSIGNMENT_MODE", "setCurrentValue"),
+        ("w_min_saturation", "COLOR_MIN_SATURATION", "setValue"),
+        ("w_hue_perc", "BAND_HUE_PERCUSSION", "setValue"),
+        ("w_hue_bass", "BAND_HUE_BASS", "setValue"),
+        ("w_hue_melody", "BAND_HUE_MELODY", "setValue"),
+        ("w_sat_perc", "BAND_SAT_PERCUSSION", "setValue"),
+        ("w_sat_bass", "BAND_SAT_BASS", "setValue"),
+        ("w_sat_melody", "BAND_SAT_MELODY", "setValue"),
+        ("w_gradient", "BAND_INTERNAL_GRADIENT", "setValue"),
+        ("w_color_lerp", "BAND_COLOR_LERP", "setValue"),
+        ("w_blend_width", "BAND_ZONE_BLEND_WIDTH", "setValue"),
+        ("w_beat_color_shift", "BAND_BEAT_COLOR_SHIFT", "setValue"),
+        ("w_response_curve", "BAND_RESPONSE_CURVE", "setCurrentValue"),
+    )
+    _RELOAD_KEYS = tuple(key for _, key, _ in _RELOAD)
+    # Keys que um config.py antigo pode não ter
+    _DEFAULTS = {
+        "COLOR_SELECTION_STRATEGY": "vibrant",
+        "COLOR_ASSIGNMENT_MODE": "vibrant_bass",
+        "COLOR_MIN_SATURATION": 0.45,
+    }
+
+    # add_combos: (attr, key, label, options, description)
+    _STRATEGY_COMBOS = (
+        ("w_selection_strategy", "COLOR_SELECTION_STRATEGY", "Seleção de Cores",
+         ["vibrant", "contrast", "max_saturation", "adaptive", "balanced"],
+         "vibrant = cores vivas  |  contrast = máxima diferença  |  "
+         "max_saturation = só as mais saturadas  |  adaptive = automático  |  "
+         "balanced = comportamento antigo"),
+        ("w_assignment_mode", "COLOR_ASSIGNMENT_MODE", "Atribuição às Bandas",
+         ["vibrant_bass", "even", "inverted", "luminance"],
+         "vibrant_bass = baixo recebe cor mais vibrante  |  "
+         "even = brilho equalizado  |  inverted = baixo claro, percussão escura  |  "
+         "luminance = comportamento antigo (escura→baixo)"),
+    )
+    _VISUAL_COMBOS = (
+        ("w_response_curve", "BAND_RESPONSE_CURVE", "Curva de Resposta",
+         ["linear", "sqrt", "square", "log"],
+         "Curva aplicada à intensidade antes do mapeamento"),
+    )
+    # add_sliders: (attr, key, label, min, max, step, suffix, description)
+    _STRATEGY_SLIDERS = (
+        ("w_min_saturation", "COLOR_MIN_SATURATION", "Saturação Mínima",
+         0.0, 0.80, 0.05, "",
+         "Piso de saturação pra LEDs. 0 = sem piso (original). "
+         "Valores altos = cores sempre vibrantes."),
+    )
+    _HUE_SLIDERS = (
+        ("w_hue_perc", "BAND_HUE_PERCUSSION", "🥁 Percussão", -0.5, 0.5, 0.01, "", ""),
+        ("w_hue_bass", "BAND_HUE_BASS", "🎸 Baixo", -0.5, 0.5, 0.01, "", ""),
+        ("w_hue_melody", "BAND_HUE_MELODY", "🎹 Melodia", -0.5, 0.5, 0.01, "", ""),
+    )
+    _SAT_SLIDERS = (
+        ("w_sat_perc", "BAND_SAT_PERCUSSION", "🥁 Percussão", 0.0, 2.0, 0.05, "", ""),
+        ("w_sat_bass", "BAND_SAT_BASS", "🎸 Baixo", 0.0, 2.0, 0.05, "", ""),
+        ("w_sat_melody", "BAND_SAT_MELODY", "🎹 Melodia", 0.0, 2.0, 0.05, "", ""),
+    )
+    _VISUAL_SLIDERS = (
+        ("w_gradient", "BAND_INTERNAL_GRADIENT", "Gradiente Interno", 0.0, 0.5, 0.01, "",
+         "Gradiente de brilho dentro de cada zona"),
+        ("w_color_lerp", "BAND_COLOR_LERP", "Color Lerp", 0.0, 1.0, 0.05, "",
+         "Suavização da transição de cor entre frames"),
+        ("w_blend_width", "BAND_ZONE_BLEND_WIDTH", "Blend entre Zonas", 0.0, 5.0, 1.0, "",
+         "Quantos LEDs de transição entre zonas"),
+        ("w_beat_color_shift", "BAND_BEAT_COLOR_SHIFT", "Beat Color Shift",
+         0.0, 0.5, 0.01, "", "Quanto a cor muda durante o beat"),
+    )
+    # Keys inteiras que chegam como float do LabeledSlider
+    _INT_KEYS = frozenset({"BAND_ZONE_BLEND_WIDTH"})
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.cfg = ConfigManager()
+        self.cfg = get_config_manager()
+        # Todas as keys da aba numa leitura só (as mesmas do reload)
+        get = dict(zip(
+            self._RELOAD_KEYS, self.cfg.get_many(self._RELOAD_KEYS, self._DEFAULTS),
+        )).get
+
+        self._apply_timer = make_apply_timer(self, self._flush)
+        self._clear_color_cache = False
+
         self.setWidgetResizable(True)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        # O container cobre o viewport todo: nada pra pintar por baixo, e
+        # resize só repinta a faixa nova
+        viewport = self.viewport()
+        viewport.setAutoFillBackground(False)
+        viewport.setAttribute(Qt.WidgetAttribute.WA_StaticContents, True)
 
         container = QWidget()
+        container.setUpdatesEnabled(False)  # um layout só, no fim da montagem
         layout = QVBoxLayout(container)
         layout.setSpacing(12)
 
@@ -31,49 +133,12 @@ class TabColors(QScrollArea):
             "Controla como as cores são extraídas da capa e distribuídas entre as bandas.\n"
             "Só se aplica quando o esquema de cores é 'album_colors'."
         )
-        desc_strat.setStyleSheet("color: #888; font-size: 11px;")
+        desc_strat.setProperty("class", "description")  # regra do tema, sem QSS por label
         desc_strat.setWordWrap(True)
         stl.addWidget(desc_strat)
 
-        # ── Seleção ──
-        self.w_selection_strategy = LabeledCombo(
-            "Seleção de Cores",
-            ["vibrant", "contrast", "max_saturation", "adaptive", "balanced"],
-            self.cfg.get("COLOR_SELECTION_STRATEGY", "vibrant"),
-            "vibrant = cores vivas  |  contrast = máxima diferença  |  "
-            "max_saturation = só as mais saturadas  |  adaptive = automático  |  "
-            "balanced = comportamento antigo",
-        )
-        self.w_selection_strategy.currentTextChanged.connect(
-            lambda v: self._set_color("COLOR_SELECTION_STRATEGY", v)
-        )
-        stl.addWidget(self.w_selection_strategy)
-
-        # ── Atribuição ──
-        self.w_assignment_mode = LabeledCombo(
-            "Atribuição às Bandas",
-            ["vibrant_bass", "even", "inverted", "luminance"],
-            self.cfg.get("COLOR_ASSIGNMENT_MODE", "vibrant_bass"),
-            "vibrant_bass = baixo recebe cor mais vibrante  |  "
-            "even = brilho equalizado  |  inverted = baixo claro, percussão escura  |  "
-            "luminance = comportamento antigo (escura→baixo)",
-        )
-        self.w_assignment_mode.currentTextChanged.connect(
-            lambda v: self._set_color("COLOR_ASSIGNMENT_MODE", v)
-        )
-        stl.addWidget(self.w_assignment_mode)
-
-        # ── Saturação Mínima ──
-        self.w_min_saturation = LabeledSlider(
-            "Saturação Mínima", 0.0, 0.80, 0.05,
-            self.cfg.get("COLOR_MIN_SATURATION", 0.45),
-            description="Piso de saturação pra LEDs. 0 = sem piso (original). "
-                        "Valores altos = cores sempre vibrantes.",
-        )
-        self.w_min_saturation.valueChanged.connect(
-            lambda v: self._set_color("COLOR_MIN_SATURATION", v)
-        )
-        stl.addWidget(self.w_min_saturation)
+        add_combos(self, stl, self._STRATEGY_COMBOS, get, self._set_color)
+        add_sliders(self, stl, self._STRATEGY_SLIDERS, get, self._set_color)
 
         layout.addWidget(grp_strategy)
 
@@ -88,33 +153,11 @@ class TabColors(QScrollArea):
             "Valores positivos → mais quente | Negativos → mais frio\n"
             "⚠ Só funciona no esquema 'custom' (aba Bandas)."
         )
-        desc.setStyleSheet("color: #666; font-size: 11px;")
+        desc.setProperty("class", "description")
         desc.setWordWrap(True)
         hl.addWidget(desc)
 
-        self.w_hue_perc = LabeledSlider(
-            "🥁 Percussão", -0.5, 0.5, 0.01, self.cfg.get("BAND_HUE_PERCUSSION"),
-        )
-        self.w_hue_perc.valueChanged.connect(
-            lambda v: self._set("BAND_HUE_PERCUSSION", v)
-        )
-        hl.addWidget(self.w_hue_perc)
-
-        self.w_hue_bass = LabeledSlider(
-            "🎸 Baixo", -0.5, 0.5, 0.01, self.cfg.get("BAND_HUE_BASS"),
-        )
-        self.w_hue_bass.valueChanged.connect(
-            lambda v: self._set("BAND_HUE_BASS", v)
-        )
-        hl.addWidget(self.w_hue_bass)
-
-        self.w_hue_melody = LabeledSlider(
-            "🎹 Melodia", -0.5, 0.5, 0.01, self.cfg.get("BAND_HUE_MELODY"),
-        )
-        self.w_hue_melody.valueChanged.connect(
-            lambda v: self._set("BAND_HUE_MELODY", v)
-        )
-        hl.addWidget(self.w_hue_melody)
+        add_sliders(self, hl, self._HUE_SLIDERS, get, self._set)
 
         layout.addWidget(grp_hue)
 
@@ -128,33 +171,11 @@ class TabColors(QScrollArea):
             "Multiplicador de saturação por banda.\n"
             "⚠ Só funciona no esquema 'custom' (aba Bandas)."
         )
-        desc_sat.setStyleSheet("color: #666; font-size: 11px;")
+        desc_sat.setProperty("class", "description")
         desc_sat.setWordWrap(True)
         sl.addWidget(desc_sat)
 
-        self.w_sat_perc = LabeledSlider(
-            "🥁 Percussão", 0.0, 2.0, 0.05, self.cfg.get("BAND_SAT_PERCUSSION"),
-        )
-        self.w_sat_perc.valueChanged.connect(
-            lambda v: self._set("BAND_SAT_PERCUSSION", v)
-        )
-        sl.addWidget(self.w_sat_perc)
-
-        self.w_sat_bass = LabeledSlider(
-            "🎸 Baixo", 0.0, 2.0, 0.05, self.cfg.get("BAND_SAT_BASS"),
-        )
-        self.w_sat_bass.valueChanged.connect(
-            lambda v: self._set("BAND_SAT_BASS", v)
-        )
-        sl.addWidget(self.w_sat_bass)
-
-        self.w_sat_melody = LabeledSlider(
-            "🎹 Melodia", 0.0, 2.0, 0.05, self.cfg.get("BAND_SAT_MELODY"),
-        )
-        self.w_sat_melody.valueChanged.connect(
-            lambda v: self._set("BAND_SAT_MELODY", v)
-        )
-        sl.addWidget(self.w_sat_melody)
+        add_sliders(self, sl, self._SAT_SLIDERS, get, self._set)
 
         layout.addWidget(grp_sat)
 
@@ -164,59 +185,13 @@ class TabColors(QScrollArea):
         grp_visual = QGroupBox("Visual das Bandas")
         vl = QVBoxLayout(grp_visual)
 
-        self.w_gradient = LabeledSlider(
-            "Gradiente Interno", 0.0, 0.5, 0.01,
-            self.cfg.get("BAND_INTERNAL_GRADIENT"),
-            description="Gradiente de brilho dentro de cada zona",
-        )
-        self.w_gradient.valueChanged.connect(
-            lambda v: self._set("BAND_INTERNAL_GRADIENT", v)
-        )
-        vl.addWidget(self.w_gradient)
-
-        self.w_color_lerp = LabeledSlider(
-            "Color Lerp", 0.0, 1.0, 0.05, self.cfg.get("BAND_COLOR_LERP"),
-            description="Suavização da transição de cor entre frames",
-        )
-        self.w_color_lerp.valueChanged.connect(
-            lambda v: self._set("BAND_COLOR_LERP", v)
-        )
-        vl.addWidget(self.w_color_lerp)
-
-        self.w_blend_width = LabeledSlider(
-            "Blend entre Zonas", 0.0, 5.0, 1.0,
-            self.cfg.get("BAND_ZONE_BLEND_WIDTH"),
-            description="Quantos LEDs de transição entre zonas",
-        )
-        self.w_blend_width.valueChanged.connect(
-            lambda v: self._set("BAND_ZONE_BLEND_WIDTH", int(v))
-        )
-        vl.addWidget(self.w_blend_width)
-
-        self.w_beat_color_shift = LabeledSlider(
-            "Beat Color Shift", 0.0, 0.5, 0.01,
-            self.cfg.get("BAND_BEAT_COLOR_SHIFT"),
-            description="Quanto a cor muda durante o beat",
-        )
-        self.w_beat_color_shift.valueChanged.connect(
-            lambda v: self._set("BAND_BEAT_COLOR_SHIFT", v)
-        )
-        vl.addWidget(self.w_beat_color_shift)
-
-        self.w_response_curve = LabeledCombo(
-            "Curva de Resposta",
-            ["linear", "sqrt", "square", "log"],
-            self.cfg.get("BAND_RESPONSE_CURVE"),
-            "Curva aplicada à intensidade antes do mapeamento",
-        )
-        self.w_response_curve.currentTextChanged.connect(
-            lambda v: self._set("BAND_RESPONSE_CURVE", v)
-        )
-        vl.addWidget(self.w_response_curve)
+        add_sliders(self, vl, self._VISUAL_SLIDERS, get, self._set)
+        add_combos(self, vl, self._VISUAL_COMBOS, get, self._set)
 
         layout.addWidget(grp_visual)
 
         layout.addStretch()
+        container.setUpdatesEnabled(True)
         self.setWidget(container)
 
     # ──────────────────────────────────────────────
@@ -225,43 +200,30 @@ class TabColors(QScrollArea):
 
     def _set(self, key, val):
         """Set normal (sem limpar cache)."""
-        self.cfg.set(key, val)
-        self.cfg.apply_to_config_module()
+        if key in self._INT_KEYS:
+            val = int(val)
+        if self.cfg.set(key, val):  # valor igual: nada a aplicar
+            self._apply_timer.start()
 
     def _set_color(self, key, val):
         """Set de config de cor — limpa cache pra reaplicar na próxima música."""
-        self.cfg.set(key, val)
-        self.cfg.apply_to_config_module()
-        try:
-            from color_module import clear_cache
-            clear_cache()
-        except Exception:
-            pass
+        if self.cfg.set(key, val):
+            self._clear_color_cache = True
+            self._apply_timer.start()
+
+    def _flush(self):
+        """Fim da rajada: apply (+ limpeza de cache, se mexeu em cor) no QThreadPool."""
+        clear_colors = self._clear_color_cache
+        self._clear_color_cache = False
+        QThreadPool.globalInstance().start(
+            partial(_apply_config, self.cfg, clear_colors)
+        )
 
     # ──────────────────────────────────────────────
     # RELOAD
     # ──────────────────────────────────────────────
 
     def reload_values(self):
-        # Novos
-        self.w_selection_strategy.setCurrentText(
-            self.cfg.get("COLOR_SELECTION_STRATEGY", "vibrant")
-        )
-        self.w_assignment_mode.setCurrentText(
-            self.cfg.get("COLOR_ASSIGNMENT_MODE", "vibrant_bass")
-        )
-        self.w_min_saturation.setValue(
-            self.cfg.get("COLOR_MIN_SATURATION", 0.45)
+        reload_widgets(
+            self, self._RELOAD, self.cfg.get_many(self._RELOAD_KEYS, self._DEFAULTS),
         )
-        # Existentes
-        self.w_hue_perc.setValue(self.cfg.get("BAND_HUE_PERCUSSION"))
-        self.w_hue_bass.setValue(self.cfg.get("BAND_HUE_BASS"))
-        self.w_hue_melody.setValue(self.cfg.get("BAND_HUE_MELODY"))
-        self.w_sat_perc.setValue(self.cfg.get("BAND_SAT_PERCUSSION"))
-        self.w_sat_bass.setValue(self.cfg.get("BAND_SAT_BASS"))
-        self.w_sat_melody.setValue(self.cfg.get("BAND_SAT_MELODY"))
-        self.w_gradient.setValue(self.cfg.get("BAND_INTERNAL_GRADIENT"))
-        self.w_color_lerp.setValue(self.cfg.get("BAND_COLOR_LERP"))
-        self.w_blend_width.setValue(self.cfg.get("BAND_ZONE_BLEND_WIDTH"))
-        self.w_beat_color_shift.setValue(self.cfg.get("BAND_BEAT_COLOR_SHIFT"))
-        self.w_response_curve.setCurrentText(self.cfg.get("BAND_RESPONSE_CURVE"))
\ No newline at end of file
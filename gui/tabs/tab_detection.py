@@ -6,157 +6,101 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt
 
-from gui.widgets import LabeledSlider, LabeledCombo, Separator
-from config_manager import ConfigManager
+from gui.widgets import add_sliders, add_combos, reload_widgets, make_apply_timer
+from config_manager import get_config_manager
 
 
 class TabDetection(QScrollArea):
+    # reload_values: (widget, key, setter)
+    _RELOAD = (
+        ("w_sensitivity", "SENSITIVITY", "setCurrentValue"),
+        ("w_peaks_sens", "PEAKS_SENSITIVITY", "setCurrentValue"),
+        ("w_kick_thresh", "CUSTOM_KICK_THRESHOLD", "setValue"),
+        ("w_snare_thresh", "CUSTOM_SNARE_THRESHOLD", "setValue"),
+        ("w_kick_energy", "CUSTOM_KICK_MIN_ENERGY", "setValue"),
+        ("w_snare_energy", "CUSTOM_SNARE_MIN_ENERGY", "setValue"),
+        ("w_kick_minioi", "CUSTOM_KICK_MINIOI", "setValue"),
+        ("w_snare_minioi", "CUSTOM_SNARE_MINIOI", "setValue"),
+        ("w_peak_hold", "PEAK_HOLD_TIME", "setValue"),
+        ("w_peak_interval", "PEAK_MIN_INTERVAL", "setValue"),
+        ("w_hit_hold", "HIT_HOLD_TIME", "setValue"),
+    )
+    _RELOAD_KEYS = tuple(key for _, key, _ in _RELOAD)
+
+    # add_combos: (attr, key, label, options, description)
+    _PRESET_COMBOS = (
+        ("w_sensitivity", "SENSITIVITY", "Sensibilidade Onset (Aubio)",
+         ["low", "medium", "high", "custom"], "Presets para detecção de kick/snare"),
+        ("w_peaks_sens", "PEAKS_SENSITIVITY", "Sensibilidade Peaks (FFT)",
+         ["low", "medium", "high", "custom"], ""),
+    )
+    # add_sliders: (attr, key, label, min, max, step, suffix, description)
+    _CUSTOM_SLIDERS = (
+        ("w_kick_thresh", "CUSTOM_KICK_THRESHOLD", "Kick Threshold", 0.1, 1.0, 0.05, "",
+         "Limiar para detectar kick (menor = mais sensível)"),
+        ("w_snare_thresh", "CUSTOM_SNARE_THRESHOLD", "Snare Threshold", 0.1, 1.0, 0.05, "", ""),
+        None,
+        ("w_kick_energy", "CUSTOM_KICK_MIN_ENERGY", "Kick Min Energy", 0.001, 0.05, 0.001, "",
+         "Energia mínima para considerar um kick real"),
+        ("w_snare_energy", "CUSTOM_SNARE_MIN_ENERGY", "Snare Min Energy",
+         0.001, 0.05, 0.001, "", ""),
+        None,
+        ("w_kick_minioi", "CUSTOM_KICK_MINIOI", "Kick Min Interval", 0.01, 0.2, 0.01, "s",
+         "Tempo mínimo entre dois kicks (segundos)"),
+        ("w_snare_minioi", "CUSTOM_SNARE_MINIOI", "Snare Min Interval",
+         0.01, 0.2, 0.01, "s", ""),
+    )
+    _TIMING_SLIDERS = (
+        ("w_peak_hold", "PEAK_HOLD_TIME", "Peak Hold Time", 0.01, 0.5, 0.01, "s",
+         "Quanto tempo o peak fica ativo"),
+        ("w_peak_interval", "PEAK_MIN_INTERVAL", "Peak Min Interval", 0.01, 0.2, 0.01, "s", ""),
+        ("w_hit_hold", "HIT_HOLD_TIME", "Hit Hold Time", 0.05, 0.5, 0.01, "s",
+         "Quanto tempo o hit (kick/snare) fica ativo"),
+    )
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.cfg = ConfigManager()
+        self.cfg = get_config_manager()
+        # Todas as keys da aba numa leitura só (as mesmas do reload)
+        get = dict(zip(self._RELOAD_KEYS, self.cfg.get_many(self._RELOAD_KEYS))).get
+
+        self._apply_timer = make_apply_timer(self, self.cfg.apply_to_config_module)
+
         self.setWidgetResizable(True)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        # O container cobre o viewport todo: nada pra pintar por baixo, e
+        # resize só repinta a faixa nova
+        viewport = self.viewport()
+        viewport.setAutoFillBackground(False)
+        viewport.setAttribute(Qt.WidgetAttribute.WA_StaticContents, True)
 
         container = QWidget()
+        container.setUpdatesEnabled(False)  # um layout só, no fim da montagem
         layout = QVBoxLayout(container)
         layout.setSpacing(12)
 
         # ── Sensitivity Presets ──
         grp_preset = QGroupBox("Presets de Sensibilidade")
-        pl = QVBoxLayout(grp_preset)
-
-        self.w_sensitivity = LabeledCombo(
-            "Sensibilidade Onset (Aubio)",
-            ["low", "medium", "high", "custom"],
-            self.cfg.get("SENSITIVITY"),
-            "Presets para detecção de kick/snare",
-        )
-        self.w_sensitivity.currentTextChanged.connect(
-            lambda v: self._set("SENSITIVITY", v)
-        )
-        pl.addWidget(self.w_sensitivity)
-
-        self.w_peaks_sens = LabeledCombo(
-            "Sensibilidade Peaks (FFT)",
-            ["low", "medium", "high", "custom"],
-            self.cfg.get("PEAKS_SENSITIVITY"),
-        )
-        self.w_peaks_sens.currentTextChanged.connect(
-            lambda v: self._set("PEAKS_SENSITIVITY", v)
-        )
-        pl.addWidget(self.w_peaks_sens)
-
+        add_combos(self, QVBoxLayout(grp_preset), self._PRESET_COMBOS, get, self._set)
         layout.addWidget(grp_preset)
 
         # ── Custom Thresholds ──
         grp_custom = QGroupBox("Thresholds Customizados")
-        cl = QVBoxLayout(grp_custom)
-
-        self.w_kick_thresh = LabeledSlider(
-            "Kick Threshold", 0.1, 1.0, 0.05, self.cfg.get("CUSTOM_KICK_THRESHOLD"),
-            description="Limiar para detectar kick (menor = mais sensível)",
-        )
-        self.w_kick_thresh.valueChanged.connect(
-            lambda v: self._set("CUSTOM_KICK_THRESHOLD", v)
-        )
-        cl.addWidget(self.w_kick_thresh)
-
-        self.w_snare_thresh = LabeledSlider(
-            "Snare Threshold", 0.1, 1.0, 0.05, self.cfg.get("CUSTOM_SNARE_THRESHOLD"),
-        )
-        self.w_snare_thresh.valueChanged.connect(
-            lambda v: self._set("CUSTOM_SNARE_THRESHOLD", v)
-        )
-        cl.addWidget(self.w_snare_thresh)
-
-        cl.addWidget(Separator())
-
-        self.w_kick_energy = LabeledSlider(
-            "Kick Min Energy", 0.001, 0.05, 0.001, self.cfg.get("CUSTOM_KICK_MIN_ENERGY"),
-            description="Energia mínima para considerar um kick real",
-        )
-        self.w_kick_energy.valueChanged.connect(
-            lambda v: self._set("CUSTOM_KICK_MIN_ENERGY", v)
-        )
-        cl.addWidget(self.w_kick_energy)
-
-        self.w_snare_energy = LabeledSlider(
-            "Snare Min Energy", 0.001, 0.05, 0.001, self.cfg.get("CUSTOM_SNARE_MIN_ENERGY"),
-        )
-        self.w_snare_energy.valueChanged.connect(
-            lambda v: self._set("CUSTOM_SNARE_MIN_ENERGY", v)
-        )
-        cl.addWidget(self.w_snare_energy)
-
-        cl.addWidget(Separator())
-
-        self.w_kick_minioi = LabeledSlider(
-            "Kick Min Interval", 0.01, 0.2, 0.01, self.cfg.get("CUSTOM_KICK_MINIOI"), "s",
-            description="Tempo mínimo entre dois kicks (segundos)",
-        )
-        self.w_kick_minioi.valueChanged.connect(
-            lambda v: self._set("CUSTOM_KICK_MINIOI", v)
-        )
-        cl.addWidget(self.w_kick_minioi)
-
-        self.w_snare_minioi = LabeledSlider(
-            "Snare Min Interval", 0.01, 0.2, 0.01, self.cfg.get("CUSTOM_SNARE_MINIOI"), "s",
-        )
-        self.w_snare_minioi.valueChanged.connect(
-            lambda v: self._set("CUSTOM_SNARE_MINIOI", v)
-        )
-        cl.addWidget(self.w_snare_minioi)
-
+        add_sliders(self, QVBoxLayout(grp_custom), self._CUSTOM_SLIDERS, get, self._set)
         layout.addWidget(grp_custom)
 
         # ── Timing ──
         grp_timing = QGroupBox("Timing")
-        tl = QVBoxLayout(grp_timing)
-
-        self.w_peak_hold = LabeledSlider(
-            "Peak Hold Time", 0.01, 0.5, 0.01, self.cfg.get("PEAK_HOLD_TIME"), "s",
-            description="Quanto tempo o peak fica ativo",
-        )
-        self.w_peak_hold.valueChanged.connect(
-            lambda v: self._set("PEAK_HOLD_TIME", v)
-        )
-        tl.addWidget(self.w_peak_hold)
-
-        self.w_peak_interval = LabeledSlider(
-            "Peak Min Interval", 0.01, 0.2, 0.01, self.cfg.get("PEAK_MIN_INTERVAL"), "s",
-        )
-        self.w_peak_interval.valueChanged.connect(
-            lambda v: self._set("PEAK_MIN_INTERVAL", v)
-        )
-        tl.addWidget(self.w_peak_interval)
-
-        self.w_hit_hold = LabeledSlider(
-            "Hit Hold Time", 0.05, 0.5, 0.01, self.cfg.get("HIT_HOLD_TIME"), "s",
-            description="Quanto tempo o hit (kick/snare) fica ativo",
-        )
-        self.w_hit_hold.valueChanged.connect(
-            lambda v: self._set("HIT_HOLD_TIME", v)
-        )
-        tl.addWidget(self.w_hit_hold)
-
+        add_sliders(self, QVBoxLayout(grp_timing), self._TIMING_SLIDERS, get, self._set)
         layout.addWidget(grp_timing)
 
         layout.addStretch()
+        container.setUpdatesEnabled(True)
         self.setWidget(container)
 
     def _set(self, key, val):
-        self.cfg.set(key, val)
-        self.cfg.apply_to_config_module()
+        if self.cfg.set(key, val):  # valor igual: nada a aplicar
+            self._apply_timer.start()
 
     def reload_values(self):
-        self.w_sensitivity.setCurrentText(self.cfg.get("SENSITIVITY"))
-        self.w_peaks_sens.setCurrentText(self.cfg.get("PEAKS_SENSITIVITY"))
-        self.w_kick_thresh.setValue(self.cfg.get("CUSTOM_KICK_THRESHOLD"))
-        self.w_snare_thresh.setValue(self.cfg.get("CUSTOM_SNARE_THRESHOLD"))
-        self.w_kick_energy.setValue(self.cfg.get("CUSTOM_KICK_MIN_ENERGY"))
-        self.w_snare_energy.setValue(self.cfg.get("CUSTOM_SNARE_MIN_ENERGY"))
-        self.w_kick_minioi.setValue(self.cfg.get("CUSTOM_KICK_MINIOI"))
-        self.w_snare_minioi.setValue(self.cfg.get("CUSTOM_SNARE_MINIOI"))
-        self.w_peak_hold.setValue(self.cfg.get("PEAK_HOLD_TIME"))
-        self.w_peak_interval.setValue(self.cfg.get("PEAK_MIN_INTERVAL"))
-        self.w_hit_hold.setValue(self.cfg.get("HIT_HOLD_TIME"))
\ No newline at end of file
+        reload_widgets(self, self._RELOAD, self.cfg.get_many(self._RELOAD_KEYS))
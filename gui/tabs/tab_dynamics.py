@@ -10,20 +10,66 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt
 
-from gui.widgets import LabeledSlider, LabeledCombo, LabeledToggle
+from gui.widgets import LabeledSlider, LabeledCombo, LabeledToggle, reload_widgets, make_apply_timer
 from config_manager import ConfigManager
 
 
 class TabDynamics(QScrollArea):
     """Aba de controle de dinâmica de áudio."""
-    
+
+    # reload_values: (widget, key, setter)
+    _RELOAD = (
+        ("w_agc_enabled", "AGC_ENABLED", "setChecked"),
+        ("w_agc_max", "AGC_MAX_GAIN", "setValue"),
+        ("w_agc_min", "AGC_MIN_GAIN", "setValue"),
+        ("w_agc_target", "AGC_TARGET", "setValue"),
+        ("w_agc_attack", "AGC_ATTACK", "setValue"),
+        ("w_agc_release", "AGC_RELEASE", "setValue"),
+        ("w_comp_enabled", "BAND_COMPRESSION_ENABLED", "setChecked"),
+        ("w_comp_thresh", "COMPRESSOR_THRESHOLD", "setValue"),
+        ("w_comp_ratio", "COMPRESSOR_RATIO", "setValue"),
+        ("w_comp_knee", "COMPRESSOR_KNEE", "setValue"),
+        ("w_comp_makeup", "COMPRESSOR_MAKEUP", "setValue"),
+        ("w_smooth_enabled", "ADAPTIVE_SMOOTHING", "setChecked"),
+        ("w_smooth_mult", "SMOOTHING_LOW_VOL_MULT", "setValue"),
+        ("w_smooth_thresh", "SMOOTHING_LOW_VOL_THRESH", "setValue"),
+        ("w_floor_enabled", "DYNAMIC_FLOOR_ENABLED", "setChecked"),
+        ("w_floor_max", "DYNAMIC_FLOOR_MAX", "setValue"),
+        ("w_floor_thresh", "DYNAMIC_FLOOR_THRESH", "setValue"),
+    )
+    _RELOAD_KEYS = tuple(key for _, key, _ in _RELOAD)
+    # Os mesmos defaults do __init__, pra key ausente no config.py
+    _DEFAULTS = {
+        "AGC_ENABLED": True,
+        "AGC_MAX_GAIN": 3.5,
+        "AGC_MIN_GAIN": 0.8,
+        "AGC_TARGET": 0.35,
+        "AGC_ATTACK": 0.03,
+        "AGC_RELEASE": 0.01,
+        "BAND_COMPRESSION_ENABLED": True,
+        "COMPRESSOR_THRESHOLD": 0.25,
+        "COMPRESSOR_RATIO": 2.5,
+        "COMPRESSOR_KNEE": 0.15,
+        "COMPRESSOR_MAKEUP": 1.4,
+        "ADAPTIVE_SMOOTHING": True,
+        "SMOOTHING_LOW_VOL_MULT": 2.5,
+        "SMOOTHING_LOW_VOL_THRESH": 0.35,
+        "DYNAMIC_FLOOR_ENABLED": True,
+        "DYNAMIC_FLOOR_MAX": 0.15,
+        "DYNAMIC_FLOOR_THRESH": 0.30,
+    }
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.cfg = ConfigManager()
+
+        self._apply_timer = make_apply_timer(self, self.cfg.apply_to_config_module)
+
         self.setWidgetResizable(True)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
 
         container = QWidget()
+        container.setUpdatesEnabled(False)  # um layout só, no fim da montagem
         layout = QVBoxLayout(container)
         layout.setSpacing(12)
 
@@ -70,7 +116,7 @@ class TabDynamics(QScrollArea):
             self.cfg.get("AGC_MAX_GAIN", 3.5),
             description="Quanto amplifica em volume muito baixo (1.0 = sem boost)",
         )
-        self.w_agc_max.valueChanged.connect(
+        self.w_agc_max.committed.connect(
             lambda v: self._set("AGC_MAX_GAIN", v)
         )
         agc_layout.addWidget(self.w_agc_max)
@@ -81,7 +127,7 @@ class TabDynamics(QScrollArea):
             self.cfg.get("AGC_MIN_GAIN", 0.8),
             description="Quanto reduz em volume muito alto (evita saturar)",
         )
-        self.w_agc_min.valueChanged.connect(
+        self.w_agc_min.committed.connect(
             lambda v: self._set("AGC_MIN_GAIN", v)
         )
         agc_layout.addWidget(self.w_agc_min)
@@ -92,7 +138,7 @@ class TabDynamics(QScrollArea):
             self.cfg.get("AGC_TARGET", 0.35),
             description="AGC tenta manter a energia média nesse nível",
         )
-        self.w_agc_target.valueChanged.connect(
+        self.w_agc_target.committed.connect(
             lambda v: self._set("AGC_TARGET", v)
         )
         agc_layout.addWidget(self.w_agc_target)
@@ -103,7 +149,7 @@ class TabDynamics(QScrollArea):
             self.cfg.get("AGC_ATTACK", 0.03),
             description="Mais alto = reage mais rápido quando volume sobe",
         )
-        self.w_agc_attack.valueChanged.connect(
+        self.w_agc_attack.committed.connect(
             lambda v: self._set("AGC_ATTACK", v)
         )
         agc_layout.addWidget(self.w_agc_attack)
@@ -113,7 +159,7 @@ class TabDynamics(QScrollArea):
             self.cfg.get("AGC_RELEASE", 0.01),
             description="Mais baixo = demora mais pra aumentar ganho",
         )
-        self.w_agc_release.valueChanged.connect(
+        self.w_agc_release.committed.connect(
             lambda v: self._set("AGC_RELEASE", v)
         )
         agc_layout.addWidget(self.w_agc_release)
@@ -150,7 +196,7 @@ class TabDynamics(QScrollArea):
             self.cfg.get("COMPRESSOR_THRESHOLD", 0.25),
             description="Acima desse valor, começa a comprimir",
         )
-        self.w_comp_thresh.valueChanged.connect(
+        self.w_comp_thresh.committed.connect(
             lambda v: self._set("COMPRESSOR_THRESHOLD", v)
         )
         comp_layout.addWidget(self.w_comp_thresh)
@@ -161,7 +207,7 @@ class TabDynamics(QScrollArea):
             self.cfg.get("COMPRESSOR_RATIO", 2.5),
             description="Quanto comprime (2.0 = 2:1, 4.0 = 4:1)",
         )
-        self.w_comp_ratio.valueChanged.connect(
+        self.w_comp_ratio.committed.connect(
             lambda v: self._set("COMPRESSOR_RATIO", v)
         )
         comp_layout.addWidget(self.w_comp_ratio)
@@ -172,7 +218,7 @@ class TabDynamics(QScrollArea):
             self.cfg.get("COMPRESSOR_KNEE", 0.15),
             description="0 = transição dura, 0.3+ = transição suave",
         )
-        self.w_comp_knee.valueChanged.connect(
+        self.w_comp_knee.committed.connect(
             lambda v: self._set("COMPRESSOR_KNEE", v)
         )
         comp_layout.addWidget(self.w_comp_knee)
@@ -183,7 +229,7 @@ class TabDynamics(QScrollArea):
             self.cfg.get("COMPRESSOR_MAKEUP", 1.4),
             description="Compensa a redução de volume (1.0 = sem compensação)",
         )
-        self.w_comp_makeup.valueChanged.connect(
+        self.w_comp_makeup.committed.connect(
             lambda v: self._set("COMPRESSOR_MAKEUP", v)
         )
         comp_layout.addWidget(self.w_comp_makeup)
@@ -220,7 +266,7 @@ class TabDynamics(QScrollArea):
             self.cfg.get("SMOOTHING_LOW_VOL_MULT", 2.5),
             description="Quanto mais lento fica o decay (2.0 = 2x mais lento)",
         )
-        self.w_smooth_mult.valueChanged.connect(
+        self.w_smooth_mult.committed.connect(
             lambda v: self._set("SMOOTHING_LOW_VOL_MULT", v)
         )
         smooth_layout.addWidget(self.w_smooth_mult)
@@ -231,7 +277,7 @@ class TabDynamics(QScrollArea):
             self.cfg.get("SMOOTHING_LOW_VOL_THRESH", 0.35),
             description="Abaixo desse volume, o smoothing adaptativo ativa",
         )
-        self.w_smooth_thresh.valueChanged.connect(
+        self.w_smooth_thresh.committed.connect(
             lambda v: self._set("SMOOTHING_LOW_VOL_THRESH", v)
         )
         smooth_layout.addWidget(self.w_smooth_thresh)
@@ -268,7 +314,7 @@ class TabDynamics(QScrollArea):
             self.cfg.get("DYNAMIC_FLOOR_MAX", 0.15),
             description="Brilho mínimo quando volume está muito baixo",
         )
-        self.w_floor_max.valueChanged.connect(
+        self.w_floor_max.committed.connect(
             lambda v: self._set("DYNAMIC_FLOOR_MAX", v)
         )
         floor_layout.addWidget(self.w_floor_max)
@@ -279,7 +325,7 @@ class TabDynamics(QScrollArea):
             self.cfg.get("DYNAMIC_FLOOR_THRESH", 0.30),
             description="Abaixo desse volume, o floor começa a subir",
         )
-        self.w_floor_thresh.valueChanged.connect(
+        self.w_floor_thresh.committed.connect(
             lambda v: self._set("DYNAMIC_FLOOR_THRESH", v)
         )
         floor_layout.addWidget(self.w_floor_thresh)
@@ -315,6 +361,7 @@ class TabDynamics(QScrollArea):
         layout.addWidget(grp_presets)
 
         layout.addStretch()
+        container.setUpdatesEnabled(True)
         self.setWidget(container)
 
     # ──────────────────────────────────────────────
@@ -322,14 +369,14 @@ class TabDynamics(QScrollArea):
     # ──────────────────────────────────────────────
 
     def _set(self, key, val):
-        """Salva config e aplica."""
-        self.cfg.set(key, val)
-        self.cfg.apply_to_config_module()
+        """Salva config; o apply vem do _apply_timer."""
+        if self.cfg.set(key, val):  # o apply sai no fim da rajada
+            self._apply_timer.start()
 
     def _apply_preset(self, values: dict):
-        """Aplica um preset de valores."""
-        for key, val in values.items():
-            self.cfg.set(key, val)
+        """Aplica um preset de valores: uma escrita, um apply, um reload calado."""
+        self.cfg.set_many(values)
+        self._apply_timer.stop()
         self.cfg.apply_to_config_module()
         self.reload_values()
 
@@ -427,27 +474,6 @@ class TabDynamics(QScrollArea):
 
     def reload_values(self):
         """Recarrega valores dos widgets."""
-        # AGC
-        self.w_agc_enabled.setChecked(self.cfg.get("AGC_ENABLED", True))
-        self.w_agc_max.setValue(self.cfg.get("AGC_MAX_GAIN", 3.5))
-        self.w_agc_min.setValue(self.cfg.get("AGC_MIN_GAIN", 0.8))
-        self.w_agc_target.setValue(self.cfg.get("AGC_TARGET", 0.35))
-        self.w_agc_attack.setValue(self.cfg.get("AGC_ATTACK", 0.03))
-        self.w_agc_release.setValue(self.cfg.get("AGC_RELEASE", 0.01))
-        
-        # Compressor
-        self.w_comp_enabled.setChecked(self.cfg.get("BAND_COMPRESSION_ENABLED", True))
-        self.w_comp_thresh.setValue(self.cfg.get("COMPRESSOR_THRESHOLD", 0.25))
-        self.w_comp_ratio.setValue(self.cfg.get("COMPRESSOR_RATIO", 2.5))
-        self.w_comp_knee.setValue(self.cfg.get("COMPRESSOR_KNEE", 0.15))
-        self.w_comp_makeup.setValue(self.cfg.get("COMPRESSOR_MAKEUP", 1.4))
-        
-        # Smoothing
-        self.w_smooth_enabled.setChecked(self.cfg.get("ADAPTIVE_SMOOTHING", True))
-        self.w_smooth_mult.setValue(self.cfg.get("SMOOTHING_LOW_VOL_MULT", 2.5))
-        self.w_smooth_thresh.setValue(self.cfg.get("SMOOTHING_LOW_VOL_THRESH", 0.35))
-        
-        # Floor
-        self.w_floor_enabled.setChecked(self.cfg.get("DYNAMIC_FLOOR_ENABLED", True))
-        self.w_floor_max.setValue(self.cfg.get("DYNAMIC_FLOOR_MAX", 0.15))
-        self.w_floor_thresh.setValue(self.cfg.get("DYNAMIC_FLOOR_THRESH", 0.30))
\ No newline at end of file
+        reload_widgets(
+            self, self._RELOAD, self.cfg.get_many(self._RELOAD_KEYS, self._DEFAULTS),
+        )
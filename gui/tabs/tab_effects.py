@@ -7,7 +7,7 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt
 
 from gui.widgets import (
-    LabeledSlider, LabeledIntSlider, LabeledCombo, LabeledCheck, Separator,
+    LabeledSlider, LabeledIntSlider, LabeledCombo, LabeledCheck, Separator, make_apply_timer,
 )
 from config_manager import ConfigManager
 
@@ -16,10 +16,14 @@ class TabEffects(QScrollArea):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.cfg = ConfigManager()
+
+        self._apply_timer = make_apply_timer(self, self.cfg.apply_to_config_module)
+
         self.setWidgetResizable(True)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
 
         container = QWidget()
+        container.setUpdatesEnabled(False)  # um layout só, no fim da montagem
         layout = QVBoxLayout(container)
         layout.setSpacing(12)
 
@@ -39,7 +43,7 @@ class TabEffects(QScrollArea):
         self.w_chase_speed = LabeledSlider(
             "Velocidade Máx", 0.1, 2.0, 0.1, self.cfg.get("CHASE_SPEED_MAX"),
         )
-        self.w_chase_speed.valueChanged.connect(
+        self.w_chase_speed.committed.connect(
             lambda v: self._set("CHASE_SPEED_MAX", v)
         )
         cl.addWidget(self.w_chase_speed)
@@ -47,7 +51,7 @@ class TabEffects(QScrollArea):
         self.w_chase_tail = LabeledIntSlider(
             "Tamanho da Cauda", 1, 20, self.cfg.get("CHASE_TAIL_LENGTH"), " LEDs",
         )
-        self.w_chase_tail.valueChanged.connect(
+        self.w_chase_tail.committed.connect(
             lambda v: self._set("CHASE_TAIL_LENGTH", v)
         )
         cl.addWidget(self.w_chase_tail)
@@ -55,7 +59,7 @@ class TabEffects(QScrollArea):
         self.w_chase_bmin = LabeledSlider(
             "Brilho Mín", 0.0, 0.5, 0.01, self.cfg.get("CHASE_BRIGHTNESS_MIN"),
         )
-        self.w_chase_bmin.valueChanged.connect(
+        self.w_chase_bmin.committed.connect(
             lambda v: self._set("CHASE_BRIGHTNESS_MIN", v)
         )
         cl.addWidget(self.w_chase_bmin)
@@ -63,7 +67,7 @@ class TabEffects(QScrollArea):
         self.w_chase_bmax = LabeledSlider(
             "Brilho Máx", 0.1, 1.0, 0.05, self.cfg.get("CHASE_BRIGHTNESS_MAX"),
         )
-        self.w_chase_bmax.valueChanged.connect(
+        self.w_chase_bmax.committed.connect(
             lambda v: self._set("CHASE_BRIGHTNESS_MAX", v)
         )
         cl.addWidget(self.w_chase_bmax)
@@ -71,7 +75,7 @@ class TabEffects(QScrollArea):
         self.w_chase_flash = LabeledSlider(
             "Beat Flash", 0.0, 1.0, 0.05, self.cfg.get("CHASE_BEAT_FLASH"),
         )
-        self.w_chase_flash.valueChanged.connect(
+        self.w_chase_flash.committed.connect(
             lambda v: self._set("CHASE_BEAT_FLASH", v)
         )
         cl.addWidget(self.w_chase_flash)
@@ -79,7 +83,7 @@ class TabEffects(QScrollArea):
         self.w_chase_bg = LabeledSlider(
             "Brilho Background", 0.0, 0.5, 0.01, self.cfg.get("CHASE_BG_BRIGHTNESS"),
         )
-        self.w_chase_bg.valueChanged.connect(
+        self.w_chase_bg.committed.connect(
             lambda v: self._set("CHASE_BG_BRIGHTNESS", v)
         )
         cl.addWidget(self.w_chase_bg)
@@ -93,7 +97,7 @@ class TabEffects(QScrollArea):
         self.w_freq_attack = LabeledSlider(
             "Smoothing Attack", 0.05, 1.0, 0.01, self.cfg.get("FREQ_SMOOTHING_ATTACK"),
         )
-        self.w_freq_attack.valueChanged.connect(
+        self.w_freq_attack.committed.connect(
             lambda v: self._set("FREQ_SMOOTHING_ATTACK", v)
         )
         fl.addWidget(self.w_freq_attack)
@@ -101,7 +105,7 @@ class TabEffects(QScrollArea):
         self.w_freq_decay = LabeledSlider(
             "Smoothing Decay", 0.01, 0.5, 0.01, self.cfg.get("FREQ_SMOOTHING_DECAY"),
         )
-        self.w_freq_decay.valueChanged.connect(
+        self.w_freq_decay.committed.connect(
             lambda v: self._set("FREQ_SMOOTHING_DECAY", v)
         )
         fl.addWidget(self.w_freq_decay)
@@ -109,7 +113,7 @@ class TabEffects(QScrollArea):
         self.w_freq_beat = LabeledSlider(
             "Beat Amount", 0.0, 1.0, 0.05, self.cfg.get("FREQ_BEAT_AMOUNT"),
         )
-        self.w_freq_beat.valueChanged.connect(
+        self.w_freq_beat.committed.connect(
             lambda v: self._set("FREQ_BEAT_AMOUNT", v)
         )
         fl.addWidget(self.w_freq_beat)
@@ -117,7 +121,7 @@ class TabEffects(QScrollArea):
         self.w_freq_bass_mult = LabeledSlider(
             "Bass Multiplier", 0.1, 2.0, 0.05, self.cfg.get("FREQ_BASS_MULT"),
         )
-        self.w_freq_bass_mult.valueChanged.connect(
+        self.w_freq_bass_mult.committed.connect(
             lambda v: self._set("FREQ_BASS_MULT", v)
         )
         fl.addWidget(self.w_freq_bass_mult)
@@ -125,7 +129,7 @@ class TabEffects(QScrollArea):
         self.w_freq_bg = LabeledSlider(
             "Brilho Background", 0.0, 0.5, 0.01, self.cfg.get("FREQ_BG_BRIGHTNESS"),
         )
-        self.w_freq_bg.valueChanged.connect(
+        self.w_freq_bg.committed.connect(
             lambda v: self._set("FREQ_BG_BRIGHTNESS", v)
         )
         fl.addWidget(self.w_freq_bg)
@@ -139,7 +143,7 @@ class TabEffects(QScrollArea):
         self.w_hybrid_intensity = LabeledSlider(
             "Chase Intensity", 0.0, 1.0, 0.05, self.cfg.get("HYBRID_CHASE_INTENSITY"),
         )
-        self.w_hybrid_intensity.valueChanged.connect(
+        self.w_hybrid_intensity.committed.connect(
             lambda v: self._set("HYBRID_CHASE_INTENSITY", v)
         )
         hl.addWidget(self.w_hybrid_intensity)
@@ -147,7 +151,7 @@ class TabEffects(QScrollArea):
         self.w_hybrid_speed = LabeledSlider(
             "Chase Speed", 0.1, 2.0, 0.1, self.cfg.get("HYBRID_CHASE_SPEED"),
         )
-        self.w_hybrid_speed.valueChanged.connect(
+        self.w_hybrid_speed.committed.connect(
             lambda v: self._set("HYBRID_CHASE_SPEED", v)
         )
         hl.addWidget(self.w_hybrid_speed)
@@ -155,7 +159,7 @@ class TabEffects(QScrollArea):
         self.w_hybrid_tail = LabeledIntSlider(
             "Chase Tail", 1, 20, self.cfg.get("HYBRID_CHASE_TAIL"), " LEDs",
         )
-        self.w_hybrid_tail.valueChanged.connect(
+        self.w_hybrid_tail.committed.connect(
             lambda v: self._set("HYBRID_CHASE_TAIL", v)
         )
         hl.addWidget(self.w_hybrid_tail)
@@ -173,11 +177,12 @@ class TabEffects(QScrollArea):
         layout.addWidget(grp_hybrid)
 
         layout.addStretch()
+        container.setUpdatesEnabled(True)
         self.setWidget(container)
 
     def _set(self, key, val):
-        self.cfg.set(key, val)
-        self.cfg.apply_to_config_module()
+        if self.cfg.set(key, val):  # o apply sai no fim da rajada
+            self._apply_timer.start()
 
     def reload_values(self):
         self.w_chase_enabled.setChecked(self.cfg.get("CHASE_ENABLED"))
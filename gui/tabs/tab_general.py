@@ -7,7 +7,7 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt
 
-from gui.widgets import LabeledCombo, LabeledToggle, LabeledSlider
+from gui.widgets import LabeledCombo, LabeledToggle, LabeledSlider, make_apply_timer
 from config_manager import ConfigManager
 
 
@@ -15,10 +15,14 @@ class TabGeneral(QScrollArea):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.cfg = ConfigManager()
+
+        self._apply_timer = make_apply_timer(self, self.cfg.apply_to_config_module)
+
         self.setWidgetResizable(True)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
 
         container = QWidget()
+        container.setUpdatesEnabled(False)  # um layout só, no fim da montagem
         layout = QVBoxLayout(container)
         layout.setSpacing(12)
 
@@ -100,7 +104,7 @@ class TabGeneral(QScrollArea):
             self.cfg.get("LED_SKIP_START", 0),
             description="Quantos LEDs ignorar no início da fita",
         )
-        self.w_skip_start.valueChanged.connect(
+        self.w_skip_start.committed.connect(
             lambda v: self._set("LED_SKIP_START", int(v))
         )
         leds_layout.addWidget(self.w_skip_start)
@@ -110,7 +114,7 @@ class TabGeneral(QScrollArea):
             self.cfg.get("LED_SKIP_END", 0),
             description="Quantos LEDs ignorar no final da fita",
         )
-        self.w_skip_end.valueChanged.connect(
+        self.w_skip_end.committed.connect(
             lambda v: self._set("LED_SKIP_END", int(v))
         )
         leds_layout.addWidget(self.w_skip_end)
@@ -135,7 +139,7 @@ class TabGeneral(QScrollArea):
             self.cfg.get("MAX_FPS", 60),
             description="Limita quantas vezes por segundo os LEDs atualizam",
         )
-        self.w_fps_limit.valueChanged.connect(
+        self.w_fps_limit.committed.connect(
             lambda v: self._set("MAX_FPS", int(v))
         )
         perf_layout.addWidget(self.w_fps_limit)
@@ -145,7 +149,7 @@ class TabGeneral(QScrollArea):
             self.cfg.get("STANDBY_FPS", 15),
             description="FPS quando a música está pausada (economia de CPU)",
         )
-        self.w_standby_fps.valueChanged.connect(
+        self.w_standby_fps.committed.connect(
             lambda v: self._set("STANDBY_FPS", int(v))
         )
         perf_layout.addWidget(self.w_standby_fps)
@@ -153,11 +157,12 @@ class TabGeneral(QScrollArea):
         layout.addWidget(grp_perf)
 
         layout.addStretch()
+        container.setUpdatesEnabled(True)
         self.setWidget(container)
 
     def _set(self, key, val):
-        self.cfg.set(key, val)
-        self.cfg.apply_to_config_module()
+        if self.cfg.set(key, val):  # o apply sai no fim da rajada
+            self._apply_timer.start()
 
     def _load_startup_state(self):
         """Carrega o estado atual do startup."""
@@ -3,19 +3,51 @@
 Widgets customizados reutilizáveis para a GUI.
 """
 
+from functools import partial
+
 from PyQt6.QtWidgets import (
     QWidget, QHBoxLayout, QVBoxLayout, QLabel, QSlider,
     QSpinBox, QDoubleSpinBox, QComboBox, QCheckBox,
     QGroupBox, QPushButton, QColorDialog, QFrame,
     QSizePolicy, QGridLayout,
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QSignalBlocker
 from PyQt6.QtGui import QColor, QPainter, QBrush, QPen
 
 
+# Quieto por esse tempo depois da última mudança = valor "commitado"
+COMMIT_DELAY_MS = 80
+
+
+def _commit_timer(widget) -> QTimer:
+    """Timer single-shot do debounce de committed, filho do widget."""
+    timer = QTimer(widget)
+    timer.setSingleShot(True)
+    timer.setInterval(COMMIT_DELAY_MS)
+    timer.timeout.connect(widget._commit)
+    return timer
+
+
+def make_apply_timer(owner, slot, ms: int = 50) -> QTimer:
+    """
+    Timer single-shot das abas: cada mudança reinicia, e o slot (o apply
+    do config) roda uma vez só no fim da rajada.
+    """
+    timer = QTimer(owner)
+    timer.setSingleShot(True)
+    timer.setInterval(ms)
+    timer.timeout.connect(slot)
+    return timer
+
+
 class LabeledSlider(QWidget):
-    """Slider com label, valor e range configurável."""
+    """
+    Slider com label, valor e range configurável.
+    valueChanged sai a cada passo; committed só quando o usuário solta o
+    slider ou para de mexer por COMMIT_DELAY_MS.
+    """
     valueChanged = pyqtSignal(float)
+    committed = pyqtSignal(float)
 
     def __init__(
         self,
@@ -64,6 +96,7 @@ class LabeledSlider(QWidget):
         self._slider.setSingleStep(1)
         self._slider.setValue(int(value * self._multiplier))
         self._slider.valueChanged.connect(self._on_slider_change)
+        self._slider.sliderReleased.connect(self._flush_commit)
         slider_row.addWidget(self._slider)
 
         self._spinbox = QDoubleSpinBox()
@@ -79,6 +112,7 @@ class LabeledSlider(QWidget):
 
         self._update_label(value)
         self._updating = False
+        self._commit_timer = _commit_timer(self)
 
     def _on_slider_change(self, raw):
         if self._updating:
@@ -88,6 +122,7 @@ class LabeledSlider(QWidget):
         self._spinbox.setValue(val)
         self._update_label(val)
         self.valueChanged.emit(val)
+        self._commit_timer.start()
         self._updating = False
 
     def _on_spinbox_change(self, val):
@@ -97,6 +132,7 @@ class LabeledSlider(QWidget):
         self._slider.setValue(int(val * self._multiplier))
         self._update_label(val)
         self.valueChanged.emit(val)
+        self._commit_timer.start()
         self._updating = False
 
     def _update_label(self, val):
@@ -117,10 +153,19 @@ class LabeledSlider(QWidget):
         self._update_label(val)
         self._updating = False
 
+    def _commit(self):
+        self._commit_timer.stop()
+        self.committed.emit(self.value())
+
+    def _flush_commit(self):
+        if self._commit_timer.isActive():
+            self._commit()
+
 
 class LabeledIntSlider(QWidget):
-    """Slider para valores inteiros."""
+    """Slider para valores inteiros (mesmos sinais do LabeledSlider)."""
     valueChanged = pyqtSignal(int)
+    committed = pyqtSignal(int)
 
     def __init__(
         self,
@@ -170,7 +215,9 @@ class LabeledIntSlider(QWidget):
 
         self._suffix = suffix
         self._updating = False
+        self._commit_timer = _commit_timer(self)
         self._slider.valueChanged.connect(self._on_slider)
+        self._slider.sliderReleased.connect(self._flush_commit)
         self._spinbox.valueChanged.connect(self._on_spinbox)
 
     def _on_slider(self, v):
@@ -180,6 +227,7 @@ class LabeledIntSlider(QWidget):
         self._spinbox.setValue(v)
         self._value_label.setText(f"{v}{self._suffix}")
         self.valueChanged.emit(v)
+        self._commit_timer.start()
         self._updating = False
 
     def _on_spinbox(self, v):
@@ -189,6 +237,7 @@ class LabeledIntSlider(QWidget):
         self._slider.setValue(v)
         self._value_label.setText(f"{v}{self._suffix}")
         self.valueChanged.emit(v)
+        self._commit_timer.start()
         self._updating = False
 
     def value(self) -> int:
@@ -201,6 +250,14 @@ class LabeledIntSlider(QWidget):
         self._value_label.setText(f"{val}{self._suffix}")
         self._updating = False
 
+    def _commit(self):
+        self._commit_timer.stop()
+        self.committed.emit(self.value())
+
+    def _flush_commit(self):
+        if self._commit_timer.isActive():
+            self._commit()
+
 
 class LabeledCombo(QWidget):
     """ComboBox com label."""
@@ -230,10 +287,13 @@ class LabeledCombo(QWidget):
             desc.setWordWrap(True)
             layout.addWidget(desc)
 
+        # Índice de cada opção: troca de item sem busca por texto
+        self._index = {opt: i for i, opt in enumerate(options)}
+
         self._combo = QComboBox()
         self._combo.addItems(options)
-        if current and current in options:
-            self._combo.setCurrentText(current)
+        if current in self._index:
+            self._combo.setCurrentIndex(self._index[current])
         self._combo.currentTextChanged.connect(self.currentTextChanged.emit)
         layout.addWidget(self._combo)
 
@@ -243,6 +303,15 @@ class LabeledCombo(QWidget):
     def setCurrentText(self, text: str):
         self._combo.setCurrentText(text)
 
+    def setCurrentValue(self, value: str):
+        """Seleciona a opção sem emitir currentTextChanged (valor desconhecido é ignorado)."""
+        idx = self._index.get(value)
+        if idx is None:
+            return
+        blocker = QSignalBlocker(self._combo)
+        self._combo.setCurrentIndex(idx)
+        blocker.unblock()
+
 
 class LabeledCheck(QWidget):
     """Checkbox com label e descrição."""
@@ -333,13 +402,19 @@ class ColorPickerButton(QWidget):
 
 
 class BrightnessMapEditor(QWidget):
-    """Editor visual para BRIGHTNESS_MAP com preview da curva."""
+    """
+    Editor visual para BRIGHTNESS_MAP com preview da curva.
+    mapChanged sai a cada passo de um ponto; committed uma vez por gesto
+    (soltou o slider, parou por COMMIT_DELAY_MS ou clicou num preset).
+    """
     mapChanged = pyqtSignal(list)
+    committed = pyqtSignal(list)
 
     def __init__(self, brightness_map: list, parent=None):
         super().__init__(parent)
 
         self._map = list(brightness_map)
+        self._commit_timer = _commit_timer(self)
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -377,6 +452,7 @@ class BrightnessMapEditor(QWidget):
             slider.setRange(0, 1000)
             slider.setValue(int(out * 1000))
             slider.valueChanged.connect(lambda v, idx=i: self._on_point_change(idx, v / 1000.0))
+            slider.sliderReleased.connect(self._flush_commit)
             row.addWidget(slider)
 
             lbl_out = QLabel(f"{out:.3f}")
@@ -408,7 +484,8 @@ class BrightnessMapEditor(QWidget):
         self._map[idx] = (self._map[idx][0], val)
         self._point_sliders[idx][1].setText(f"{val:.3f}")
         self._curve_widget.set_map(self._map)
-        self.mapChanged.emit(self._map)
+        self.mapChanged.emit(list(self._map))  # cópia: quem recebe guarda o valor
+        self._commit_timer.start()
 
     def _apply_preset(self, preset):
         self._map = list(preset)
@@ -441,6 +518,7 @@ class BrightnessMapEditor(QWidget):
             slider.setRange(0, 1000)
             slider.setValue(int(out * 1000))
             slider.valueChanged.connect(lambda v, idx=i: self._on_point_change(idx, v / 1000.0))
+            slider.sliderReleased.connect(self._flush_commit)
             row.addWidget(slider)
 
             lbl_out = QLabel(f"{out:.3f}")
@@ -452,7 +530,16 @@ class BrightnessMapEditor(QWidget):
             self._point_sliders.append((slider, lbl_out, inp))
 
         self._curve_widget.set_map(self._map)
-        self.mapChanged.emit(self._map)
+        self.mapChanged.emit(list(self._map))  # cópia: quem recebe guarda o valor
+        self._commit()
+
+    def _commit(self):
+        self._commit_timer.stop()
+        self.committed.emit(list(self._map))
+
+    def _flush_commit(self):
+        if self._commit_timer.isActive():
+            self._commit()
 
     def get_map(self) -> list:
         return list(self._map)
@@ -588,6 +675,52 @@ class Separator(QFrame):
         self.setFrameShadow(QFrame.Shadow.Sunken)
         self.setStyleSheet("background-color: #333; max-height: 1px; margin: 8px 0;")
 
+
+def reload_widgets(owner, table, values):
+    """
+    Põe values nos widgets de table ((attr, key, setter) por linha, na mesma
+    ordem) com os sinais bloqueados: recarregar não reescreve no config o
+    que veio dele.
+    """
+    for (attr, _, setter), value in zip(table, values):
+        widget = getattr(owner, attr)
+        blocker = QSignalBlocker(widget)
+        getattr(widget, setter)(value)
+        blocker.unblock()
+
+
+# Os slots das abas vivem na thread da GUI: entrega direta, sem checar thread
+_DIRECT = Qt.ConnectionType.DirectConnection
+
+
+def add_sliders(owner, layout, specs, get, slot):
+    """
+    Monta LabeledSliders a partir de specs
+    (attr, key, label, min, max, step, suffix, description); None vira Separator.
+    Cada slider vira owner.<attr> e manda committed pra slot(key, valor).
+    """
+    for spec in specs:
+        if spec is None:
+            layout.addWidget(Separator())
+            continue
+        attr, key, label, min_val, max_val, step, suffix, description = spec
+        widget = LabeledSlider(
+            label, min_val, max_val, step, get(key), suffix, description,
+        )
+        widget.committed.connect(partial(slot, key), _DIRECT)
+        setattr(owner, attr, widget)
+        layout.addWidget(widget)
+
+
+def add_combos(owner, layout, specs, get, slot):
+    """Igual a add_sliders, com specs (attr, key, label, options, description)."""
+    for attr, key, label, options, description in specs:
+        widget = LabeledCombo(label, options, get(key), description)
+        widget.currentTextChanged.connect(partial(slot, key), _DIRECT)
+        setattr(owner, attr, widget)
+        layout.addWidget(widget)
+
+
 class LabeledToggle(QWidget):
     """Toggle switch com label."""
     
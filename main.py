@@ -8,6 +8,7 @@ Spotify RGB Sync — Versão Otimizada
 
 import sys
 import os
+import math
 import time
 import signal
 import logging
@@ -15,6 +16,8 @@ import threading
 from pathlib import Path
 from typing import Optional, Tuple, List, Dict
 
+import numpy as np
+
 # Diretório do app
 if getattr(sys, 'frozen', False):
     APP_DIR = Path(sys.executable).parent
@@ -115,37 +118,44 @@ def get_led_config(rgb) -> Tuple[int, List[Dict]]:
     return (configured if configured and configured > 0 else usable), devices
 
 
-def map_colors(colors: List[RGB], count: int, devices: List[Dict]) -> List[List[RGB]]:
-    """Mapeia cores virtuais pra LEDs reais (versão otimizada)."""
+def to_tuples(frame: np.ndarray) -> List[RGB]:
+    """Converte um frame (N, 3) pra lista de (r, g, b) — só na saída pro driver."""
+    return list(map(tuple, frame.tolist()))
+
+
+def map_colors(colors, count: int, devices: List[Dict]) -> List[List[RGB]]:
+    """
+    Mapeia cores virtuais pra LEDs reais (versão otimizada).
+
+    colors: frame (N, 3) ou lista de (r, g, b).
+    """
     total = sum(d["leds"] for d in devices)
     skip_s = getattr(config, 'LED_SKIP_START', 0)
     skip_e = getattr(config, 'LED_SKIP_END', 0)
     
-    full = [(0, 0, 0)] * total
     usable = total - skip_s - skip_e
     
-    if usable <= 0 or not colors:
-        return [[full[0]] * d["leds"] for d in devices]
+    if usable <= 0 or len(colors) == 0:
+        return [[(0, 0, 0)] * d["leds"] for d in devices]
     
-    n_colors = len(colors)
-    for i in range(usable):
-        pos = (i / max(1, usable - 1)) * max(1, n_colors - 1) if n_colors > 1 else 0
-        idx = int(pos)
-        frac = pos - idx
-        c1 = colors[min(idx, n_colors - 1)]
-        c2 = colors[min(idx + 1, n_colors - 1)]
-        
-        full[skip_s + i] = (
-            int(c1[0] + (c2[0] - c1[0]) * frac),
-            int(c1[1] + (c2[1] - c1[1]) * frac),
-            int(c1[2] + (c2[2] - c1[2]) * frac),
-        )
+    src = np.asarray(colors, dtype=np.float64)
+    n_colors = len(src)
+
+    # Posição de cada LED real na lista virtual
+    pos = np.linspace(0.0, n_colors - 1, usable) if usable > 1 else np.zeros(1)
+    idx = pos.astype(np.intp)
+    frac = (pos - idx)[:, None]
+    c1 = src[np.minimum(idx, n_colors - 1)]
+    c2 = src[np.minimum(idx + 1, n_colors - 1)]
+
+    full = np.zeros((total, 3), dtype=np.uint8)
+    full[skip_s:skip_s + usable] = c1 + (c2 - c1) * frac
     
     result = []
     offset = 0
     for d in devices:
         n = d["leds"]
-        result.append(full[offset:offset + n])
+        result.append(to_tuples(full[offset:offset + n]))
         offset += n
     return result
 
@@ -202,8 +212,10 @@ def run_engine():
             from band_module import BandVisualizer
             
             led_count, devices = get_led_config(rgb)
+            # Ajustes da GUI: o viz relê os parâmetros quando o apply troca
+            # o config.CFG (ver BandVisualizer.generate)
             viz = BandVisualizer(led_count)
-            
+
             class Effect:
                 __slots__ = ('viz', 'devices', 'led_count', 'last_color', 'last_url', 'colors')
                 def __init__(self):
@@ -250,9 +262,10 @@ def run_engine():
     
     while state.running:
         now = time.monotonic()
+        cfg = config.CFG  # snapshot do frame (o apply da GUI troca o objeto)
         
         # ── Polling Spotify ──
-        if now - last_poll > (config.POLL_IDLE if state.standby else config.POLL_INTERVAL):
+        if now - last_poll > (cfg.POLL_IDLE if state.standby else cfg.POLL_INTERVAL):
             last_poll = now
             
             try:
@@ -300,10 +313,9 @@ def run_engine():
         if state.standby:
             # Breathing
             if standby_effect:
-                import math
-                speed = getattr(config, 'STANDBY_BREATHING_SPEED', 0.025)
-                min_b = getattr(config, 'STANDBY_BRIGHTNESS_MIN', 0.15)
-                max_b = getattr(config, 'STANDBY_BRIGHTNESS_MAX', 0.40)
+                speed = cfg.STANDBY_BREATHING_SPEED
+                min_b = cfg.STANDBY_BRIGHTNESS_MIN
+                max_b = cfg.STANDBY_BRIGHTNESS_MAX
                 
                 standby_effect.phase += speed
                 if standby_effect.phase > 6.283:
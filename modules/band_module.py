@@ -7,9 +7,11 @@ Suporta múltiplos esquemas de cores:
   - triadic, analogous, etc: Deriva cores a partir da dominante
 """
 
-import colorsys
 import logging
-from typing import List, Tuple, Optional, Dict
+from functools import lru_cache
+from typing import List, Tuple, Optional, Dict, Union
+
+import numpy as np
 
 import config
 
@@ -17,156 +19,199 @@ logger = logging.getLogger(__name__)
 
 RGB = Tuple[int, int, int]
 
+# Frame de LEDs: array (N, 3) uint8 contíguo
+Frame = np.ndarray
 
-# band_module.py (adicionar no topo, depois dos imports)
 
-def map_intensity_to_brightness(intensity: float) -> float:
-    """
-    Mapeia intensidade do áudio (0-1) pra brilho do LED (0-1).
-    Usa a curva definida em BRIGHTNESS_MAP do config.
-    
-    Interpola linearmente entre os pontos definidos.
-    """
-    # Pega o mapa do config
-    brightness_map = getattr(config, 'BRIGHTNESS_MAP', [
-        (0.0, 0.001),
-        (0.5, 0.30),
-        (1.0, 1.00),
-    ])
-    
+# ══════════════════════════════════════════════════
+# CURVA DE BRILHO (LUT)
+# ══════════════════════════════════════════════════
+
+# Resolução da LUT: intensidade quantizada em 1/1024
+BRIGHT_LUT_SIZE = 1024
+
+_DEFAULT_BRIGHTNESS_MAP = [
+    (0.0, 0.001),
+    (0.5, 0.30),
+    (1.0, 1.00),
+]
+
+# LUT atual + o objeto BRIGHTNESS_MAP que gerou ela
+_bright_lut: Optional[np.ndarray] = None
+_bright_lut_src = None
+
+
+def _build_brightness_lut(brightness_map) -> np.ndarray:
+    """Amostra a curva BRIGHTNESS_MAP em BRIGHT_LUT_SIZE + 1 pontos."""
     # Garante que tá ordenado
     brightness_map = sorted(brightness_map, key=lambda x: x[0])
-    
-    # Clamp
-    intensity = max(0.0, min(1.0, intensity))
-    
-    # Se só tem 1 ponto, retorna ele
-    if len(brightness_map) == 1:
-        return brightness_map[0][1]
-    
-    # Encontra os dois pontos pra interpolar
-    for i in range(len(brightness_map) - 1):
-        x0, y0 = brightness_map[i]
-        x1, y1 = brightness_map[i + 1]
-        
-        if x0 <= intensity <= x1:
-            # Interpolação linear
-            if x1 == x0:
-                return y0
-            t = (intensity - x0) / (x1 - x0)
-            return y0 + (y1 - y0) * t
-    
-    # Se passou de todos, retorna o último
-    return brightness_map[-1][1]
+    xs = [p[0] for p in brightness_map]
+    ys = [p[1] for p in brightness_map]
 
+    samples = np.linspace(0.0, 1.0, BRIGHT_LUT_SIZE + 1)
+    return np.interp(samples, xs, ys).astype(np.float32)
 
-def render_zone(count: int, band_color: RGB, intensity: float,
-                beat: float, zone_name: str) -> List[RGB]:
+
+def get_brightness_lut() -> np.ndarray:
     """
-    Renderiza os LEDs de uma zona.
-    
-    Color shift agora é mais interessante:
-    - Pode ir pro branco (flash)
-    - Pode ir pro complementar (mais colorido)
-    - Pode aumentar saturação (mais vibrante)
+    Retorna a LUT de brilho, reconstruindo só se BRIGHTNESS_MAP mudou.
+
+    O config manager troca o objeto da lista a cada apply, então
+    comparar identidade basta pra detectar mudança.
     """
-    import colorsys
-    
-    beat_amount = getattr(config, 'BAND_BEAT_FLASH', 0.50)
-    beat_shift = getattr(config, 'BAND_BEAT_COLOR_SHIFT', 0.25)
-    gradient = getattr(config, 'BAND_INTERNAL_GRADIENT', 0.20)
-    
-    # Pega o modo de color shift
-    shift_mode = getattr(config, 'BAND_COLOR_SHIFT_MODE', 'white')
-    # Opções: 'white', 'saturate', 'complement', 'warm', 'cool'
+    global _bright_lut, _bright_lut_src
 
-    colors = []
+    brightness_map = getattr(config, 'BRIGHTNESS_MAP', _DEFAULT_BRIGHTNESS_MAP)
+    if _bright_lut is None or brightness_map is not _bright_lut_src:
+        _bright_lut = _build_brightness_lut(brightness_map)
+        _bright_lut_src = brightness_map
+    return _bright_lut
+
+
+def map_intensity_to_brightness_array(intensity: np.ndarray) -> np.ndarray:
+    """
+    Mapeia intensidade do áudio (0-1) pra brilho do LED (0-1), pela curva
+    BRIGHTNESS_MAP do config: lookup na LUT pro array inteiro de uma vez.
+    """
+    idx = (np.clip(intensity, 0.0, 1.0) * BRIGHT_LUT_SIZE).astype(np.int32)
+    return get_brightness_lut()[idx]
+
+
+# Offsets n de cada canal (R, G, B) na fórmula k = (n + h*6) mod 6
+_HSV_K_OFFSETS = np.array([5.0, 3.0, 1.0])
+
+
+def _hsv_to_rgb_array(h: np.ndarray, s: np.ndarray, v: np.ndarray) -> np.ndarray:
+    """
+    Converte arrays h, s, v (0-1) pra array (N,3) RGB (0-1).
+    Mesma fórmula sem branches de _fast_hsv2rgb.
+    """
+    k = (_HSV_K_OFFSETS[None, :] + np.asarray(h)[..., None] * 6.0) % 6.0
+    f = np.clip(np.minimum(k, 4.0 - k), 0.0, 1.0)
+    v = np.asarray(v)[..., None]
+    return v - v * np.asarray(s)[..., None] * f
+
+
+# Modos de color shift → id inteiro (resolvido uma vez, fora do frame)
+SHIFT_MODES = {
+    "white":      0,
+    "saturate":   1,
+    "complement": 2,
+    "warm":       3,
+    "cool":       4,
+}
+
+# Hue alvo dos modos warm/cool
+_TARGET_HUE_WARM = 0.08  # Laranja
+_TARGET_HUE_COOL = 0.55  # Ciano
+
+
+def shift_mode_id(name: Optional[str] = None) -> int:
+    """Converte BAND_COLOR_SHIFT_MODE (string) pro id usado no render."""
+    if name is None:
+        name = getattr(config, 'BAND_COLOR_SHIFT_MODE', 'white')
+    return SHIFT_MODES.get(str(name).lower(), -1)
+
+
+# Maior fração de 0-255 que cada modo move por unidade de shift
+# (white: 1.0; saturate: +0.5 em s; complement: 0.3; warm/cool: 0.4)
+_SHIFT_GAIN = {0: 1.0, 1: 0.5, 2: 0.3, 3: 0.4, 4: 0.4}
+
+# Quanto cada modo HSV soma no V por unidade de shift
+_SHIFT_V_GAIN = {1: 0.3, 2: 0.2, 3: 0.2, 4: 0.2}
+
+
+def _shift_hue_sat(h, s, shift, mode_id: int):
+    """
+    Parte h/s do color shift dos modos HSV (escalares ou arrays por zona).
+    O V é tratado à parte (ver _SHIFT_V_GAIN), porque varia por LED.
+    """
+    if mode_id == 1:
+        # Aumenta saturação (mais vibrante)
+        return h, np.minimum(1.0, s + shift * 0.5)
+
+    if mode_id == 2:
+        # Shift pro complementar: interpola até h_comp (h_comp - h = ±0.5)
+        return (h + np.where(h < 0.5, 0.5, -0.5) * shift * 0.3) % 1.0, s
+
+    # Shift pro laranja (warm) ou ciano (cool)
+    target_h = _TARGET_HUE_WARM if mode_id == 3 else _TARGET_HUE_COOL
+    return (h + (target_h - h) * shift * 0.4) % 1.0, s
+
+
+class _BandParams:
+    """
+    Snapshot dos parâmetros BAND_* do config.
+
+    Lido uma vez (e em reload_params) em vez de getattr por zona por frame.
+    """
+
+    __slots__ = ('beat_amount', 'beat_shift', 'gradient', 'shift_id',
+                 'blend_width', 'lerp_rate')
+
+    def __init__(self):
+        self.beat_amount = getattr(config, 'BAND_BEAT_FLASH', 0.50)
+        self.beat_shift = getattr(config, 'BAND_BEAT_COLOR_SHIFT', 0.25)
+        self.gradient = getattr(config, 'BAND_INTERNAL_GRADIENT', 0.20)
+        self.shift_id = shift_mode_id()
+        self.blend_width = getattr(config, 'BAND_ZONE_BLEND_WIDTH', 2)
+        self.lerp_rate = getattr(config, 'BAND_COLOR_LERP', 0.12)
+
+
+def build_shade_lut(band_color: RGB) -> np.ndarray:
+    """
+    Tabela (BRIGHT_LUT_SIZE + 1, 3) uint8 com a cor já escalada
+    por cada nível de brilho quantizado (k / BRIGHT_LUT_SIZE).
+    """
+    levels = np.linspace(0.0, 1.0, BRIGHT_LUT_SIZE + 1)[:, None]
+    return (np.asarray(band_color, dtype=np.float64)[None, :] * levels).astype(np.uint8)
 
-    for i in range(count):
-        # ── Gradiente interno ──
-        if count > 1:
-            center_dist = abs((i / (count - 1)) - 0.5) * 2.0
-        else:
-            center_dist = 0.0
-        grad_factor = 1.0 - (center_dist * gradient)
-
-        # ── Mapeamento de intensidade → brilho ──
-        effective_intensity = intensity * grad_factor
-        bright = map_intensity_to_brightness(effective_intensity)
-
-        # ── Beat adiciona flash ──
-        bright = min(1.0, bright + beat * beat_amount)
-
-        # ── Cor base com brilho ──
-        r = int(band_color[0] * bright)
-        g = int(band_color[1] * bright)
-        b = int(band_color[2] * bright)
-
-        # ══════════════════════════════════════════════════
-        # COLOR SHIFT NO BEAT
-        # ══════════════════════════════════════════════════
-        if beat > 0.01 and beat_shift > 0.01:
-            shift = beat * beat_shift
-            
-            if shift_mode == 'white':
-                # Shift pro branco (original)
-                r = min(255, int(r + (255 - r) * shift))
-                g = min(255, int(g + (255 - g) * shift))
-                b = min(255, int(b + (255 - b) * shift))
-            
-            elif shift_mode == 'saturate':
-                # Aumenta saturação (mais vibrante)
-                h, s, v = colorsys.rgb_to_hsv(r / 255, g / 255, b / 255)
-                s = min(1.0, s + shift * 0.5)
-                v = min(1.0, v + shift * 0.3)
-                r2, g2, b2 = colorsys.hsv_to_rgb(h, s, v)
-                r, g, b = int(r2 * 255), int(g2 * 255), int(b2 * 255)
-            
-            elif shift_mode == 'complement':
-                # Shift pro complementar (mais dramático)
-                h, s, v = colorsys.rgb_to_hsv(r / 255, g / 255, b / 255)
-                h_comp = (h + 0.5) % 1.0
-                # Interpola entre original e complementar
-                h_new = h + (h_comp - h) * shift * 0.3
-                v = min(1.0, v + shift * 0.2)
-                r2, g2, b2 = colorsys.hsv_to_rgb(h_new % 1.0, s, v)
-                r, g, b = int(r2 * 255), int(g2 * 255), int(b2 * 255)
-            
-            elif shift_mode == 'warm':
-                # Shift pro amarelo/laranja
-                h, s, v = colorsys.rgb_to_hsv(r / 255, g / 255, b / 255)
-                target_h = 0.08  # Laranja
-                h_new = h + (target_h - h) * shift * 0.4
-                v = min(1.0, v + shift * 0.2)
-                r2, g2, b2 = colorsys.hsv_to_rgb(h_new % 1.0, s, v)
-                r, g, b = int(r2 * 255), int(g2 * 255), int(b2 * 255)
-            
-            elif shift_mode == 'cool':
-                # Shift pro ciano/azul
-                h, s, v = colorsys.rgb_to_hsv(r / 255, g / 255, b / 255)
-                target_h = 0.55  # Ciano
-                h_new = h + (target_h - h) * shift * 0.4
-                v = min(1.0, v + shift * 0.2)
-                r2, g2, b2 = colorsys.hsv_to_rgb(h_new % 1.0, s, v)
-                r, g, b = int(r2 * 255), int(g2 * 255), int(b2 * 255)
-
-        colors.append((min(255, max(0, r)), min(255, max(0, g)), min(255, max(0, b))))
-
-    return colors
 
 # ══════════════════════════════════════════════════
 # HELPERS
 # ══════════════════════════════════════════════════
 
+def _fast_hsv2rgb(h: float, s: float, v: float) -> Tuple[float, float, float]:
+    """
+    HSV (0-1) → RGB (0-1) sem branches.
+    Cada canal: v - v*s*max(0, min(k, 4-k, 1)), com k = (n + h*6) mod 6.
+    """
+    h6 = h * 6.0
+    vs = v * s
+    k = (5.0 + h6) % 6.0
+    r = v - vs * max(0.0, min(k, 4.0 - k, 1.0))
+    k = (3.0 + h6) % 6.0
+    g = v - vs * max(0.0, min(k, 4.0 - k, 1.0))
+    k = (1.0 + h6) % 6.0
+    b = v - vs * max(0.0, min(k, 4.0 - k, 1.0))
+    return r, g, b
+
+
+def _fast_rgb2hsv(r: float, g: float, b: float) -> Tuple[float, float, float]:
+    """RGB (0-1) → HSV (0-1) pelas fórmulas de min/max."""
+    maxc = max(r, g, b)
+    delta = maxc - min(r, g, b)
+    if delta <= 0.0:
+        return 0.0, 0.0, maxc
+
+    if maxc == r:
+        h = (g - b) / delta
+    elif maxc == g:
+        h = 2.0 + (b - r) / delta
+    else:
+        h = 4.0 + (r - g) / delta
+    return (h / 6.0) % 1.0, delta / maxc, maxc
+
+
 def _hsv_to_rgb(h: float, s: float, v: float) -> RGB:
     """Converte HSV (0-1) pra RGB (0-255)."""
-    r, g, b = colorsys.hsv_to_rgb(h % 1.0, min(1.0, max(0.0, s)), min(1.0, max(0.0, v)))
+    r, g, b = _fast_hsv2rgb(h % 1.0, min(1.0, max(0.0, s)), min(1.0, max(0.0, v)))
     return (int(r * 255), int(g * 255), int(b * 255))
 
 
 def _rgb_to_hsv(color: RGB) -> Tuple[float, float, float]:
     """Converte RGB (0-255) pra HSV (0-1)."""
-    return colorsys.rgb_to_hsv(color[0] / 255, color[1] / 255, color[2] / 255)
+    return _fast_rgb2hsv(color[0] / 255, color[1] / 255, color[2] / 255)
 
 
 # ══════════════════════════════════════════════════
@@ -269,12 +314,22 @@ def generate_band_colors(base_color: RGB, album_url: Optional[str] = None) -> Di
     
     Senão:
       → Deriva cores a partir da base usando o scheme escolhido
+
+    O resultado é memoizado por (cor, scheme, álbum); limpe com
+    clear_band_colors_cache() quando o config mudar.
     
     Returns:
         {"percussion": RGB, "bass": RGB, "melody": RGB}
     """
     scheme_name = getattr(config, 'BAND_COLOR_SCHEME', 'triadic').lower()
-    
+    cached = _generate_band_colors_cached(tuple(base_color), scheme_name, album_url)
+    return dict(cached)
+
+
+@lru_cache(maxsize=128)
+def _generate_band_colors_cached(base_color: RGB, scheme_name: str,
+                                 album_url: Optional[str]) -> Dict[str, RGB]:
+    """Implementação de generate_band_colors (não mutar o retorno)."""
     # ── ALBUM COLORS: Usa cores reais da capa ──
     if scheme_name == "album_colors" and album_url:
         from color_module import generate_band_colors_from_album
@@ -309,6 +364,11 @@ def generate_band_colors(base_color: RGB, album_url: Optional[str] = None) -> Di
     return rgb_colors
 
 
+def clear_band_colors_cache():
+    """Descarta as cores de banda memoizadas."""
+    _generate_band_colors_cached.cache_clear()
+
+
 # ══════════════════════════════════════════════════
 # DISTRIBUIÇÃO DE LEDs
 # ══════════════════════════════════════════════════
@@ -342,82 +402,127 @@ def compute_zone_layout(total_leds: int) -> Dict[str, Dict[str, int]]:
 # ══════════════════════════════════════════════════
 
 class BandSmoother:
-    """Smoothing assimétrico por banda."""
+    """
+    Smoothing assimétrico por banda.
+
+    As 4 faixas (percussion, bass, melody, beat) ficam num array só e
+    são atualizadas juntas com um select sem branch.
+    """
+
+    # Índices no array de estado
+    _PERC, _BASS, _MEL, _BEAT = range(4)
 
     def __init__(self):
-        self.percussion = 0.0
-        self.bass = 0.0
-        self.melody = 0.0
-        self.beat = 0.0
+        self._state = np.zeros(4, dtype=np.float32)
+        self._target = np.zeros(4, dtype=np.float32)
+        self._residual = 0.0
+
+        # Na descida, as bandas fazem lerp até o alvo; o beat decai pra 0
+        self._decay_to_target = np.array([True, True, True, False])
+
+        self.reload_params()
 
+    def reload_params(self):
+        """Relê attack/decay do config."""
         self._attack = getattr(config, 'BAND_SMOOTHING_ATTACK', 0.25)
         self._decay  = getattr(config, 'BAND_SMOOTHING_DECAY', 0.06)
         self._beat_attack = getattr(config, 'BAND_BEAT_ATTACK', 0.5)
         self._beat_decay  = getattr(config, 'BAND_BEAT_DECAY', 0.90)
 
+        a, d = self._attack, self._decay
+        self._attack_arr = np.array([a, a, a, self._beat_attack], dtype=np.float32)
+        # beat *= decay ≡ lerp até 0 com taxa (1 - decay)
+        self._decay_arr = np.array([d, d, d, 1.0 - self._beat_decay], dtype=np.float32)
+
+    @property
+    def percussion(self) -> float:
+        return float(self._state[self._PERC])
+
+    @property
+    def bass(self) -> float:
+        return float(self._state[self._BASS])
+
+    @property
+    def melody(self) -> float:
+        return float(self._state[self._MEL])
+
+    @property
+    def beat(self) -> float:
+        return float(self._state[self._BEAT])
+
+    @property
+    def settled(self) -> bool:
+        """True se nenhuma faixa ainda anda mais que 1/255 rumo ao alvo."""
+        return self._residual < 1.0 / 255.0
+
     def update(self, raw_perc: float, raw_bass: float,
                raw_melody: float, raw_beat: float):
-        self.percussion = self._smooth(self.percussion, raw_perc)
-        self.bass       = self._smooth(self.bass, raw_bass)
-        self.melody     = self._smooth(self.melody, raw_melody)
-
-        if raw_beat > self.beat:
-            self.beat += (raw_beat - self.beat) * self._beat_attack
-        else:
-            self.beat *= self._beat_decay
-            if self.beat < 0.01:
-                self.beat = 0.0
+        state = self._state
+        target = self._target
+        target[:] = (raw_perc, raw_bass, raw_melody, raw_beat)
 
-    def _smooth(self, current: float, target: float) -> float:
-        rate = self._attack if target > current else self._decay
-        return current + (target - current) * rate
+        up = target > state
+        rate = np.where(up, self._attack_arr, self._decay_arr)
+        goal = np.where(up | self._decay_to_target, target, 0.0)
+        state += (goal - state) * rate
 
+        if state[self._BEAT] < 0.01 and not up[self._BEAT]:
+            state[self._BEAT] = 0.0
 
+        self._residual = float(np.abs(goal - state).max())
 
 
 # ══════════════════════════════════════════════════
 # TRANSIÇÃO ENTRE ZONAS
 # ══════════════════════════════════════════════════
 
-def blend_zone_borders(colors: List[RGB], layout: Dict, total_leds: int) -> List[RGB]:
-    """Suaviza as bordas entre zonas."""
-    blend_width = getattr(config, 'BAND_ZONE_BLEND_WIDTH', 2)
+BlendWindows = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
 
-    if blend_width <= 0 or total_leds < 6:
-        return colors
 
-    result = list(colors)
-    border1 = layout["percussion"]["end"]
-    border2 = layout["bass"]["end"]
+def compute_blend_windows(layout: Dict, total_leds: int,
+                          blend_width: int) -> Optional[BlendWindows]:
+    """
+    Pré-calcula os índices e pesos do blend nas fronteiras.
 
-    for border in [border1, border2]:
-        for offset in range(-blend_width, blend_width + 1):
-            idx = border + offset
-            if idx < 0 or idx >= total_leds:
-                continue
+    Returns:
+        (idx, left, right, mix) ou None se não tem blend
+    """
+    if blend_width <= 0 or total_leds < 6:
+        return None
+
+    offsets = np.arange(-blend_width, blend_width + 1)
+    weights = np.clip(1.0 - np.abs(offsets) / (blend_width + 1), 0.0, None) * 0.5
 
-            left = max(0, idx - 1)
-            right = min(total_leds - 1, idx + 1)
-            dist = abs(offset) / (blend_width + 1)
-            mix = max(0.0, 1.0 - dist) * 0.5
+    idx_parts = []
+    mix_parts = []
+    for border in (layout["percussion"]["end"], layout["bass"]["end"]):
+        idx = border + offsets
+        valid = (idx >= 0) & (idx < total_leds)
+        idx_parts.append(idx[valid])
+        mix_parts.append(weights[valid])
 
-            cl = result[left]
-            cr = result[right]
+    idx = np.concatenate(idx_parts)
+    left = np.maximum(0, idx - 1)
+    right = np.minimum(total_leds - 1, idx + 1)
+    mix = np.concatenate(mix_parts).astype(np.float32)[:, None]
+    return idx, left, right, mix
 
-            blended = (
-                int(result[idx][0] * (1 - mix) + (cl[0] + cr[0]) / 2 * mix),
-                int(result[idx][1] * (1 - mix) + (cl[1] + cr[1]) / 2 * mix),
-                int(result[idx][2] * (1 - mix) + (cl[2] + cr[2]) / 2 * mix),
-            )
-            result[idx] = blended
 
-    return result
+def _blend_in_place(result: np.ndarray, windows: BlendWindows):
+    """Aplica o blend das fronteiras direto no array (N,3) float."""
+    idx, left, right, mix = windows
+    neighbors = (result[left] + result[right]) * 0.5
+    result[idx] = result[idx] * (1.0 - mix) + neighbors * mix
 
 
 # ══════════════════════════════════════════════════
 # VISUALIZADOR PRINCIPAL
 # ══════════════════════════════════════════════════
 
+# Ordem das zonas na fita (índice = zone_id)
+ZONES = ("percussion", "bass", "melody")
+
+
 class BandVisualizer:
     """Orquestrador principal das bandas visuais."""
 
@@ -433,11 +538,29 @@ class BandVisualizer:
             "melody":     (50, 150, 255),
         }
 
+        self._shade_lut = self._build_shade_luts()
+        self._band_hsv = self._compute_band_hsv()
+        self._precompute_strip()
+
         # URL do álbum atual (pra album_colors)
         self._album_url: Optional[str] = None
 
-        self._prev_colors: List[RGB] = [(0, 0, 0)] * total_leds
-        self._lerp_rate = getattr(config, 'BAND_COLOR_LERP', 0.12)
+        # Frame anterior em float (lerp acumula sem truncar)
+        self._prev_colors = np.zeros((total_leds, 3), dtype=np.float32)
+        self._lerp_tmp = np.empty((total_leds, 3), dtype=np.float32)
+
+        # Cache do último frame (silêncio/pause: mesma entrada, lerp parado)
+        self._frame_key: Optional[tuple] = None
+        self._frame: Optional[Frame] = None
+        self._frame_settled = False
+
+        # Parâmetros lidos do config (ver reload_params); _params_cfg é o
+        # config.CFG da leitura: o apply da GUI troca o objeto
+        self._params_cfg = config.CFG
+        self._params = _BandParams()
+        self._blend_windows = compute_blend_windows(
+            self.layout, total_leds, self._params.blend_width
+        )
 
         scheme = getattr(config, 'BAND_COLOR_SCHEME', 'triadic')
         
@@ -451,6 +574,70 @@ class BandVisualizer:
             f"(idx {self.layout['melody']['start']}-{self.layout['melody']['end']-1})"
         )
 
+    def reload_params(self):
+        """Relê os parâmetros BAND_* do config (ajuste ao vivo pela GUI)."""
+        # Antes de ler: um apply no meio da leitura troca o CFG de novo
+        self._params_cfg = config.CFG
+        self._params = _BandParams()
+        self.smoother.reload_params()
+        clear_band_colors_cache()
+        self._blend_windows = compute_blend_windows(
+            self.layout, self.total_leds, self._params.blend_width
+        )
+        self._frame_key = None
+
+    def invalidate_params(self, *_):
+        """
+        Força o reload dos parâmetros no próximo generate().
+
+        O caminho normal nem precisa disso: generate() relê sozinho quando
+        o apply_to_config_module() troca o config.CFG. Seguro de chamar de
+        outra thread.
+        """
+        self._params_cfg = None
+
+    def _build_shade_luts(self) -> np.ndarray:
+        """
+        Shade LUTs das 3 bandas empilhadas em (3, BRIGHT_LUT_SIZE + 1, 3),
+        na ordem de ZONES (refeitas só quando as cores mudam).
+        """
+        return np.stack([build_shade_lut(self.band_colors[name]) for name in ZONES])
+
+    def _compute_band_hsv(self) -> np.ndarray:
+        """
+        HSV (0-1) de cada banda, array (3, 3) na ordem de ZONES.
+        Escalar a cor pelo brilho não muda h nem s, então vale pra zona toda.
+        """
+        return np.array([_rgb_to_hsv(self.band_colors[name]) for name in ZONES])
+
+    def _precompute_strip(self):
+        """
+        Arrays por LED da fita inteira, fixos pro layout:
+        zone_id (0/1/2) e distância ao centro da própria zona.
+        """
+        zone_ids = []
+        center_dist = []
+        for zid, name in enumerate(ZONES):
+            count = self.layout[name]["count"]
+            zone_ids.append(np.full(count, zid, dtype=np.intp))
+            if count > 1:
+                center_dist.append(np.abs(np.linspace(0.0, 1.0, count) - 0.5) * 2.0)
+            else:
+                center_dist.append(np.zeros(count))
+
+        n = self.total_leds
+        self._zone_id = np.concatenate(zone_ids)[:n]
+        self._center_dist = np.concatenate(center_dist)[:n].astype(np.float32)
+        self._grad = None
+        self._grad_src = None
+
+    def _grad_factors(self, gradient: float) -> np.ndarray:
+        """Gradiente interno por LED; recalculado só se BAND_INTERNAL_GRADIENT mudar."""
+        if self._grad is None or gradient != self._grad_src:
+            self._grad = 1.0 - self._center_dist * gradient
+            self._grad_src = gradient
+        return self._grad
+
     def set_base_color(self, base_color: RGB, album_url: Optional[str] = None) -> List[RGB]:
         """
         Recalcula cores das bandas.
@@ -460,6 +647,9 @@ class BandVisualizer:
         """
         self._album_url = album_url
         self.band_colors = generate_band_colors(base_color, album_url)
+        self._shade_lut = self._build_shade_luts()
+        self._band_hsv = self._compute_band_hsv()
+        self._frame_key = None
         
         scheme = getattr(config, 'BAND_COLOR_SCHEME', 'triadic')
         logger.info(
@@ -486,14 +676,37 @@ class BandVisualizer:
         beat_intensity: float,
         volume: float,
         state: str,
-    ) -> List[RGB]:
+        out: Optional[bytearray] = None,
+    ) -> Union[Frame, bytearray]:
         """
-        Gera lista de cores pra todos os LEDs.
+        Gera o frame (N, 3) uint8 com as cores de todos os LEDs.
         
         CADA BANDA TEM SEU PRÓPRIO BRILHO baseado na sua intensidade.
         Se bass=0.1, zona do baixo fica ESCURA.
         Se percussion=0.9, zona da percussão fica CLARA.
+
+        Se out (bytearray de 3*N bytes) for passado, o frame é escrito
+        nele como RGBRGB... e o próprio out é retornado — sem alocar
+        nada pro driver que manda bytes crus.
+
+        Com a mesma entrada (quantizada em 1/255) e tudo já convergido,
+        devolve o frame anterior sem recalcular — o frame retornado é
+        somente leitura.
         """
+        # Só depois do apply o módulo config tem os valores novos
+        if config.CFG is not self._params_cfg:
+            self.reload_params()
+        params = self._params
+
+        # ══════════════════════════════════════════════
+        # CACHE (silêncio / pause)
+        # ══════════════════════════════════════════════
+        key = (int(bass * 255), int(melody * 255), int(percussion * 255),
+               int(beat_intensity * 255), state)
+        if key == self._frame_key and self._frame_settled:
+            return self._emit(self._frame, out)
+        self._frame_key = key
+
         # ══════════════════════════════════════════════
         # BEAT POR ZONA
         # ══════════════════════════════════════════════
@@ -528,55 +741,79 @@ class BandVisualizer:
         s_mel  = self.smoother.melody
 
         # ══════════════════════════════════════════════
-        # RENDERIZA CADA ZONA COM SUA INTENSIDADE
+        # RENDERIZA A FITA INTEIRA NUMA PASSADA
         # ══════════════════════════════════════════════
         # s_perc BAIXO → zona percussão ESCURA
         # s_bass BAIXO → zona baixo ESCURA
         # s_mel  BAIXO → zona melodia ESCURA
-        
-        perc_leds = render_zone(
-            self.layout["percussion"]["count"],
-            self.band_colors["percussion"],
-            s_perc,          # ← INTENSIDADE DA PERCUSSÃO
-            beat_perc,
-            "percussion"
-        )
-        bass_leds = render_zone(
-            self.layout["bass"]["count"],
-            self.band_colors["bass"],
-            s_bass,          # ← INTENSIDADE DO BAIXO
-            beat_bass,
-            "bass"
-        )
-        mel_leds = render_zone(
-            self.layout["melody"]["count"],
-            self.band_colors["melody"],
-            s_mel,           # ← INTENSIDADE DA MELODIA
-            beat_mel,
-            "melody"
-        )
+        # (cada LED pega intensidade, beat e cor da sua zona via zone_id)
+        zone_id = self._zone_id
+        intensities = np.array((s_perc, s_bass, s_mel), dtype=np.float32)
+        beats = np.array((beat_perc, beat_bass, beat_mel), dtype=np.float32)
+
+        # Gradiente interno + curva de brilho
+        grad = self._grad_factors(params.gradient)
+        bright = map_intensity_to_brightness_array(intensities[zone_id] * grad)
+
+        # Beat adiciona flash
+        bright = np.minimum(1.0, bright + beats[zone_id] * params.beat_amount)
+
+        # Cor base com brilho (lookup na shade LUT da zona)
+        lut_idx = (bright * BRIGHT_LUT_SIZE).astype(np.int32)
+        raw = self._shade_lut[zone_id, lut_idx].astype(np.float32)
+
+        # Color shift no beat (só nas zonas com beat visível)
+        mode_id = params.shift_id
+        if params.beat_shift > 0.01:
+            shifts = beats * params.beat_shift
+            visible = (beats > 0.01) & (shifts * _SHIFT_GAIN.get(mode_id, 0.0) * 255.0 >= 0.5)
+
+            if visible.any():
+                shifts = np.where(visible, shifts, 0.0)
+
+                if mode_id == 0:
+                    # Shift pro branco (original)
+                    raw += (255.0 - raw) * shifts[zone_id][:, None]
+
+                elif mode_id in _SHIFT_V_GAIN:
+                    # h/s por zona (3 conversões), V por LED
+                    h, s, v0 = self._band_hsv.T
+                    h, s = _shift_hue_sat(h, s, shifts, mode_id)
+                    unit = _hsv_to_rgb_array(h, s, np.ones(3)) * 255.0
+                    v = np.minimum(1.0, v0[zone_id] * bright
+                                   + shifts[zone_id] * _SHIFT_V_GAIN[mode_id])
+                    shifted = unit[zone_id] * v[:, None]
+                    raw = np.where(visible[zone_id][:, None], shifted, raw)
+
+                np.clip(raw, 0, 255, out=raw)
 
         # ══════════════════════════════════════════════
-        # JUNTA E SUAVIZA
+        # SUAVIZA
         # ══════════════════════════════════════════════
-        raw = perc_leds + bass_leds + mel_leds
-
         # Blend nas fronteiras
-        raw = blend_zone_borders(raw, self.layout, self.total_leds)
+        if self._blend_windows is not None:
+            _blend_in_place(raw, self._blend_windows)
 
         # Lerp com frame anterior (suavização visual)
-        final = []
-        for i, target in enumerate(raw):
-            prev = self._prev_colors[i]
-            lerped = (
-                int(prev[0] + (target[0] - prev[0]) * self._lerp_rate),
-                int(prev[1] + (target[1] - prev[1]) * self._lerp_rate),
-                int(prev[2] + (target[2] - prev[2]) * self._lerp_rate),
-            )
-            self._prev_colors[i] = lerped
-            final.append(lerped)
-
-        return final
+        tmp = self._lerp_tmp
+        np.subtract(raw, self._prev_colors, out=tmp)
+        lerp_done = tmp.size == 0 or float(np.abs(tmp).max()) < 1.0
+        np.multiply(tmp, params.lerp_rate, out=tmp)
+        self._prev_colors += tmp
+
+        self._frame_settled = lerp_done and self.smoother.settled
+        frame = self._prev_colors.astype(np.uint8)
+        frame.flags.writeable = False
+        self._frame = frame
+        return self._emit(frame, out)
+
+    def _emit(self, frame: Frame, out: Optional[bytearray]) -> Union[Frame, bytearray]:
+        """Entrega o frame: direto, ou copiado pro bytearray do chamador."""
+        if out is None:
+            return frame
+        dest = np.frombuffer(out, dtype=np.uint8).reshape(self.total_leds, 3)
+        np.copyto(dest, frame)
+        return out
 
 
 # ══════════════════════════════════════════════════
@@ -5,8 +5,11 @@ Foco: watercooler com 1/4 dos LEDs apagados no Direct mode.
 """
 
 import sys
+import threading
 import time
 
+import numpy as np
+
 try:
     from openrgb import OpenRGBClient
     from openrgb.utils import RGBColor
@@ -15,14 +18,327 @@ except ImportError:
     sys.exit(1)
 
 
+# ══════════════════════════════════════════════
+# TEXTOS FIXOS
+# ══════════════════════════════════════════════
+
+BANNER = """\
+
+============================================================
+  🌀 FIX: LEDs APAGADOS NO WATERCOOLER
+============================================================
+
+"""
+
+MENU = """\
+
+============================================================
+  PASSO 2: TENTANDO SOLUÇÕES
+============================================================
+
+  1. Resize de zona (OpenRGB)
+  2. Teste com mais LEDs no Direct
+  3. Teste zona por zona
+  4. Teste: Static primeiro, depois Direct
+  5. Teste: Enviar cores em partes
+  6. Ver instruções manuais
+  0. Sair
+"""
+
+HELP = """\
+
+============================================================
+  📋 INSTRUÇÕES MANUAIS - FIX NO OPENRGB
+============================================================
+
+  MÉTODO 1: RESIZE DE ZONA
+  ─────────────────────────
+  1. Abra o OpenRGB
+  2. Clique no device do watercooler
+     (provavelmente 'Aura Addressable X')
+  3. Na aba 'LEDs', veja quantos LEDs tem
+  4. Na aba 'Device Info' ou 'Zones':
+     - Encontre a zona que tem poucos LEDs
+     - Mude o número pra quantidade REAL
+     - Clique 'Resize Zone'
+  5. Salve o perfil
+
+  MÉTODO 2: OPENRGB SETTINGS
+  ───────────────────────────
+  1. OpenRGB → Settings → ASUS
+  2. Procure por 'ARGB Header' ou 'Addressable'
+  3. Aumente o número de LEDs configurado
+  4. Reinicie o OpenRGB
+
+  MÉTODO 3: OPENRGB.JSON
+  ───────────────────────
+  1. Feche o OpenRGB
+  2. Abra o arquivo:
+     %APPDATA%\\OpenRGB\\OpenRGB.json
+     OU a pasta onde o OpenRGB está instalado
+  3. Procure por 'Addressable' no JSON
+  4. Mude 'leds_count' pra o valor correto
+  5. Salve e reabra o OpenRGB
+
+  DICA: COMO SABER QUANTOS LEDs TEM?
+  ────────────────────────────────────
+  RiseMode 240mm geralmente tem:
+    - 2 ventoinhas de 120mm
+    - Cada ventoinha: 12-18 LEDs ARGB
+    - Bomba/bloco: 0-12 LEDs
+    - Total provável: 24-48 LEDs
+
+  Se no Static acendem X LEDs, configure
+  as zonas pra somar X no total.
+
+"""
+
+
+def _parse_int(text: str):
+    """Inteiro >= 0 digitado pelo usuário, ou None se não for um."""
+    try:
+        n = int(text.strip())
+    except ValueError:
+        return None
+    return n if n >= 0 else None
+
+
+def _write(text: str):
+    """Escreve um bloco de texto com um write e um flush só."""
+    sys.stdout.write(text)
+    sys.stdout.flush()
+
+
+# ══════════════════════════════════════════════
+# CORES
+# ══════════════════════════════════════════════
+
+# Um RGBColor por cor usada: as listas de N LEDs só repetem a referência
+_COLOR_POOL = {
+    rgb: RGBColor(*rgb)
+    for rgb in [
+        (0, 0, 0), (255, 255, 255), (50, 50, 50),
+        (255, 0, 0), (0, 255, 0), (0, 0, 255),
+        (255, 255, 0), (255, 0, 255), (0, 255, 255),
+        (255, 100, 0),
+    ]
+}
+
+
+# Cor (RGB) e nome de cada zona no teste zona por zona
+_ZONE_COLORS = (
+    ((255, 0, 0), "VERMELHO"),
+    ((0, 255, 0), "VERDE"),
+    ((0, 0, 255), "AZUL"),
+    ((255, 255, 0), "AMARELO"),
+    ((255, 0, 255), "MAGENTA"),
+    ((0, 255, 255), "CIANO"),
+)
+
+
+_BLACK = _COLOR_POOL[(0, 0, 0)]
+
+
+def _rgb(r: int, g: int, b: int):
+    """RGBColor compartilhado do pool (criado na primeira vez se faltar)."""
+    color = _COLOR_POOL.get((r, g, b))
+    if color is None:
+        color = _COLOR_POOL[(r, g, b)] = RGBColor(r, g, b)
+    return color
+
+
+def _to_colors(frame: np.ndarray) -> list:
+    """Frame (N, 3) uint8 → lista de RGBColor do pool, pro SDK."""
+    return [_rgb(*row) for row in frame.tolist()]
+
+
+# ══════════════════════════════════════════════
+# ESCRITA COM SHADOW
+# ══════════════════════════════════════════════
+
+# Último frame escrito em cada device (por índice); só escreve se mudar
+_shadow = {}
+
+
+def _push(dev_idx: int, dev, colors):
+    """set_colors só se o frame difere do último escrito no device."""
+    if _shadow.get(dev_idx) == colors:
+        return
+    dev.set_colors(colors)
+    _shadow[dev_idx] = list(colors)
+
+
+def _push_color(dev_idx: int, dev, color):
+    """set_color (device inteiro) só se algum LED ainda não tem essa cor."""
+    colors = [color] * len(dev.leds)
+    if _shadow.get(dev_idx) == colors:
+        return
+    dev.set_color(color)
+    _shadow[dev_idx] = colors
+
+
+def _blackout(argb_candidates):
+    """Apaga os devices; não faz nada nos que o shadow já diz estarem apagados."""
+    for dev_idx, dev in argb_candidates:
+        try:
+            _push_color(dev_idx, dev, _BLACK)
+        except Exception:
+            pass
+
+
+def _set_mode(dev_idx: int, dev, mode):
+    """
+    Troca o modo; o estado dos LEDs passa a ser desconhecido.
+    Nomes ('direct') são resolvidos pela tabela do device, sem a busca do SDK.
+    """
+    if isinstance(mode, str):
+        idx = _mode_idx(dev, dev_idx, mode.lower())
+        if idx is not None:
+            mode = idx
+    _shadow.pop(dev_idx, None)
+    dev.set_mode(mode)
+    _await_mode(dev)
+
+
+def _await_mode(dev, timeout: float = 0.2):
+    """
+    Espera o servidor aplicar o set_mode.
+
+    dev.update() é pedido com resposta: só volta depois que o servidor
+    processou o que veio antes no socket. Se falhar, espera o timeout.
+    """
+    t0 = time.monotonic()
+    try:
+        dev.update()
+        return
+    except Exception:
+        pass
+    remaining = timeout - (time.monotonic() - t0)
+    if remaining > 0:
+        time.sleep(remaining)
+
+
+# --fast: sem pausas cosméticas (as esperas do protocolo continuam)
+FAST_MODE = '--fast' in sys.argv
+
+# Terminal sem --fast: mantém as pausas pra dar tempo de ver os LEDs
+_interactive = sys.stdin.isatty() and not FAST_MODE
+
+
+def _pause(seconds: float):
+    """Pausa só pra quem está olhando; com --fast ou sem terminal não espera."""
+    if _interactive:
+        time.sleep(seconds)
+
+
+# ══════════════════════════════════════════════
+# MODOS
+# ══════════════════════════════════════════════
+
+# {dev_idx: {nome do modo em minúsculas: índice}}, montado no primeiro uso
+_MODE_CACHE = {}
+
+
+def _mode_idx(dev, dev_idx: int, name: str):
+    """Índice do modo pelo nome (None se o device não tem esse modo)."""
+    cache = _MODE_CACHE.get(dev_idx)
+    if cache is None:
+        cache = _MODE_CACHE[dev_idx] = {
+            m.name.lower(): i for i, m in enumerate(dev.modes)
+        }
+    return cache.get(name)
+
+
+# ══════════════════════════════════════════════
+# ENUMERAÇÃO
+# ══════════════════════════════════════════════
+
+UPDATE_TTL = 3.0  # segundos em que a enumeração dos devices é reaproveitada
+
+# Momento do último client.update() (0 = força na próxima chamada)
+_last_update = [0.0]
+
+
+def _maybe_update(client, ttl: float = UPDATE_TTL):
+    """client.update() só se a última enumeração tem mais de ttl segundos."""
+    now = time.monotonic()
+    if now - _last_update[0] < ttl:
+        return
+    try:
+        client.update()
+    except Exception:
+        return
+    _last_update[0] = now
+    
+    # Objetos e estado dos devices podem ter mudado
+    _shadow.clear()
+    _MODE_CACHE.clear()
+    _ZONE_META.clear()
+
+
+# ══════════════════════════════════════════════
+# ZONAS
+# ══════════════════════════════════════════════
+
+# {id(zone): (zone, (leds, leds_min, leds_max))}, preenchido na detecção.
+# Guarda a própria zona pra não confundir com outro objeto que reuse o id.
+_ZONE_META = {}
+
+
+def _zone_led_count(zone) -> int:
+    """Quantidade de LEDs da zona (lista leds, ou leds_count se não houver)."""
+    leds = getattr(zone, 'leds', None)
+    return len(leds) if leds is not None else zone.leds_count
+
+
+def _zone_meta(zone):
+    """(leds, leds_min, leds_max) da zona, lido uma vez por objeto."""
+    entry = _ZONE_META.get(id(zone))
+    if entry is None or entry[0] is not zone:
+        entry = _ZONE_META[id(zone)] = (zone, (
+            _zone_led_count(zone),
+            getattr(zone, 'leds_min', None),
+            getattr(zone, 'leds_max', None),
+        ))
+    return entry[1]
+
+
+# ══════════════════════════════════════════════
+# SDK EM PARALELO COM O PROMPT
+# ══════════════════════════════════════════════
+
+def _ask_while(work, prompt: str) -> str:
+    """
+    Roda work(log) numa thread enquanto o prompt já espera o usuário.
+
+    work não imprime: põe as mensagens em log, que saem depois da
+    resposta (sem misturar com o input). Só retorna quando work acabou,
+    então o próximo comando no socket nunca corre junto com ele.
+    """
+    log = []
+    done = threading.Event()
+
+    def run():
+        try:
+            work(log)
+        except Exception as e:
+            log.append(f"     Erro: {e}")
+        finally:
+            done.set()
+
+    threading.Thread(target=run, daemon=True).start()
+    answer = input(prompt).strip()
+    done.wait()
+    for line in log:
+        print(line)
+    return answer
+
+
 def main():
-    print()
-    print("=" * 60)
-    print("  🌀 FIX: LEDs APAGADOS NO WATERCOOLER")
-    print("=" * 60)
-    print()
+    _write(BANNER)
     
     client = OpenRGBClient('127.0.0.1', 6742, name='ZoneFix')
+    _last_update[0] = time.monotonic()  # conectar já enumera os devices
     devices = client.devices
     
     # ══════════════════════════════════════════════
@@ -40,11 +356,13 @@ def main():
         
         # Mostra zonas
         for z, zone in enumerate(dev.zones):
-            zone_leds = len(zone.leds) if hasattr(zone, 'leds') else zone.leds_count
+            zone_leds, zone_min, zone_max = _zone_meta(zone)
             
-            # Tenta pegar min/max
-            zone_min = getattr(zone, 'leds_min', '?')
-            zone_max = getattr(zone, 'leds_max', '?')
+            # Sem min/max conhecido: mostra '?'
+            if zone_min is None:
+                zone_min = '?'
+            if zone_max is None:
+                zone_max = '?'
             
             resizable = "RESIZABLE" if getattr(zone, 'type', None) == 2 or zone_max != '?' else ""
             
@@ -62,12 +380,9 @@ def main():
         print("⚠️  Nenhum device ARGB encontrado!")
         print("    Seus devices ARGB podem ter outro nome.")
         print()
-        try:
-            idx = int(input("  Digite o índice do device do watercooler: "))
-            if 0 <= idx < len(devices):
-                argb_candidates = [(idx, devices[idx])]
-        except:
-            pass
+        idx = _parse_int(input("  Digite o índice do device do watercooler: "))
+        if idx is not None and idx < len(devices):
+            argb_candidates = [(idx, devices[idx])]
     
     if not argb_candidates:
         print("Nenhum device selecionado. Saindo.")
@@ -90,35 +405,34 @@ def main():
         
         # Primeiro: Static (todos acendem)
         print("   🔹 Acendendo em STATIC mode...")
-        try:
-            modes = [m.name.lower() for m in dev.modes]
-            if 'static' in modes:
-                static_idx = modes.index('static')
-                dev.set_mode(static_idx)
-                time.sleep(0.1)
-                dev.set_color(RGBColor(255, 255, 255))
-                time.sleep(0.5)
-        except Exception as e:
-            print(f"   Erro no Static: {e}")
         
-        static_count = input("   Quantos LEDs acenderam no STATIC? ").strip()
+        def light_static(log, dev_idx=dev_idx, dev=dev):
+            try:
+                static_idx = _mode_idx(dev, dev_idx, 'static')
+                if static_idx is not None:
+                    _set_mode(dev_idx, dev, static_idx)
+                    _push_color(dev_idx, dev, _rgb(255, 255, 255))
+            except Exception as e:
+                log.append(f"   Erro no Static: {e}")
+        
+        static_count = _ask_while(light_static, "   Quantos LEDs acenderam no STATIC? ")
         
         # Agora: Direct
         print("   🔹 Acendendo em DIRECT mode...")
-        try:
-            dev.set_mode('direct')
-            time.sleep(0.1)
-            colors = [RGBColor(0, 255, 0)] * len(dev.leds)
-            dev.set_colors(colors)
-            time.sleep(0.5)
-        except Exception as e:
-            print(f"   Erro no Direct: {e}")
         
-        direct_count = input("   Quantos LEDs acenderam no DIRECT? ").strip()
+        def light_direct(log, dev_idx=dev_idx, dev=dev):
+            try:
+                _set_mode(dev_idx, dev, 'direct')
+                colors = [_rgb(0, 255, 0)] * len(dev.leds)
+                _push(dev_idx, dev, colors)
+            except Exception as e:
+                log.append(f"   Erro no Direct: {e}")
+        
+        direct_count = _ask_while(light_direct, "   Quantos LEDs acenderam no DIRECT? ")
         
-        if static_count.isdigit() and direct_count.isdigit():
-            s = int(static_count)
-            d = int(direct_count)
+        s = _parse_int(static_count)
+        d = _parse_int(direct_count)
+        if s is not None and d is not None:
             missing = s - d
             
             if missing > 0:
@@ -149,27 +463,13 @@ def main():
                 print(f"\n   🤔 Mais LEDs no Direct que no Static? Estranho...")
         
         # Apaga
-        try:
-            dev.set_color(RGBColor(0, 0, 0))
-        except:
-            pass
+        _blackout([(dev_idx, dev)])
     
     # ══════════════════════════════════════════════
     # PASSO 3: Tenta soluções
     # ══════════════════════════════════════════════
     
-    print()
-    print("=" * 60)
-    print("  PASSO 2: TENTANDO SOLUÇÕES")
-    print("=" * 60)
-    print()
-    print("  1. Resize de zona (OpenRGB)")
-    print("  2. Teste com mais LEDs no Direct")
-    print("  3. Teste zona por zona")
-    print("  4. Teste: Static primeiro, depois Direct")
-    print("  5. Teste: Enviar cores em partes")
-    print("  6. Ver instruções manuais")
-    print("  0. Sair")
+    _write(MENU)
     
     while True:
         print()
@@ -202,13 +502,13 @@ def try_resize(client, devices, argb_candidates):
     print("  🔧 RESIZE DE ZONA")
     print()
     
+    resized = False
+    
     for dev_idx, dev in argb_candidates:
         print(f"  Device [{dev_idx}] {dev.name}")
         
         for z, zone in enumerate(dev.zones):
-            zone_leds = len(zone.leds) if hasattr(zone, 'leds') else zone.leds_count
-            zone_max = getattr(zone, 'leds_max', None)
-            zone_min = getattr(zone, 'leds_min', None)
+            zone_leds, zone_min, zone_max = _zone_meta(zone)
             
             print(f"     Zona {z}: '{zone.name}' → {zone_leds} LEDs")
             
@@ -216,10 +516,9 @@ def try_resize(client, devices, argb_candidates):
                 print(f"        Máximo permitido: {zone_max}")
             
             # Tenta resize
-            new_size = input(f"     Novo tamanho? (Enter = manter {zone_leds}): ").strip()
+            new_size = _parse_int(input(f"     Novo tamanho? (Enter = manter {zone_leds}): "))
             
-            if new_size.isdigit():
-                new_size = int(new_size)
+            if new_size is not None:
                 
                 try:
                     # Método 1: resize via zone
@@ -236,38 +535,36 @@ def try_resize(client, devices, argb_candidates):
                         print(f"     ❌ API de resize não disponível")
                         print(f"        Faça manualmente no OpenRGB!")
                     
-                    # Recarrega device
-                    time.sleep(0.5)
-                    try:
-                        client.update()
-                    except:
-                        pass
+                    # Recarrega devices (no máximo 1x por UPDATE_TTL)
+                    resized = True
+                    _maybe_update(client)
                     
                 except Exception as e:
                     print(f"     ❌ Erro no resize: {e}")
                     print(f"        Tente fazer manualmente no OpenRGB")
     
+    # O resize muda os devices de verdade: força uma leitura nova
+    if resized:
+        time.sleep(0.5)
+        _last_update[0] = 0.0
+        _maybe_update(client)
+    
     # Testa se funcionou
     print()
     test = input("  Testar Direct mode agora? (s/n): ").strip().lower()
     if test == 's':
         for dev_idx, dev in argb_candidates:
             try:
-                dev.set_mode('direct')
-                time.sleep(0.1)
-                colors = [RGBColor(0, 255, 255)] * len(dev.leds)
-                dev.set_colors(colors)
+                _set_mode(dev_idx, dev, 'direct')
+                colors = [_rgb(0, 255, 255)] * len(dev.leds)
+                _push(dev_idx, dev, colors)
                 print(f"  [{dev_idx}] {dev.name}: CIANO ({len(dev.leds)} LEDs)")
             except Exception as e:
                 print(f"  [{dev_idx}] Erro: {e}")
         
         input("\n  Todos os LEDs acenderam? [Enter]")
         
-        for _, dev in argb_candidates:
-            try:
-                dev.set_color(RGBColor(0, 0, 0))
-            except:
-                pass
+        _blackout(argb_candidates)
 
 
 def try_more_leds(devices, argb_candidates):
@@ -280,36 +577,33 @@ def try_more_leds(devices, argb_candidates):
         current = len(dev.leds)
         print(f"  Device [{dev_idx}] {dev.name}: {current} LEDs detectados")
         
-        new_count = input(f"  Quantos LEDs enviar? (ex: {current + 12}): ").strip()
+        n = _parse_int(input(f"  Quantos LEDs enviar? (ex: {current + 12}): "))
         
-        if new_count.isdigit():
-            n = int(new_count)
+        def send(log, dev_idx=dev_idx, dev=dev, current=current, n=n):
+            if n is None:
+                return
             
             try:
-                dev.set_mode('direct')
-                time.sleep(0.1)
+                _set_mode(dev_idx, dev, 'direct')
                 
-                colors = [RGBColor(255, 0, 255)] * n  # Magenta
+                colors = [_rgb(255, 0, 255)] * n  # Magenta
                 
                 try:
-                    dev.set_colors(colors)
-                    print(f"  Enviado {n} LEDs em MAGENTA")
+                    _push(dev_idx, dev, colors)
+                    log.append(f"  Enviado {n} LEDs em MAGENTA")
                 except Exception as e:
-                    print(f"  Erro com {n} LEDs: {e}")
-                    print(f"  Tentando truncar pra {current}...")
-                    dev.set_colors(colors[:current])
+                    log.append(f"  Erro com {n} LEDs: {e}")
+                    log.append(f"  Tentando truncar pra {current}...")
+                    _push(dev_idx, dev, colors[:current])
                 
             except Exception as e:
-                print(f"  Erro: {e}")
+                log.append(f"  Erro: {e}")
         
-        resp = input("  Mais LEDs acenderam? (s/n): ").strip().lower()
-        if resp == 's':
+        resp = _ask_while(send, "  Mais LEDs acenderam? (s/n): ").lower()
+        if resp == 's' and n is not None:
             print(f"  ✅ Funcionou! Use LED_COUNT ou resize pra {n}")
         
-        try:
-            dev.set_color(RGBColor(0, 0, 0))
-        except:
-            pass
+        _blackout([(dev_idx, dev)])
 
 
 def try_zone_by_zone(devices, argb_candidates):
@@ -319,68 +613,52 @@ def try_zone_by_zone(devices, argb_candidates):
     print("  Acende cada zona em cor diferente")
     print()
     
-    zone_colors = [
-        (RGBColor(255, 0, 0), "VERMELHO"),
-        (RGBColor(0, 255, 0), "VERDE"),
-        (RGBColor(0, 0, 255), "AZUL"),
-        (RGBColor(255, 255, 0), "AMARELO"),
-        (RGBColor(255, 0, 255), "MAGENTA"),
-        (RGBColor(0, 255, 255), "CIANO"),
-    ]
-    
     for dev_idx, dev in argb_candidates:
         print(f"  📦 [{dev_idx}] {dev.name}")
         
         try:
-            dev.set_mode('direct')
-            time.sleep(0.1)
+            _set_mode(dev_idx, dev, 'direct')
         except:
             pass
         
         # Primeiro: apaga tudo
-        try:
-            dev.set_color(RGBColor(0, 0, 0))
-        except:
-            pass
+        _blackout([(dev_idx, dev)])
         
-        time.sleep(0.3)
+        _pause(0.3)
         
-        # Acende zona por zona
-        all_colors = [RGBColor(0, 0, 0)] * len(dev.leds)
+        # Acende zona por zona (frame (N, 3) uint8, convertido só no envio)
+        all_colors = np.zeros((len(dev.leds), 3), dtype=np.uint8)
         offset = 0
         
         for z, zone in enumerate(dev.zones):
-            zone_leds = len(zone.leds) if hasattr(zone, 'leds') else zone.leds_count
-            color, name = zone_colors[z % len(zone_colors)]
+            zone_leds = _zone_meta(zone)[0]
+            color, name = _ZONE_COLORS[z % len(_ZONE_COLORS)]
             
-            for i in range(zone_leds):
-                if offset + i < len(all_colors):
-                    all_colors[offset + i] = color
+            all_colors[offset:offset + zone_leds] = color
             
             print(f"     Zona {z}: '{zone.name}' → {zone_leds} LEDs = {name}")
             
             offset += zone_leds
         
         try:
-            dev.set_colors(all_colors)
+            _push(dev_idx, dev, _to_colors(all_colors))
         except Exception as e:
             print(f"     Erro: {e}")
         
         print()
         print("     Qual zona tem LEDs APAGADOS?")
-        problem_zone = input("     (Número da zona, ou Enter se todas OK): ").strip()
+        pz = _parse_int(input("     (Número da zona, ou Enter se todas OK): "))
         
-        if problem_zone.isdigit():
-            pz = int(problem_zone)
+        if pz is not None:
             if pz < len(dev.zones):
                 zone = dev.zones[pz]
-                zone_leds = len(zone.leds) if hasattr(zone, 'leds') else zone.leds_count
+                zone_leds = _zone_meta(zone)[0]
                 print(f"\n     ⚠️  Zona {pz} '{zone.name}' com problema!")
                 print(f"         LEDs configurados: {zone_leds}")
                 print(f"         Provavelmente precisa de mais LEDs!")
                 
-                qtd = input(f"         Quantos LEDs DEVERIA ter? ").strip()
-                if qtd.isdigit():
+                qtd = _parse_int(input(f"         Quantos LEDs DEVERIA ter? "))
+                if qtd is not None:
                     print(f"\n     📋 SOLUÇÃO:")
                     print(f"         No OpenRGB:")
                     print(f"         1. Clique no device '{dev.name}'")
@@ -390,10 +668,7 @@ def try_zone_by_zone(devices, argb_candidates):
                     print(f"         5. Salve o perfil")
         
         # Apaga
-        try:
-            dev.set_color(RGBColor(0, 0, 0))
-        except:
-            pass
+        _blackout([(dev_idx, dev)])
         
         print()
 
@@ -405,32 +680,30 @@ def try_static_then_direct(devices, argb_candidates):
     print("  Acende via Static primeiro, depois muda pra Direct")
     print()
     
-    for dev_idx, dev in argb_candidates:
-        print(f"  [{dev_idx}] {dev.name}")
-        
-        try:
-            # Passo 1: Static branco
-            modes = [m.name.lower() for m in dev.modes]
-            if 'static' in modes:
-                static_idx = modes.index('static')
-                dev.set_mode(static_idx)
-                time.sleep(0.1)
-                dev.set_color(RGBColor(50, 50, 50))  # Branco baixo
-                time.sleep(0.5)
-                print("     1. Static aplicado (branco fraco)")
-            
-            # Passo 2: Direct com cores
-            dev.set_mode('direct')
-            time.sleep(0.2)
-            
-            colors = [RGBColor(0, 255, 0)] * len(dev.leds)
-            dev.set_colors(colors)
-            print("     2. Direct aplicado (verde)")
+    def apply(log):
+        for dev_idx, dev in argb_candidates:
+            log.append(f"  [{dev_idx}] {dev.name}")
             
-        except Exception as e:
-            print(f"     Erro: {e}")
+            try:
+                # Passo 1: Static branco
+                static_idx = _mode_idx(dev, dev_idx, 'static')
+                if static_idx is not None:
+                    _set_mode(dev_idx, dev, static_idx)
+                    _push_color(dev_idx, dev, _rgb(50, 50, 50))  # Branco baixo
+                    _pause(0.5)
+                    log.append("     1. Static aplicado (branco fraco)")
+                
+                # Passo 2: Direct com cores
+                _set_mode(dev_idx, dev, 'direct')
+                
+                colors = [_rgb(0, 255, 0)] * len(dev.leds)
+                _push(dev_idx, dev, colors)
+                log.append("     2. Direct aplicado (verde)")
+                
+            except Exception as e:
+                log.append(f"     Erro: {e}")
     
-    resp = input("\n  Todos os LEDs ficaram VERDES? (s/n): ").strip().lower()
+    resp = _ask_while(apply, "\n  Todos os LEDs ficaram VERDES? (s/n): ").lower()
     
     if resp == 's':
         print("  ✅ WORKAROUND FUNCIONA!")
@@ -438,11 +711,7 @@ def try_static_then_direct(devices, argb_candidates):
     else:
         print("  ❌ Não funcionou")
     
-    for _, dev in argb_candidates:
-        try:
-            dev.set_color(RGBColor(0, 0, 0))
-        except:
-            pass
+    _blackout(argb_candidates)
 
 
 def try_partial_update(devices, argb_candidates):
@@ -456,97 +725,45 @@ def try_partial_update(devices, argb_candidates):
         total = len(dev.leds)
         print(f"  [{dev_idx}] {dev.name}: {total} LEDs")
         
-        try:
-            dev.set_mode('direct')
-            time.sleep(0.1)
-        except:
-            pass
+        print(f"     Blocos de 5 em LARANJA, depois todos juntos em CIANO...")
         
-        # Acende em blocos de 5
-        block_size = 5
-        
-        for start in range(0, total, block_size):
-            end = min(start + block_size, total)
+        def run(log, dev_idx=dev_idx, dev=dev, total=total):
+            try:
+                _set_mode(dev_idx, dev, 'direct')
+            except:
+                pass
             
-            colors = [RGBColor(0, 0, 0)] * total
-            for i in range(start, end):
-                colors[i] = RGBColor(255, 100, 0)  # Laranja
+            # Acende em blocos de 5 (acumulados, vão num set_colors só)
+            block_size = 5
+            colors = [_BLACK] * total
+            orange = _rgb(255, 100, 0)  # Laranja
             
+            for start in range(0, total, block_size):
+                end = min(start + block_size, total)
+                colors[start:end] = [orange] * (end - start)
             try:
-                dev.set_colors(colors)
+                _push(dev_idx, dev, colors)
             except:
                 pass
+            log.append(f"     LEDs 0-{total-1} em LARANJA")
             
-            print(f"\r     LEDs {start}-{end-1} em LARANJA", end="", flush=True)
-            time.sleep(0.3)
-        
-        print()
-        
-        # Agora tenta tudo junto
-        print(f"     Agora todos juntos...")
-        
-        try:
-            colors = [RGBColor(0, 255, 255)] * total  # Ciano
-            dev.set_colors(colors)
-        except Exception as e:
-            print(f"     Erro: {e}")
+            _pause(0.3)
+            
+            # Agora tenta tudo junto
+            try:
+                colors = [_rgb(0, 255, 255)] * total  # Ciano
+                _push(dev_idx, dev, colors)
+            except Exception as e:
+                log.append(f"     Erro: {e}")
         
-        resp = input("     Todos acenderam? (s/n): ").strip().lower()
+        resp = _ask_while(run, "     Todos acenderam? (s/n): ").lower()
         
-        for _, dev in argb_candidates:
-            try:
-                dev.set_color(RGBColor(0, 0, 0))
-            except:
-                pass
+        _blackout(argb_candidates)
 
 
 def show_manual_instructions():
     """Mostra instruções pra fix manual no OpenRGB."""
-    print()
-    print("=" * 60)
-    print("  📋 INSTRUÇÕES MANUAIS - FIX NO OPENRGB")
-    print("=" * 60)
-    print()
-    print("  MÉTODO 1: RESIZE DE ZONA")
-    print("  ─────────────────────────")
-    print("  1. Abra o OpenRGB")
-    print("  2. Clique no device do watercooler")
-    print("     (provavelmente 'Aura Addressable X')")
-    print("  3. Na aba 'LEDs', veja quantos LEDs tem")
-    print("  4. Na aba 'Device Info' ou 'Zones':")
-    print("     - Encontre a zona que tem poucos LEDs")
-    print("     - Mude o número pra quantidade REAL")
-    print("     - Clique 'Resize Zone'")
-    print("  5. Salve o perfil")
-    print()
-    print("  MÉTODO 2: OPENRGB SETTINGS")
-    print("  ───────────────────────────")
-    print("  1. OpenRGB → Settings → ASUS")
-    print("  2. Procure por 'ARGB Header' ou 'Addressable'")
-    print("  3. Aumente o número de LEDs configurado")
-    print("  4. Reinicie o OpenRGB")
-    print()
-    print("  MÉTODO 3: OPENRGB.JSON")
-    print("  ───────────────────────")
-    print("  1. Feche o OpenRGB")
-    print("  2. Abra o arquivo:")
-    print("     %APPDATA%\\OpenRGB\\OpenRGB.json")
-    print("     OU a pasta onde o OpenRGB está instalado")
-    print("  3. Procure por 'Addressable' no JSON")
-    print("  4. Mude 'leds_count' pra o valor correto")
-    print("  5. Salve e reabra o OpenRGB")
-    print()
-    print("  DICA: COMO SABER QUANTOS LEDs TEM?")
-    print("  ────────────────────────────────────")
-    print("  RiseMode 240mm geralmente tem:")
-    print("    - 2 ventoinhas de 120mm")
-    print("    - Cada ventoinha: 12-18 LEDs ARGB")
-    print("    - Bomba/bloco: 0-12 LEDs")
-    print("    - Total provável: 24-48 LEDs")
-    print()
-    print("  Se no Static acendem X LEDs, configure")
-    print("  as zonas pra somar X no total.")
-    print()
+    _write(HELP)
     input("  [Enter para continuar]")
 
 
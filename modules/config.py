@@ -1,10 +1,19 @@
 import os
+import re
+import sys
 from pathlib import Path
 
 # ══════════════════════════════════════════════════════════════════════════════
 # CARREGAMENTO DO .env COM FALLBACK
 # ══════════════════════════════════════════════════════════════════════════════
 
+# CHAVE=valor por linha (comentários com # e linhas sem = são ignorados)
+_ENV_RE = re.compile(r'^[ \t]*([A-Za-z_]\w*)[ \t]*=[ \t]*(.*?)[ \t\r]*$', re.M)
+
+# Pares já lidos, por (caminho, mtime_ns, tamanho) do .env.
+# Sobrevive a importlib.reload(config): o reload reusa o dict do módulo.
+_ENV_CACHE = globals().get('_ENV_CACHE', {})
+
 def load_env():
     """Carrega .env do diretório do executável ou script."""
     # Detecta se está rodando como executável PyInstaller
@@ -17,17 +26,26 @@ def load_env():
     
     env_path = app_dir / ".env"
     
-    if env_path.exists():
-        with open(env_path, encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith("#") and "=" in line:
-                    key, value = line.split("=", 1)
-                    os.environ.setdefault(key.strip(), value.strip())
-        return True
-    return False
+    try:
+        stat = env_path.stat()
+    except OSError:
+        return False
+    
+    key = (str(env_path), stat.st_mtime_ns, stat.st_size)
+    pairs = _ENV_CACHE.get(key)
+    if pairs is None:
+        pairs = _ENV_RE.findall(env_path.read_text(encoding='utf-8'))
+        _ENV_CACHE.clear()
+        _ENV_CACHE[key] = pairs
+    
+    for name, value in pairs:
+        os.environ.setdefault(name, value)
+    return True
 
-import sys
+load_env.cache_clear = _ENV_CACHE.clear
+
+# Sempre lê (do cache, se o .env não mudou): setdefault não sobrescreve o
+# que já está no ambiente, e cada credencial pode vir de um lado
 _env_loaded = load_env()
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -255,4 +273,24 @@ SMOOTHING_LOW_VOL_THRESH = 0.35
 
 MAX_FPS = 60           # FPS máximo quando tocando
 STANDBY_FPS = 15       # FPS quando pausado
-START_MINIMIZED = True # Inicia só no tray
\ No newline at end of file
+START_MINIMIZED = True # Inicia só no tray
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# SNAPSHOT CONGELADO
+# ══════════════════════════════════════════════════════════════════════════════
+
+from dataclasses import make_dataclass as _make_dataclass
+
+# Cada constante em MAIÚSCULAS vira um slot de um dataclass congelado:
+# CFG.X num loop é acesso a slot, sem lookup no dict do módulo.
+# Os nomes soltos continuam valendo; o ConfigManager refaz o CFG no apply.
+_CFG_FIELDS = [k for k in list(globals()) if k.isupper() and not k.startswith('_')]
+_Cfg = _make_dataclass('_Cfg', _CFG_FIELDS, frozen=True, slots=True)
+
+def freeze():
+    """Novo snapshot CFG com os valores atuais do módulo."""
+    g = globals()
+    return _Cfg(**{k: g[k] for k in _CFG_FIELDS})
+
+CFG = freeze()
@@ -4,11 +4,48 @@ Gerenciador de configuração com hot-reload.
 Permite alterar config em runtime sem reiniciar o programa.
 """
 
+from __future__ import annotations
+
+import logging
 import threading
-import time
-import copy
 import types
-from typing import Any, Callable, Dict, List, Optional
+from collections import defaultdict
+
+# Anotações ficam como string (PEP 563): typing só pros checadores de tipo
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, Callable, Dict, List, Set
+
+logger = logging.getLogger(__name__)
+
+
+def _safe_call(cb, *args):
+    """Chama um listener; erro vai pro log em vez de derrubar a notificação."""
+    try:
+        cb(*args)
+    except Exception:
+        logger.exception("Erro no listener %r", cb)
+
+
+_deepcopy = None  # copy.deepcopy, importado no primeiro uso
+
+_SCALARS = (str, int, float, bool, type(None))
+
+
+def _is_immutable(val) -> bool:
+    """True pra escalares e tuplas/frozensets só de valores imutáveis."""
+    if isinstance(val, _SCALARS):
+        return True
+    if isinstance(val, (tuple, frozenset)):
+        return all(_is_immutable(v) for v in val)
+    return False
+
+
+def _freeze(val):
+    """Troca listas (também aninhadas) por tuplas; o resto fica igual."""
+    if isinstance(val, (list, tuple)):
+        return tuple(_freeze(v) for v in val)
+    return val
 
 
 def _safe_deepcopy(val):
@@ -16,18 +53,24 @@ def _safe_deepcopy(val):
     Copia um valor de forma segura.
     Se não conseguir, retorna o valor original.
     """
+    global _deepcopy
+
     # Tipos que não podem/não precisam ser copiados
     if val is None:
         return None
-    if isinstance(val, (str, int, float, bool)):
+    if _is_immutable(val):
         return val
     if isinstance(val, types.ModuleType):
         return None  # Ignora módulos
     if callable(val) and not isinstance(val, (list, tuple, dict, type)):
         return None  # Ignora funções
     
+    if _deepcopy is None:
+        import copy
+        _deepcopy = copy.deepcopy
+    
     try:
-        return copy.deepcopy(val)
+        return _deepcopy(val)
     except (TypeError, AttributeError):
         # Se não conseguir copiar, tenta cópia rasa
         try:
@@ -42,36 +85,351 @@ def _safe_deepcopy(val):
             return val
 
 
+_json_codec = None  # (dumps, loads) em bytes, resolvido no primeiro uso
+
+
+def _json():
+    """
+    (dumps, loads) pros presets: orjson se estiver instalado, senão o json
+    da stdlib com a mesma interface em bytes.
+    """
+    global _json_codec
+    if _json_codec is None:
+        try:
+            import orjson
+
+            def dumps(data):
+                return orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str)
+
+            _json_codec = (dumps, orjson.loads)
+        except ImportError:
+            import json
+
+            def dumps(data):
+                return json.dumps(data, indent=2, default=str).encode('utf-8')
+
+            _json_codec = (dumps, json.loads)
+    return _json_codec
+
+
+# Nomes do config.py que não são configuração (módulos, funções internas,
+# derivados, credenciais)
+_SKIP = frozenset({
+    # Módulos comuns
+    "os", "sys", "Path", "pathlib", "logging", "json", "time",
+    "threading", "copy", "types", "typing",
+    # Funções/variáveis internas
+    "ENV_PATH", "load_env", "APP_DIR", "logger",
+    # Snapshot congelado (refeito no apply)
+    "CFG",
+    # Credenciais (ficam no .env)
+    "SPOTIFY_CLIENT_ID", "SPOTIFY_CLIENT_SECRET", "SPOTIFY_REDIRECT_URI",
+})
+
+# Categorias (abas da GUI / seções do config.py) e suas keys
+_CATEGORIES = {
+    "general": [
+        "REACTIVE_MODE", "LED_MODE", "HIT_STYLE",
+        "VISUAL_EFFECT", "DETECTION_MODE", "DEFAULT_COLOR",
+    ],
+    "leds": [
+        "LED_SKIP_START", "LED_SKIP_END", "LED_COUNT", "SELECTED_DEVICES",
+    ],
+    "openrgb": [
+        "OPENRGB_HOST", "OPENRGB_PORT", "OPENRGB_NAME",
+    ],
+    "spotify": [
+        "SPOTIFY_SCOPE",
+        "POLL_INTERVAL", "POLL_ENDING", "POLL_ENDING_SOON",
+        "POLL_AFTER_CHANGE", "POLL_IDLE",
+    ],
+    "brightness": [
+        "BRIGHTNESS_FLOOR", "BRIGHTNESS_BASE",
+        "BRIGHTNESS_KICK", "BRIGHTNESS_SNARE", "BRIGHTNESS_PEAK",
+        "BRIGHTNESS_MAP",
+    ],
+    "color_shift": [
+        "COLOR_SHIFT_KICK", "COLOR_SHIFT_SNARE", "COLOR_SHIFT_PEAK",
+    ],
+    "color_strategy": [
+        "COLOR_SELECTION_STRATEGY", "COLOR_ASSIGNMENT_MODE", "COLOR_MIN_SATURATION",
+    ],
+    "sensitivity": [
+        "SENSITIVITY", "PEAKS_SENSITIVITY",
+        "CUSTOM_KICK_THRESHOLD", "CUSTOM_SNARE_THRESHOLD",
+        "CUSTOM_KICK_MIN_ENERGY", "CUSTOM_SNARE_MIN_ENERGY",
+        "CUSTOM_KICK_MINIOI", "CUSTOM_SNARE_MINIOI",
+        "PEAK_HOLD_TIME", "PEAK_MIN_INTERVAL", "HIT_HOLD_TIME",
+    ],
+    "dynamics": [
+        "AGC_ENABLED", "AGC_MAX_GAIN", "AGC_MIN_GAIN", "AGC_TARGET",
+        "AGC_ATTACK", "AGC_RELEASE",
+        "COMPRESSOR_THRESHOLD", "COMPRESSOR_RATIO", "COMPRESSOR_KNEE", "COMPRESSOR_MAKEUP",
+        "ADAPTIVE_SMOOTHING", "SMOOTHING_LOW_VOL_MULT", "SMOOTHING_LOW_VOL_THRESH",
+        "DYNAMIC_FLOOR_ENABLED", "DYNAMIC_FLOOR_MAX", "DYNAMIC_FLOOR_THRESH",
+    ],
+    "bands": [
+        "BAND_ZONE_PERCUSSION", "BAND_ZONE_BASS", "BAND_ZONE_MELODY",
+        "BAND_COLOR_SCHEME",
+        "BAND_HUE_PERCUSSION", "BAND_HUE_BASS", "BAND_HUE_MELODY",
+        "BAND_SAT_PERCUSSION", "BAND_SAT_BASS", "BAND_SAT_MELODY",
+        "BAND_SMOOTHING_ATTACK", "BAND_SMOOTHING_DECAY",
+        "BAND_BEAT_ATTACK", "BAND_BEAT_DECAY",
+        "BAND_BEAT_FLASH", "BAND_BEAT_COLOR_SHIFT", "BAND_COLOR_SHIFT_MODE",
+        "BAND_BG_BRIGHTNESS", "BAND_INTERNAL_GRADIENT",
+        "BAND_COLOR_LERP", "BAND_ZONE_BLEND_WIDTH",
+        "BAND_BOOST_PERCUSSION", "BAND_BOOST_BASS", "BAND_BOOST_MELODY",
+        "BAND_EXPANSION_PERCUSSION", "BAND_EXPANSION_BASS", "BAND_EXPANSION_MELODY",
+        "BAND_FLOOR_PERCUSSION", "BAND_FLOOR_BASS", "BAND_FLOOR_MELODY",
+        "BAND_CEILING_PERCUSSION", "BAND_CEILING_BASS", "BAND_CEILING_MELODY",
+        "BAND_ATTACK", "BAND_DECAY",
+        "BAND_RESPONSE_CURVE",
+        "BAND_COMPRESSION_ENABLED", "BAND_COMPRESSION_THRESHOLD",
+        "BAND_COMPRESSION_RATIO",
+        "BAND_FREQ_BASS_MIN", "BAND_FREQ_BASS_MAX",
+        "BAND_FREQ_MELODY_MIN", "BAND_FREQ_MELODY_MAX",
+        "BAND_FREQ_PERCUSSION_MIN", "BAND_FREQ_PERCUSSION_MAX",
+    ],
+    "chase": [
+        "CHASE_ENABLED", "CHASE_SPEED_MAX", "CHASE_TAIL_LENGTH",
+        "CHASE_BRIGHTNESS_MIN", "CHASE_BRIGHTNESS_MAX",
+        "CHASE_BEAT_FLASH", "CHASE_FLASH_DECAY", "CHASE_BG_BRIGHTNESS",
+    ],
+    "frequency": [
+        "FREQ_SMOOTHING_ATTACK", "FREQ_SMOOTHING_DECAY",
+        "FREQ_BEAT_AMOUNT", "FREQ_BEAT_DECAY",
+        "FREQ_BG_BRIGHTNESS", "FREQ_BASS_MULT",
+        "FREQ_HIGH_SHIFT", "FREQ_COLOR_LERP", "FREQ_ZONE_BLEND",
+    ],
+    "hybrid": [
+        "HYBRID_CHASE_INTENSITY", "HYBRID_CHASE_SPEED",
+        "HYBRID_CHASE_TAIL", "HYBRID_CHASE_MODE",
+    ],
+    "standby": [
+        "STANDBY_BRIGHTNESS_MIN", "STANDBY_BRIGHTNESS_MAX",
+        "STANDBY_BREATHING_SPEED",
+    ],
+    "quantized": [
+        "QUANTIZED_UPDATE_INTERVAL", "QUANTIZED_LEVELS",
+    ],
+}
+
+# Categoria de cada key
+_KEY_TO_CATEGORY = {k: cat for cat, keys in _CATEGORIES.items() for k in keys}
+
+# Seções do config.py gerado, na ordem de escrita: (título, categoria)
+_SECTION_ORDER = (
+    ("SPOTIFY POLLING RATE", "spotify"),
+    ("OPENRGB", "openrgb"),
+    ("LED CONFIGURATION", "leds"),
+    ("COR PADRÃO", "general"),
+    ("BRILHO", "brightness"),
+    ("COLOR STRATEGY", "color_strategy"),
+    ("COLOR SHIFT", "color_shift"),
+    ("SENSIBILIDADE", "sensitivity"),
+    ("AGC E DINÂMICA", "dynamics"),
+    ("CHASE EFFECT", "chase"),
+    ("FREQUENCY EFFECT", "frequency"),
+    ("HYBRID EFFECT", "hybrid"),
+    ("BAND EFFECT", "bands"),
+    ("STANDBY MODE", "standby"),
+    ("QUANTIZED", "quantized"),
+)
+
+
+# Partes fixas do config.py gerado por save_to_file
+_HEADER_TEMPLATE = '''\
+# config.py
+"""
+Configuração do Spotify RGB Sync
+Auto-gerado pela GUI
+"""
+
+import os
+import re
+import sys
+from pathlib import Path
+
+# ══════════════════════════════════════════════════════════════════════════════
+# CARREGAMENTO DO .env COM FALLBACK
+# ══════════════════════════════════════════════════════════════════════════════
+
+# CHAVE=valor por linha (comentários com # e linhas sem = são ignorados)
+_ENV_RE = re.compile(r'^[ \\t]*([A-Za-z_]\\w*)[ \\t]*=[ \\t]*(.*?)[ \\t\\r]*$', re.M)
+
+# Pares já lidos, por (caminho, mtime_ns, tamanho) do .env.
+# Sobrevive a importlib.reload(config): o reload reusa o dict do módulo.
+_ENV_CACHE = globals().get('_ENV_CACHE', {})
+
+def load_env():
+    """Carrega .env do diretório do executável ou script."""
+    # Detecta se está rodando como executável PyInstaller
+    if getattr(sys, 'frozen', False):
+        # Executável: usa diretório do .exe
+        app_dir = Path(sys.executable).parent
+    else:
+        # Script: usa diretório do config.py
+        app_dir = Path(__file__).parent
+    
+    env_path = app_dir / ".env"
+    
+    try:
+        stat = env_path.stat()
+    except OSError:
+        return False
+    
+    key = (str(env_path), stat.st_mtime_ns, stat.st_size)
+    pairs = _ENV_CACHE.get(key)
+    if pairs is None:
+        pairs = _ENV_RE.findall(env_path.read_text(encoding='utf-8'))
+        _ENV_CACHE.clear()
+        _ENV_CACHE[key] = pairs
+    
+    for name, value in pairs:
+        os.environ.setdefault(name, value)
+    return True
+
+load_env.cache_clear = _ENV_CACHE.clear
+
+# Sempre lê (do cache, se o .env não mudou): setdefault não sobrescreve o
+# que já está no ambiente, e cada credencial pode vir de um lado
+_env_loaded = load_env()
+
+# ══════════════════════════════════════════════════════════════════════════════
+# SPOTIFY API
+# ══════════════════════════════════════════════════════════════════════════════
+
+SPOTIFY_CLIENT_ID     = os.environ.get("SPOTIPY_CLIENT_ID", "")
+SPOTIFY_CLIENT_SECRET = os.environ.get("SPOTIPY_CLIENT_SECRET", "")
+SPOTIFY_REDIRECT_URI  = os.environ.get("SPOTIPY_REDIRECT_URI", "http://localhost:8888/callback")
+'''
+
+_FOOTER_TEMPLATE = '''
+
+# ══════════════════════════════════════════════════════════════════════════════
+# SNAPSHOT CONGELADO
+# ══════════════════════════════════════════════════════════════════════════════
+
+from dataclasses import make_dataclass as _make_dataclass
+
+_CFG_FIELDS = [k for k in list(globals()) if k.isupper() and not k.startswith('_')]
+_Cfg = _make_dataclass('_Cfg', _CFG_FIELDS, frozen=True, slots=True)
+
+def freeze():
+    g = globals()
+    return _Cfg(**{k: g[k] for k in _CFG_FIELDS})
+
+CFG = freeze()
+'''
+
+
+class _RWLock:
+    """
+    Lock de leitores/escritor: leituras rodam juntas, escrita é exclusiva.
+    Uso: `with lock.read:` / `with lock.write:`. Não é reentrante.
+    """
+
+    __slots__ = ('_cond', '_readers', '_writing', 'read', 'write')
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writing = False
+        self.read = _ReadSide(self)
+        self.write = _WriteSide(self)
+
+    def acquire_read(self):
+        with self._cond:
+            while self._writing:
+                self._cond.wait()
+            self._readers += 1
+
+    def release_read(self):
+        with self._cond:
+            self._readers -= 1
+            if not self._readers:
+                self._cond.notify_all()
+
+    def acquire_write(self):
+        with self._cond:
+            while self._writing or self._readers:
+                self._cond.wait()
+            self._writing = True
+
+    def release_write(self):
+        with self._cond:
+            self._writing = False
+            self._cond.notify_all()
+
+
+class _ReadSide:
+    __slots__ = ('_lock',)
+
+    def __init__(self, lock):
+        self._lock = lock
+
+    def __enter__(self):
+        self._lock.acquire_read()
+
+    def __exit__(self, *exc):
+        self._lock.release_read()
+
+
+class _WriteSide:
+    __slots__ = ('_lock',)
+
+    def __init__(self, lock):
+        self._lock = lock
+
+    def __enter__(self):
+        self._lock.acquire_write()
+
+    def __exit__(self, *exc):
+        self._lock.release_write()
+
+
+_INSTANCE = None  # criado no import do módulo, logo após a classe
+
+
 class ConfigManager:
     """
     Singleton que gerencia todas as configurações.
     Permite leitura/escrita thread-safe e notifica listeners quando algo muda.
     """
 
-    _instance = None
-    _lock = threading.Lock()
+    __slots__ = (
+        '_values', '_defaults', '_listeners', '_batch_listeners',
+        '_category_listeners', '_rw_lock', '_dirty',
+        '_categories', '_key_to_category', '_sourced_keys',
+        '_get_cat', '_get_cat_listeners', '_unapplied',
+    )
 
     def __new__(cls):
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._initialized = False
-        return cls._instance
+        # A instância única já existe desde o import: sem lock nem checagem dupla
+        if _INSTANCE is not None:
+            return _INSTANCE
+        return super().__new__(cls)
 
     def __init__(self):
-        if self._initialized:
+        if self is _INSTANCE:
             return
-        self._initialized = True
 
         self._values: Dict[str, Any] = {}
         self._defaults: Dict[str, Any] = {}
-        self._listeners: List[Callable] = []
-        self._category_listeners: Dict[str, List[Callable]] = {}
-        self._rw_lock = threading.RLock()
+        # Listeners em dicts {callback: None}: conjunto ordenado, remoção O(1)
+        self._listeners: Dict[Callable, None] = {}
+        self._batch_listeners: Dict[Callable, None] = {}
+        self._category_listeners: Dict[str, Dict[Callable, None]] = defaultdict(dict)
+        self._rw_lock = _RWLock()  # nenhum método reentra no lock
         self._dirty = False
         self._categories: Dict[str, List[str]] = {}
         self._key_to_category: Dict[str, str] = {}
+        # .get já ligados: o caminho de notificação não busca atributos
+        self._get_cat = self._key_to_category.get
+        self._get_cat_listeners = self._category_listeners.get
+        self._sourced_keys: frozenset = frozenset()
+        # Keys mudadas desde o último apply: o apply só escreve essas
+        self._unapplied: Set[str] = set()
 
         self._load_from_config_module()
 
@@ -79,118 +437,10 @@ class ConfigManager:
         """Carrega todos os valores do config.py atual."""
         import config
 
-        # Nomes a ignorar (módulos, funções internas, credenciais)
-        skip = {
-            # Módulos comuns
-            "os", "sys", "Path", "pathlib", "logging", "json", "time",
-            "threading", "copy", "types", "typing",
-            # Funções/variáveis internas
-            "ENV_PATH", "load_env", "APP_DIR",
-            # Credenciais (ficam no .env)
-            "SPOTIFY_CLIENT_ID", "SPOTIFY_CLIENT_SECRET", "SPOTIFY_REDIRECT_URI",
-        }
-
-        categories = {
-            "general": [
-                "REACTIVE_MODE", "LED_MODE", "HIT_STYLE",
-                "VISUAL_EFFECT", "DETECTION_MODE", "DEFAULT_COLOR",
-            ],
-            "leds": [
-                "LED_SKIP_START", "LED_SKIP_END", "LED_COUNT", "SELECTED_DEVICES",
-            ],
-            "openrgb": [
-                "OPENRGB_HOST", "OPENRGB_PORT", "OPENRGB_NAME",
-            ],
-            "spotify": [
-                "SPOTIFY_SCOPE",
-                "POLL_INTERVAL", "POLL_ENDING", "POLL_ENDING_SOON",
-                "POLL_AFTER_CHANGE", "POLL_IDLE",
-            ],
-            "brightness": [
-                "BRIGHTNESS_FLOOR", "BRIGHTNESS_BASE",
-                "BRIGHTNESS_KICK", "BRIGHTNESS_SNARE", "BRIGHTNESS_PEAK",
-                "BRIGHTNESS_MAP",
-            ],
-            "color_shift": [
-                "COLOR_SHIFT_KICK", "COLOR_SHIFT_SNARE", "COLOR_SHIFT_PEAK",
-            ],
-            "color_strategy": [
-                "COLOR_SELECTION_STRATEGY", "COLOR_ASSIGNMENT_MODE", "COLOR_MIN_SATURATION",
-            ],
-            "sensitivity": [
-                "SENSITIVITY", "PEAKS_SENSITIVITY",
-                "CUSTOM_KICK_THRESHOLD", "CUSTOM_SNARE_THRESHOLD",
-                "CUSTOM_KICK_MIN_ENERGY", "CUSTOM_SNARE_MIN_ENERGY",
-                "CUSTOM_KICK_MINIOI", "CUSTOM_SNARE_MINIOI",
-                "PEAK_HOLD_TIME", "PEAK_MIN_INTERVAL", "HIT_HOLD_TIME",
-            ],
-            "dynamics": [
-                "AGC_ENABLED", "AGC_MAX_GAIN", "AGC_MIN_GAIN", "AGC_TARGET",
-                "AGC_ATTACK", "AGC_RELEASE",
-                "COMPRESSOR_THRESHOLD", "COMPRESSOR_RATIO", "COMPRESSOR_KNEE", "COMPRESSOR_MAKEUP",
-                "ADAPTIVE_SMOOTHING", "SMOOTHING_LOW_VOL_MULT", "SMOOTHING_LOW_VOL_THRESH",
-                "DYNAMIC_FLOOR_ENABLED", "DYNAMIC_FLOOR_MAX", "DYNAMIC_FLOOR_THRESH",
-            ],
-            "bands": [
-                "BAND_ZONE_PERCUSSION", "BAND_ZONE_BASS", "BAND_ZONE_MELODY",
-                "BAND_COLOR_SCHEME",
-                "BAND_HUE_PERCUSSION", "BAND_HUE_BASS", "BAND_HUE_MELODY",
-                "BAND_SAT_PERCUSSION", "BAND_SAT_BASS", "BAND_SAT_MELODY",
-                "BAND_SMOOTHING_ATTACK", "BAND_SMOOTHING_DECAY",
-                "BAND_BEAT_ATTACK", "BAND_BEAT_DECAY",
-                "BAND_BEAT_FLASH", "BAND_BEAT_COLOR_SHIFT", "BAND_COLOR_SHIFT_MODE",
-                "BAND_BG_BRIGHTNESS", "BAND_INTERNAL_GRADIENT",
-                "BAND_COLOR_LERP", "BAND_ZONE_BLEND_WIDTH",
-                "BAND_BOOST_PERCUSSION", "BAND_BOOST_BASS", "BAND_BOOST_MELODY",
-                "BAND_EXPANSION_PERCUSSION", "BAND_EXPANSION_BASS", "BAND_EXPANSION_MELODY",
-                "BAND_FLOOR_PERCUSSION", "BAND_FLOOR_BASS", "BAND_FLOOR_MELODY",
-                "BAND_CEILING_PERCUSSION", "BAND_CEILING_BASS", "BAND_CEILING_MELODY",
-                "BAND_ATTACK", "BAND_DECAY",
-                "BAND_RESPONSE_CURVE",
-                "BAND_COMPRESSION_ENABLED", "BAND_COMPRESSION_THRESHOLD",
-                "BAND_COMPRESSION_RATIO",
-                "BAND_FREQ_BASS_MIN", "BAND_FREQ_BASS_MAX",
-                "BAND_FREQ_MELODY_MIN", "BAND_FREQ_MELODY_MAX",
-                "BAND_FREQ_PERCUSSION_MIN", "BAND_FREQ_PERCUSSION_MAX",
-            ],
-            "chase": [
-                "CHASE_ENABLED", "CHASE_SPEED_MAX", "CHASE_TAIL_LENGTH",
-                "CHASE_BRIGHTNESS_MIN", "CHASE_BRIGHTNESS_MAX",
-                "CHASE_BEAT_FLASH", "CHASE_FLASH_DECAY", "CHASE_BG_BRIGHTNESS",
-            ],
-            "frequency": [
-                "FREQ_SMOOTHING_ATTACK", "FREQ_SMOOTHING_DECAY",
-                "FREQ_BEAT_AMOUNT", "FREQ_BEAT_DECAY",
-                "FREQ_BG_BRIGHTNESS", "FREQ_BASS_MULT",
-                "FREQ_HIGH_SHIFT", "FREQ_COLOR_LERP", "FREQ_ZONE_BLEND",
-            ],
-            "hybrid": [
-                "HYBRID_CHASE_INTENSITY", "HYBRID_CHASE_SPEED",
-                "HYBRID_CHASE_TAIL", "HYBRID_CHASE_MODE",
-            ],
-            "standby": [
-                "STANDBY_BRIGHTNESS_MIN", "STANDBY_BRIGHTNESS_MAX",
-                "STANDBY_BREATHING_SPEED",
-            ],
-            "quantized": [
-                "QUANTIZED_UPDATE_INTERVAL", "QUANTIZED_LEVELS",
-            ],
-        }
-
-        with self._rw_lock:
-            for attr_name in dir(config):
-                # Pula atributos internos
-                if attr_name.startswith("_"):
-                    continue
-                
-                # Pula nomes conhecidos a ignorar
-                if attr_name in skip:
-                    continue
-                
-                # Pega o valor
-                try:
-                    val = getattr(config, attr_name)
-                except Exception:
+        with self._rw_lock.write:
+            for attr_name, val in list(vars(config).items()):
+                # Pula atributos internos e nomes conhecidos a ignorar
+                if attr_name[0] == '_' or attr_name in _SKIP:
                     continue
                 
                 # Pula módulos
@@ -205,71 +455,108 @@ class ConfigManager:
                 if isinstance(val, type):
                     continue
                 
-                # Copia de forma segura
+                # Imutáveis: o mesmo objeto serve de valor e de default
+                if _is_immutable(val):
+                    self._values[attr_name] = self._defaults[attr_name] = val
+                    continue
+
+                # Listas: cópia rasa pro valor, tupla como default imutável
+                if isinstance(val, list) and all(_is_immutable(v) for v in val):
+                    self._values[attr_name] = list(val)
+                    self._defaults[attr_name] = tuple(val)
+                    continue
+
+                # Resto (dicts, listas aninhadas...): copia de forma segura
                 copied = _safe_deepcopy(val)
-                if copied is None and val is not None:
-                    # Se não conseguiu copiar e não era None, pula
+                if copied is None:
+                    # Se não conseguiu copiar, pula
                     continue
                 
                 self._values[attr_name] = copied
-                self._defaults[attr_name] = _safe_deepcopy(val)
+                # Defaults imutáveis: os resets usam direto, sem cópia
+                self._defaults[attr_name] = _freeze(copied)
 
-            self._categories = categories
-
-            # Mapear cada key à sua categoria
-            for cat, keys in categories.items():
-                for k in keys:
-                    self._key_to_category[k] = cat
+            # Keys que existem no config.py: o apply escreve só nelas
+            self._sourced_keys = frozenset(self._values)
+            self._categories = _CATEGORIES
+            self._key_to_category = _KEY_TO_CATEGORY
+            self._get_cat = _KEY_TO_CATEGORY.get
 
     def get(self, key: str, default=None) -> Any:
-        with self._rw_lock:
-            val = self._values.get(key, default)
-            return _safe_deepcopy(val) if val is not None else default
-
-    def set(self, key: str, value: Any, notify: bool = True):
-        with self._rw_lock:
-            old = self._values.get(key)
-            self._values[key] = value
+        # dict.get é atômico sob o GIL: imutáveis voltam sem lock nem cópia
+        val = self._values.get(key)
+        if val is None:
+            return default
+        if type(val) in _SCALARS or _is_immutable(val):
+            return val
+        with self._rw_lock.read:
+            return _safe_deepcopy(val)
+
+    def get_many(self, keys, defaults: Dict[str, Any] = None) -> List[Any]:
+        """
+        Valores de várias keys na ordem dada, com uma aquisição do lock só.
+        Key ausente (ou None) vira defaults[key], como no get(key, default).
+        """
+        default_of = defaults.get if defaults else {}.get
+        with self._rw_lock.read:
+            vget = self._values.get
+            result = []
+            for k in keys:
+                val = vget(k)
+                result.append(default_of(k) if val is None else _safe_deepcopy(val))
+            return result
+
+    def set(self, key: str, value: Any, notify: bool = True) -> bool:
+        """Grava key = value; valor igual ao atual não escreve nada. Retorna se mudou."""
+        with self._rw_lock.write:
+            values = self._values
+            if key in values and values[key] == value:
+                return False
+            values[key] = value
+            self._unapplied.add(key)
             self._dirty = True
 
-        if notify and old != value:
-            cat = self._key_to_category.get(key, "unknown")
-            self._notify(key, value, cat)
+        if notify:
+            cat = self._get_cat(key, "unknown")
+            self._notify_batch([(key, value, cat)])
+        return True
 
     def set_many(self, updates: Dict[str, Any], notify: bool = True):
-        changed = {}
-        with self._rw_lock:
+        changed = []  # (key, value, categoria)
+        add_change = changed.append
+        with self._rw_lock.write:
+            values = self._values
+            vget = values.get
+            category_of = self._get_cat
+            mark_unapplied = self._unapplied.add
             for key, value in updates.items():
-                old = self._values.get(key)
-                if old != value:
-                    self._values[key] = value
-                    changed[key] = value
+                if vget(key) != value:
+                    values[key] = value
+                    mark_unapplied(key)
+                    add_change((key, value, category_of(key, "unknown")))
             if changed:
                 self._dirty = True
 
         if notify and changed:
-            for k, v in changed.items():
-                cat = self._key_to_category.get(k, "unknown")
-                self._notify(k, v, cat)
+            self._notify_batch(changed)
 
     def reset(self, key: str):
         if key in self._defaults:
-            self.set(key, _safe_deepcopy(self._defaults[key]))
+            self.set(key, self._defaults[key])
 
     def reset_category(self, category: str):
         keys = self._categories.get(category, [])
         updates = {}
         for k in keys:
             if k in self._defaults:
-                updates[k] = _safe_deepcopy(self._defaults[k])
+                updates[k] = self._defaults[k]
         if updates:
             self.set_many(updates)
 
     def reset_all(self):
-        with self._rw_lock:
-            self._values = {}
-            for k, v in self._defaults.items():
-                self._values[k] = _safe_deepcopy(v)
+        with self._rw_lock.write:
+            self._values = dict(self._defaults)
+            self._unapplied = set(self._values)
             self._dirty = True
         self._notify_all()
 
@@ -283,49 +570,82 @@ class ConfigManager:
         return self._dirty
 
     def add_listener(self, callback: Callable):
-        self._listeners.append(callback)
+        self._listeners[callback] = None
 
     def remove_listener(self, callback: Callable):
-        if callback in self._listeners:
-            self._listeners.remove(callback)
+        self._listeners.pop(callback, None)
 
-    def add_category_listener(self, category: str, callback: Callable):
-        if category not in self._category_listeners:
-            self._category_listeners[category] = []
-        self._category_listeners[category].append(callback)
+    def add_batch_listener(self, callback: Callable):
+        """
+        Listener chamado uma vez por escrita com a lista inteira de mudanças
+        [(key, value, categoria), ...], em vez de uma vez por key.
+        """
+        self._batch_listeners[callback] = None
 
-    def _notify(self, key: str, value: Any, category: str):
-        for cb in self._listeners:
-            try:
-                cb(key, value, category)
-            except Exception as e:
-                print(f"[ConfigManager] Listener error: {e}")
+    def remove_batch_listener(self, callback: Callable):
+        self._batch_listeners.pop(callback, None)
 
-        for cb in self._category_listeners.get(category, []):
-            try:
-                cb(key, value)
-            except Exception as e:
-                print(f"[ConfigManager] Category listener error: {e}")
+    def add_category_listener(self, category: str, callback: Callable):
+        self._category_listeners[category][callback] = None
+
+    def remove_category_listener(self, category: str, callback: Callable):
+        self._category_listeners.get(category, {}).pop(callback, None)
+
+    def _notify_batch(self, changes: List[tuple]):
+        """
+        Notifica uma lista de mudanças (key, value, categoria): os listeners
+        de lote recebem a lista uma vez; os demais, uma chamada por key.
+        """
+        # Snapshots: um listener pode se remover/adicionar durante a chamada
+        for cb in tuple(self._batch_listeners):
+            _safe_call(cb, changes)
+
+        # Agrupa por categoria: a lista de listeners de cada uma é buscada 1x
+        listeners = tuple(self._listeners)
+        by_category = defaultdict(list)
+        for key, value, category in changes:
+            for cb in listeners:
+                _safe_call(cb, key, value, category)
+            by_category[category].append((key, value))
+
+        category_listeners = self._get_cat_listeners
+        for category, items in by_category.items():
+            for cb in tuple(category_listeners(category, ())):
+                for key, value in items:
+                    _safe_call(cb, key, value)
 
     def _notify_all(self):
-        for key, value in self._values.items():
-            cat = self._key_to_category.get(key, "unknown")
-            self._notify(key, value, cat)
+        category_of = self._get_cat
+        self._notify_batch([
+            (key, value, category_of(key, "unknown"))
+            for key, value in self._values.items()
+        ])
 
     def apply_to_config_module(self):
-        """Escreve os valores atuais de volta no módulo config importado."""
+        """
+        Escreve no módulo config importado as keys mudadas desde o último
+        apply (o resto já está lá) e refaz o CFG se alguma mudou.
+        """
         import config
-        with self._rw_lock:
-            for key, value in self._values.items():
-                if hasattr(config, key):
-                    try:
-                        setattr(config, key, _safe_deepcopy(value))
-                    except Exception:
-                        pass
+        with self._rw_lock.write:
+            keys = self._unapplied & self._sourced_keys
+            self._unapplied = set()
             self._dirty = False
+            if not keys:
+                return
+            values = self._values
+            for key in keys:
+                setattr(config, key, _safe_deepcopy(values[key]))
+            if hasattr(config, 'freeze'):
+                config.CFG = config.freeze()
 
     def save_to_file(self, filepath: str = None):
-        """Salva as configurações atuais no arquivo config.py."""
+        """
+        Salva as configurações atuais no arquivo config.py.
+        Escreve num .tmp ao lado e troca com os.replace: um crash no meio
+        deixa o config.py antigo intacto.
+        """
+        import os
         import sys
         from pathlib import Path
         
@@ -335,108 +655,54 @@ class ConfigManager:
             else:
                 filepath = str(Path(__file__).parent / "config.py")
 
-        with self._rw_lock:
+        with self._rw_lock.read:
             values = {}
             for k, v in self._values.items():
                 values[k] = _safe_deepcopy(v)
 
-        lines = []
-        lines.append('# config.py')
-        lines.append('"""')
-        lines.append('Configuração do Spotify RGB Sync')
-        lines.append('Auto-gerado pela GUI')
-        lines.append('"""')
-        lines.append('')
-        lines.append('import os')
-        lines.append('import sys')
-        lines.append('from pathlib import Path')
-        lines.append('')
-        lines.append('# Detecta diretório do executável')
-        lines.append("if getattr(sys, 'frozen', False):")
-        lines.append('    APP_DIR = Path(sys.executable).parent')
-        lines.append('else:')
-        lines.append('    APP_DIR = Path(__file__).parent')
-        lines.append('')
-        lines.append('ENV_PATH = APP_DIR / ".env"')
-        lines.append('')
-        lines.append('def load_env():')
-        lines.append('    if ENV_PATH.exists():')
-        lines.append("        with open(ENV_PATH, encoding='utf-8') as f:")
-        lines.append('            for line in f:')
-        lines.append('                line = line.strip()')
-        lines.append('                if line and not line.startswith("#") and "=" in line:')
-        lines.append('                    key, value = line.split("=", 1)')
-        lines.append('                    os.environ.setdefault(key.strip(), value.strip())')
-        lines.append('')
-        lines.append('load_env()')
-        lines.append('')
-
-        # Credenciais Spotify (sempre do .env)
-        lines.append('# ' + '═' * 78)
-        lines.append('# SPOTIFY API')
-        lines.append('# ' + '═' * 78)
-        lines.append('')
-        lines.append('SPOTIFY_CLIENT_ID     = os.environ.get("SPOTIPY_CLIENT_ID", "")')
-        lines.append('SPOTIFY_CLIENT_SECRET = os.environ.get("SPOTIPY_CLIENT_SECRET", "")')
-        lines.append('SPOTIFY_REDIRECT_URI  = os.environ.get("SPOTIPY_REDIRECT_URI", "http://localhost:8888/callback")')
-
-        # Gerar seções
-        section_order = [
-            ("SPOTIFY POLLING RATE", "spotify"),
-            ("OPENRGB", "openrgb"),
-            ("LED CONFIGURATION", "leds"),
-            ("COR PADRÃO", "general"),
-            ("BRILHO", "brightness"),
-            ("COLOR STRATEGY", "color_strategy"),
-            ("COLOR SHIFT", "color_shift"),
-            ("SENSIBILIDADE", "sensitivity"),
-            ("AGC E DINÂMICA", "dynamics"),
-            ("CHASE EFFECT", "chase"),
-            ("FREQUENCY EFFECT", "frequency"),
-            ("HYBRID EFFECT", "hybrid"),
-            ("BAND EFFECT", "bands"),
-            ("STANDBY MODE", "standby"),
-            ("QUANTIZED", "quantized"),
-        ]
-
-        written = set()
-
-        for section_name, category in section_order:
-            keys = self._categories.get(category, [])
-            unwritten = [k for k in keys if k not in written and k in values]
-            if not unwritten:
-                continue
-
-            lines.append('')
-            lines.append('# ' + '═' * 78)
-            lines.append(f'# {section_name}')
-            lines.append('# ' + '═' * 78)
-            lines.append('')
-
-            for k in unwritten:
-                v = values[k]
-                lines.append(f'{k} = {repr(v)}')
-                written.add(k)
-
-        # Keys restantes
-        remaining = [k for k in values if k not in written]
-        if remaining:
-            lines.append('')
-            lines.append('# ' + '═' * 78)
-            lines.append('# OUTROS')
-            lines.append('# ' + '═' * 78)
-            lines.append('')
-            for k in sorted(remaining):
-                lines.append(f'{k} = {repr(values[k])}')
-
-        lines.append('')
-
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(lines))
+        tmp_path = f'{filepath}.tmp'
+        try:
+            self._write_config_file(tmp_path, values)
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def _write_config_file(self, filepath: str, values: Dict[str, Any]):
+        """Gera o config.py com os valores dados (seções na ordem de _SECTION_ORDER)."""
+        rule = '# ' + '═' * 78
+
+        # Keys ainda não escritas; cada seção tira as suas
+        pending = set(values)
+
+        # Escrita direta em buffer de 64 KiB: nada do arquivo fica montado em memória
+        with open(filepath, 'w', encoding='utf-8', buffering=64 * 1024) as f:
+            write = f.write
+            write(_HEADER_TEMPLATE)
+
+            for section_name, category in _SECTION_ORDER:
+                section_keys = [k for k in self._categories.get(category, ()) if k in pending]
+                if not section_keys:
+                    continue
+
+                write(f'\n{rule}\n# {section_name}\n{rule}\n\n')
+                for k in section_keys:
+                    write(f'{k} = {values[k]!r}\n')
+                pending.difference_update(section_keys)
+
+            # Keys restantes
+            if pending:
+                write(f'\n{rule}\n# OUTROS\n{rule}\n\n')
+                f.writelines(f'{k} = {values[k]!r}\n' for k in sorted(pending))
+
+            # Snapshot congelado (CFG), igual ao final do config.py original
+            write(_FOOTER_TEMPLATE)
 
     def export_preset(self, name: str, filepath: str = None):
         """Exporta configuração atual como preset JSON."""
-        import json
         import sys
         from pathlib import Path
 
@@ -448,7 +714,20 @@ class ConfigManager:
             presets_dir.mkdir(exist_ok=True)
             filepath = str(presets_dir / f"{name}.json")
 
-        with self._rw_lock:
+        return self.export_preset_to_path(filepath, name)
+
+    def export_preset_to_path(self, filepath: str, name: str = None):
+        """
+        Exporta o preset direto no caminho dado (ex: vindo de um diálogo de
+        salvar). Sem nome, usa o nome do arquivo.
+        """
+        import time
+
+        if name is None:
+            import os
+            name = os.path.splitext(os.path.basename(filepath))[0]
+
+        with self._rw_lock.read:
             data = {
                 "name": name,
                 "timestamp": time.time(),
@@ -457,17 +736,18 @@ class ConfigManager:
             for k, v in self._values.items():
                 data["values"][k] = _safe_deepcopy(v)
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, default=str)
+        dumps, _ = _json()
+        with open(filepath, 'wb') as f:
+            f.write(dumps(data))
 
         return filepath
 
     def import_preset(self, filepath: str):
         """Importa preset JSON."""
-        import json
+        _, loads = _json()
 
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(filepath, 'rb') as f:
+            data = loads(f.read())
 
         values = data.get("values", {})
 
@@ -479,4 +759,12 @@ class ConfigManager:
                 values[k] = tuple(v)
 
         self.set_many(values)
-        self.apply_to_config_module()
\ No newline at end of file
+        self.apply_to_config_module()
+
+
+_INSTANCE = ConfigManager()
+
+
+def get_config_manager() -> ConfigManager:
+    """A instância única do ConfigManager (o mesmo que ConfigManager())."""
+    return _INSTANCE
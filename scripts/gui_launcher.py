@@ -7,18 +7,25 @@ Pode ser usado standalone ou integrado ao main.py existente.
 import sys
 import threading
 from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QObject, pyqtSignal
 
+from gui.styles import apply_theme
 from gui.tray_icon import TrayManager
 from config_manager import ConfigManager
 
 
-class AppBridge:
+class AppBridge(QObject):
     """
     Ponte entre a GUI e o core do sistema.
     Expõe métodos que a GUI usa pra obter status e enviar comandos.
+    statusChanged sai só quando o status muda de fato (vindo de qualquer
+    thread: a conexão com a GUI fica enfileirada pelo Qt).
     """
 
+    statusChanged = pyqtSignal(dict)
+
     def __init__(self):
+        super().__init__()
         self._status = {
             'spotify_connected': False,
             'audio_active': False,
@@ -40,6 +47,7 @@ class AppBridge:
         self._paused = False
         self._reactive_system = None
         self._lock = threading.Lock()
+        self._published = None  # último status emitido em statusChanged
 
     def set_reactive_system(self, system):
         """Conecta com o AudioReactiveSpotifyOnly do main.py."""
@@ -52,8 +60,7 @@ class AppBridge:
                 self._update_from_reactive()
             except Exception:
                 pass
-        with self._lock:
-            return dict(self._status)
+        return self._publish()
 
     def get_monitor_data(self) -> dict:
         """Retorna dados de monitoramento pra visualização ao vivo."""
@@ -143,9 +150,21 @@ class AppBridge:
 
     # ── Métodos pra atualização manual (caso o main.py prefira push) ──
 
+    def _publish(self) -> dict:
+        """Cópia do status atual; emite statusChanged se mudou desde a última."""
+        with self._lock:
+            status = dict(self._status)
+            changed = status != self._published
+            if changed:
+                self._published = status
+        if changed:
+            self.statusChanged.emit(dict(status))
+        return status
+
     def update_status(self, key: str, value):
         with self._lock:
             self._status[key] = value
+        self._publish()
 
     def update_bands(self, percussion: float, bass: float, melody: float):
         with self._lock:
@@ -174,6 +193,7 @@ def launch_gui(app_bridge: AppBridge = None):
         app = QApplication(sys.argv)
 
     app.setQuitOnLastWindowClosed(False)
+    apply_theme(app)
 
     if app_bridge is None:
         app_bridge = AppBridge()